@@ -0,0 +1,69 @@
+#Version 10/17/26
+#python benchmarks/bench_import_dtype_str.py
+"""
+Benchmark import_dtype=str conversion of raw (header=None) sheet data:
+original cell-by-cell DataFrame.map vs vectorized projtables.ConvertRawDfToStr
+on a large synthetic survey-like sheet (mixed numeric, text and blank cells)
+"""
+import os, sys, time
+import pandas as pd
+import numpy as np
+
+path_libs = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'libs')
+if not path_libs in sys.path: sys.path.insert(0, path_libs)
+from projtables import ConvertRawDfToStr
+
+def SyntheticRawSheet(n_rows, n_cols, seed=0):
+    """
+    Return df like pd.read_excel(header=None) output: float cols with NaN
+    blanks (integer-valued counts and unique measurements), text cols and
+    mixed text/number cols
+    """
+    rng = np.random.default_rng(seed)
+    dCols = {}
+    for i in range(n_cols):
+        blank = rng.random(n_rows) < 0.3
+        if i % 4 == 0:
+            vals = rng.integers(0, 500, n_rows).astype(float)
+            vals[rng.random(n_rows) < 0.2] += 0.25
+            vals[blank] = np.nan
+        elif i % 4 == 3:
+            vals = rng.normal(100., 15., n_rows)
+            vals[blank] = np.nan
+        elif i % 4 == 1:
+            vals = np.array([f'Answer {k}' for k in rng.integers(0, 50, n_rows)], dtype=object)
+            vals[blank] = np.nan
+        else:
+            vals = np.array([f'{k}%' if k % 2 else k for k in rng.integers(0, 100, n_rows)],
+                dtype=object)
+            vals[blank] = np.nan
+        dCols[i] = vals
+    return pd.DataFrame(dCols)
+
+def ConvertCellByCell(df):
+    """
+    Original Table.ReadExcelSht conversion
+    """
+    df = df.astype(object)
+    return df.map(lambda x: None if pd.isna(x) \
+        else str(int(x)) if isinstance(x, float) and x.is_integer() else str(x))
+
+def TimeFn(fn, df, n_repeat=3):
+    """
+    Return best wall time in seconds and result of fn(df)
+    """
+    lst_t = []
+    for _ in range(n_repeat):
+        t0 = time.perf_counter()
+        result = fn(df)
+        lst_t.append(time.perf_counter() - t0)
+    return min(lst_t), result
+
+if __name__ == '__main__':
+    for n_rows, n_cols in [(10_000, 12), (50_000, 24)]:
+        df = SyntheticRawSheet(n_rows, n_cols)
+        t_map, df_map = TimeFn(ConvertCellByCell, df)
+        t_vec, df_vec = TimeFn(ConvertRawDfToStr, df)
+        pd.testing.assert_frame_equal(df_vec, df_map)
+        print(f'{n_rows * n_cols:>10,} cells  map {t_map:7.3f}s  '
+            f'vectorized {t_vec:7.3f}s  speedup {t_map / t_vec:5.1f}x')
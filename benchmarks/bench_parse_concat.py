@@ -0,0 +1,71 @@
+#Version 10/17/26
+#python benchmarks/bench_parse_concat.py
+"""
+Benchmark Table.ParseRawData scaling with number of raw sheets: original
+concat-per-sheet loop (quadratic copying) vs collect-then-concat (linear)
+on synthetic survey-like RowMajorTbl sheets
+"""
+import os, sys, time
+import pandas as pd
+import numpy as np
+
+path_libs = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'libs')
+if not path_libs in sys.path: sys.path.insert(0, path_libs)
+import parsetables
+from projtables import Table
+
+dParseParams = {'is_unstructured':True,
+    'parse_type':'RowMajorTbl',
+    'flag_start_bound':'Answer Choices',
+    'flag_end_bound':'<blank>',
+    'icol_start_bound':0,
+    'icol_end_bound':0,
+    'iheader_rowoffset_from_flag':0,
+    'idata_rowoffset_from_flag':1,
+    'block_id_vars':('question_text', -2, 0)}
+
+def SyntheticSurveySheet(n_blocks=4, n_answers=100, seed=0):
+    """
+    Return df like pd.read_excel(header=None, import_dtype=str) output for a
+    survey export: question text, blank, header row and answer rows per block
+    """
+    rng = np.random.default_rng(seed)
+    lst_rows = []
+    for i in range(n_blocks):
+        lst_rows.append([f'Question {i}', None, None])
+        lst_rows.append([None, None, None])
+        lst_rows.append(['Answer Choices', 'Responses', 'Count'])
+        for j in range(n_answers):
+            lst_rows.append([f'Answer {j}', f'{rng.random():.2%}', str(rng.integers(100))])
+        lst_rows.append([None, None, None])
+    return pd.DataFrame(lst_rows, dtype=object)
+
+def ParseRawDataConcatEach(tbl):
+    """
+    Original Table.ParseRawData loop (concat onto tbl.df for each raw df)
+    """
+    for tbl.df_raw in tbl.lst_dfs:
+        parse = getattr(parsetables, tbl.dParseParams['parse_type'])(tbl)
+        parse.ParseDfRawProcedure()
+        tbl.df = pd.concat([tbl.df, parse.df], ignore_index=True)
+
+def TimeParse(fn, lst_dfs):
+    """
+    Return wall time in seconds and parsed df for fn applied to fresh Table
+    """
+    tbl = Table('Survey', dParseParams=dParseParams)
+    tbl.lst_dfs = lst_dfs
+    t0 = time.perf_counter()
+    fn(tbl)
+    return time.perf_counter() - t0, tbl.df
+
+if __name__ == '__main__':
+    df_sheet = SyntheticSurveySheet()
+    for n_sheets in [250, 500, 1000]:
+        lst_dfs = [df_sheet.copy() for _ in range(n_sheets)]
+        t_each, df_each = TimeParse(ParseRawDataConcatEach, lst_dfs)
+        t_once, df_once = TimeParse(Table.ParseRawData, lst_dfs)
+        pd.testing.assert_frame_equal(df_once, df_each)
+        print(f'{n_sheets:>5} sheets ({len(df_once):>6,} rows)  '
+            f'concat each {t_each:6.2f}s ({1000 * t_each / n_sheets:5.2f} ms/sheet)  '
+            f'concat once {t_once:6.2f}s ({1000 * t_once / n_sheets:5.2f} ms/sheet)')
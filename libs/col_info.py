@@ -1,25 +1,52 @@
-# Version 6/4/25
+# Version 10/17/26
+import os
 import pandas as pd
 import numpy as np
 import datetime as dt
 from datetime import datetime
+from collections import namedtuple
+from types import MappingProxyType
+from df_cache import DfCache, FingerprintFile, HashKey, HashDf
+from proc_stats import instrument
+
+# Compiled (immutable) per-table column plan built from tbl.dfColInfo (key is
+# id and content hash of the dfColInfo it was compiled from)
+ColumnPlan = namedtuple('ColumnPlan', ['rename_map', 'keep_cols', 'dtypes', 'idx',
+    'date_formats', 'key'])
+
+# data_type values converted with pd.to_datetime ('date' is compact datetime64)
+DATE_TYPES = ('dt.date', 'datetime', 'date')
+
+# data_type values converted by ColumnInfo.ConvertCol rather than .astype
+FUNC_TYPES = DATE_TYPES + ('auto_downcast',)
 """
 =============================================================================
 Class ColumnInfo
 =============================================================================
 """
 class ColumnInfo:
-    def __init__(self, files, IsInit=True, IsPrint=True):
+    def __init__(self, files, IsInit=True, IsPrint=True, IsCache=False):
         """
         Instance ColumnInfo (typically as cinfo); optionally initialize df
-        JDL 5/22/25; updated 5/28/25
+        JDL 5/22/25; updated 5/28/25; 10/17/26 add .dBytes, IsCache and
+        .dTblColInfo
         """
         self.IsPrint = IsPrint
+        self.IsCache = IsCache
+
+        # tbl_name: [bytes before, bytes after] data type conversion
+        self.dBytes = {}
 
-        # Import ColInfo from Excel file and set types of flag columns
+        # tbl_name: row positions in .df (and the .df and row count indexed)
+        self.dTblColInfo = {}
+        self.df_indexed = None
+        self.n_indexed = 0
+
+        # Import ColInfo from Excel file, set types of flag columns and index
         if IsInit:
             self.ImportColInfoDf(files)
             self.RecodeColInfoFlagCols()
+            self.SetTblColInfoIndex()
 
         self.filTbl = None
     """
@@ -29,10 +56,31 @@ class ColumnInfo:
     """
     def ImportColInfoDf(self, files):
         """
-        Import ColInfo.df from Excel file
-        JDL 5/28/25
+        Import ColInfo.df from Excel file (or its cached copy if .IsCache)
+        JDL 5/28/25; 10/17/26 add IsCache option
+        """
+        if self.IsCache:
+            self.df = self.ReadColInfoCached(files)
+        else:
+            self.df = pd.read_excel(files.pf_col_info, sheet_name='cols')
+
+    def ReadColInfoCached(self, files):
         """
-        self.df = pd.read_excel(files.pf_col_info, sheet_name='cols')
+        Return 'cols' sheet df from DfCache entry under files.path_cache if
+        its fingerprint (size, mtime) matches files.pf_col_info; else read
+        Excel and rewrite the entry
+        10/17/26
+        """
+        cache = DfCache(files.path_cache)
+        key = 'col_info_' + HashKey(os.path.abspath(files.pf_col_info))
+        fingerprint = list(FingerprintFile(files.pf_col_info))
+
+        if cache.IsEntry(key) and cache.ReadEntry(key)['meta'].get('fingerprint') == fingerprint:
+            return cache.ReadDfs(key)[0]
+
+        df = pd.read_excel(files.pf_col_info, sheet_name='cols')
+        cache.WriteDfs(key, [df], {'fingerprint':fingerprint})
+        return df
 
     def RecodeColInfoFlagCols(self):
         """
@@ -43,83 +91,187 @@ class ColumnInfo:
         for col in flag_cols:
             self.df[col] = self.df[col].fillna(False).astype(bool)
 
+    def SetTblColInfoIndex(self):
+        """
+        Index .df row positions by tbl_name once into .dTblColInfo so Table
+        lookups don't scan .df
+        10/17/26
+        """
+        self.dTblColInfo = self.df.groupby('tbl_name', sort=False).indices
+        self.df_indexed = self.df
+        self.n_indexed = len(self.df)
+
     """
     =========================================================================
     CleanupImportedDataProcedure
     =========================================================================
     """
+    @instrument(df_in='df', df_out='df', IsTblArg=True)
     def CleanupImportedDataProcedure(self, tbl):
         """
         Overall Procedure to subset/reorder imported columns and set data types 
-        JDL 5/28/25
+        JDL 5/28/25; 10/17/26 single rename+subset pass from tbl's ColumnPlan
         """
-        self.RenameColsRawData(tbl)
-        self.SetImportedKeepCols(tbl)
+        plan = self.SetTblColPlan(tbl)
+        tbl.df = tbl.df.rename(columns=plan.rename_map)[list(plan.keep_cols)]
         self.SetTblDataTypes(tbl)
 
+    @instrument(df_in='df', df_out='df', IsTblArg=True)
     def RenameColsRawData(self, tbl):
         """
         Rename raw data columns post-import
-        JDL 5/28/25
+        JDL 5/28/25; 10/17/26 use ColumnPlan
         """
-        # Filter for variables with raw/import name and replacement name both defined
-        fil = (~tbl.dfColInfo['cols_raw'].isna()) & (~tbl.dfColInfo['cols'].isna())
-
-        # Use dictionary to map old column names to new ones
-        keys, vals = tbl.dfColInfo.loc[fil, 'cols_raw'], tbl.dfColInfo.loc[fil, 'cols']
-        tbl.df.rename(columns=dict(zip(keys, vals)), inplace=True)
+        tbl.df.rename(columns=self.SetTblColPlan(tbl).rename_map, inplace=True)
 
+    @instrument(df_in='df', df_out='df', IsTblArg=True)
     def SetImportedKeepCols(self, tbl):
         """
         Subset imported columns for tbl
-        JDL 5/22/25; Updated 5/28/25
+        JDL 5/22/25; Updated 5/28/25; 10/17/26 use ColumnPlan
         """
-        # Filter to (non-calculated) keep columns
-        fil = self.SetFilterColInfoPopulated(tbl, ['cols_order', 'cols'], True)
-
-        # Make a sorted list of cols names and reset to those keep columns
-        lst = tbl.dfColInfo.loc[fil].sort_values('cols_order')['cols'].tolist()
-        tbl.df = tbl.df[lst]
+        tbl.df = tbl.df[list(self.SetTblColPlan(tbl).keep_cols)]
 
+    @instrument(df_in='df', df_out='df', IsTblArg=True)
     def SetTblDataTypes(self, tbl):
         """
         Set data types for tbl.df columns based on self.df data_type column
-        5/22/25; Updated 5/28/25
+        5/22/25; Updated 5/28/25; 10/17/26 use ColumnPlan; batched by default
+        (batch_dtypes=False for column-by-column); report_bytes_saved option
         """
-        # Filter to (non-calculated) keep columns with data_type specified
-        fil = self.SetFilterColInfoPopulated(tbl, ['data_type', 'cols'], True)
-
-        #fil = (~tbl.dfColInfo['data_type'].isna()) & (~tbl.dfColInfo['cols'].isna())
-        df_types = tbl.dfColInfo.loc[fil, ['cols', 'data_type']]
+        plan = self.SetTblColPlan(tbl)
+        IsReport = tbl.SetImportParam(False, 'report_bytes_saved')
+        if IsReport: bytes_before = tbl.df.memory_usage(deep=True).sum()
 
         # Convert column data to specified type
-        for col, data_type in zip(df_types['cols'], df_types['data_type']):
-            if data_type == 'dt.date':
-                tbl.df[col] = pd.to_datetime(tbl.df[col]).dt.date
-            elif data_type == 'datetime':
-                tbl.df[col] = pd.to_datetime(tbl.df[col])
+        if tbl.SetImportParam(True, 'batch_dtypes'):
+            self.SetTblDataTypesBatched(tbl)
+        else:
+            for col, data_type in plan.dtypes.items():
+                tbl.df[col] = self.ConvertCol(tbl.df[col], data_type, plan.date_formats.get(col))
+
+        if IsReport: self.AddBytesSaved(tbl, bytes_before)
 
-            # Use .astype directly on the data_type string
-            else:
-                tbl.df[col] = tbl.df[col].astype(data_type)
+    @instrument(df_in='df', df_out='df', IsTblArg=True)
+    def SetTblDataTypesBatched(self, tbl):
+        """
+        Set data types for tbl.df columns in one pass: single .astype(dict) of
+        .astype-able columns, then date/downcast columns assigned together
+        10/17/26
+        """
+        plan = self.SetTblColPlan(tbl)
+        dCasts = {col:t for col, t in plan.dtypes.items() if not t in FUNC_TYPES}
+        dFuncs = {col:self.ConvertCol(tbl.df[col], t, plan.date_formats.get(col))
+            for col, t in plan.dtypes.items() if t in FUNC_TYPES}
+
+        df = tbl.df.astype(dCasts) if dCasts else tbl.df
+        if dFuncs: df = df.assign(**dFuncs)
+        tbl.df = df
+
+    def AddBytesSaved(self, tbl, bytes_before):
+        """
+        Accumulate tbl.df bytes before/after data type conversion in .dBytes
+        (accumulates across chunks/files of the same table)
+        10/17/26
+        """
+        bytes_after = tbl.df.memory_usage(deep=True).sum()
+        lst = self.dBytes.setdefault(tbl.name, [0, 0])
+        lst[0] += int(bytes_before)
+        lst[1] += int(bytes_after)
+        if self.IsPrint:
+            print(f'{tbl.name}: {bytes_before - bytes_after:,} bytes saved by data types')
+
+    def BytesSavedReport(self):
+        """
+        Return df of bytes before/after data type conversion by tbl_name
+        10/17/26
+        """
+        df = pd.DataFrame.from_dict(self.dBytes, orient='index',
+            columns=['bytes_before', 'bytes_after'])
+        df.index.name = 'tbl_name'
+        df['bytes_saved'] = df['bytes_before'] - df['bytes_after']
+        df['pct_saved'] = 100 * df['bytes_saved'] / df['bytes_before']
+        return df
 
     """
     =========================================================================
     Other Methods
     =========================================================================
     """
+    def GetTblColInfo(self, tbl_name):
+        """
+        Return copy of tbl_name's rows of .df (current values) from row
+        positions in .dTblColInfo; re-index if .df was replaced or its row
+        count changed (call SetTblColInfoIndex after editing tbl_name values)
+        10/17/26
+        """
+        if not self.df_indexed is self.df or self.n_indexed != len(self.df):
+            self.SetTblColInfoIndex()
+        if tbl_name in self.dTblColInfo: return self.df.iloc[self.dTblColInfo[tbl_name]].copy()
+        return self.df.iloc[0:0].copy()
+
+    @instrument(IsTblArg=True)
     def SetTblIndexList(self, tbl):
         """
         Set tbl.idx to a list of index columns from tbl.dfColInfo
-        JDL 6/4/25
+        JDL 6/4/25; 10/17/26 use ColumnPlan
+        """
+        tbl.idx = list(self.SetTblColPlan(tbl).idx)
+
+    """
+    =========================================================================
+    ColumnPlan Procedure
+    =========================================================================
+    """
+    def SetTblColPlan(self, tbl):
+        """
+        Return tbl.col_plan; compile it from tbl.dfColInfo on first use or if
+        tbl.dfColInfo was replaced or edited in place since it was compiled
+        10/17/26
+        """
+        key = self.ColPlanKey(tbl)
+        if tbl.col_plan is None or tbl.col_plan.key != key:
+            tbl.col_plan = self.CompileColPlan(tbl, key)
+        return tbl.col_plan
+
+    def ColPlanKey(self, tbl):
+        """
+        Return (id, content hash) of tbl.dfColInfo to check tbl.col_plan is current
+        10/17/26
+        """
+        return (id(tbl.dfColInfo), HashDf(tbl.dfColInfo))
+
+    def CompileColPlan(self, tbl, key=None):
+        """
+        Return ColumnPlan of rename map, sorted keep columns, data types and
+        sorted index columns (keep, types and index omit calculated columns)
+        10/17/26
         """
-        # Filter for columnns with and index order specified
+        if key is None: key = self.ColPlanKey(tbl)
+        df = tbl.dfColInfo
+
+        # Variables with raw/import name and replacement name both defined
+        fil = df['cols_raw'].notna() & df['cols'].notna()
+        rename_map = dict(zip(df.loc[fil, 'cols_raw'], df.loc[fil, 'cols']))
+
+        # Keep and index columns sorted by their order columns
+        fil = self.SetFilterColInfoPopulated(tbl, ['cols_order', 'cols'], True)
+        keep_cols = df.loc[fil].sort_values('cols_order')['cols'].tolist()
         fil = self.SetFilterColInfoPopulated(tbl, ['idx_order', 'cols'], True)
+        idx = df.loc[fil].sort_values('idx_order')['cols'].tolist()
+
+        # Keep columns with data_type specified
+        fil = self.SetFilterColInfoPopulated(tbl, ['data_type', 'cols'], True)
+        dtypes = dict(zip(df.loc[fil, 'cols'], df.loc[fil, 'data_type']))
 
-        # Get the filtered list and sort by idx_order
-        lst_index_cols = tbl.dfColInfo.loc[fil].sort_values('idx_order')['cols'].tolist()
-        tbl.idx = lst_index_cols
+        # Optional explicit pd.to_datetime formats (e.g. '%Y-%m-%d')
+        date_formats = {}
+        if 'date_format' in df.columns:
+            fil = self.SetFilterColInfoPopulated(tbl, ['date_format', 'cols'], True)
+            date_formats = dict(zip(df.loc[fil, 'cols'], df.loc[fil, 'date_format']))
 
+        return ColumnPlan(MappingProxyType(rename_map), tuple(keep_cols),
+            MappingProxyType(dtypes), tuple(idx), MappingProxyType(date_formats), key)
 
     """
     =========================================================================
@@ -139,4 +291,43 @@ class ColumnInfo:
 
         return fil
 
+    def ConvertCol(self, ser, data_type, date_format=None):
+        """
+        Return ser converted to col_info data_type: DATE_TYPES via
+        pd.to_datetime, 'auto_downcast' to smallest safe numeric width, else
+        .astype on the data_type string (e.g. 'category', 'string[pyarrow]')
+        10/17/26
+        """
+        if data_type in DATE_TYPES: return self.ConvertDateCol(ser, data_type, date_format)
+        if data_type == 'auto_downcast': return self.DowncastNumericCol(ser)
+        return ser.astype(data_type)
+
+    def DowncastNumericCol(self, ser):
+        """
+        Return ser as numeric with the smallest width that keeps its values:
+        ints to smallest int; floats to float32 only if lossless
+        10/17/26
+        """
+        ser = pd.to_numeric(ser)
+        if ser.dtype.kind in 'iu': return pd.to_numeric(ser, downcast='integer')
+        if ser.dtype.kind != 'f' or ser.dtype.itemsize <= 4: return ser
+
+        # float32 only if all values (and NaN's) round trip
+        ser32 = ser.astype('float32')
+        vals, vals32 = ser.values, ser32.values.astype('float64')
+        IsLossless = ((vals == vals32) | (np.isnan(vals) & np.isnan(vals32))).all()
+        return ser32 if IsLossless else ser
+
+    def ConvertDateCol(self, ser, data_type, date_format=None):
+        """
+        Return ser converted to DATE_TYPES data_type: 'dt.date' (object
+        datetime.date values), 'datetime' (datetime64[ns]) or 'date' (compact
+        datetime64[s] normalized to day); optional explicit date_format
+        10/17/26
+        """
+        ser_dt = pd.to_datetime(ser, format=date_format)
+        if data_type == 'dt.date': return ser_dt.dt.date
+        if data_type == 'date': return ser_dt.dt.normalize().astype('datetime64[s]')
+        return ser_dt
+
 
@@ -0,0 +1,201 @@
+#Version 10/17/26
+import os, json, hashlib
+import pandas as pd
+
+# pyarrow is optional; without it, DfCache stores all df's as pickles
+try:
+    import pyarrow.feather as feather
+except ImportError:
+    feather = None
+
+"""
+================================================================================
+DfCache Class -- on-disk store of DataFrames for reuse across model runs
+Each entry is a key string with a list of df's saved as Arrow IPC (feather)
+files if they round-trip exactly through Arrow (else as pickles) and a .json
+file listing the entry's df files. Entries are evicted least-recently-used
+first when the cache folder exceeds max_mb
+================================================================================
+"""
+class DfCache():
+    """
+    Directory-based store of lists of DataFrames keyed by string
+    10/17/26
+    """
+    def __init__(self, path_cache, max_mb=None):
+
+        # Cache folder (with trailing os.sep) and optional size limit
+        self.path_cache = path_cache
+        self.max_mb = max_mb
+        os.makedirs(self.path_cache, exist_ok=True)
+
+    def IsEntry(self, key):
+        """
+        Return True if key has a complete entry (.json written last)
+        10/17/26
+        """
+        return os.path.isfile(self.path_cache + key + '.json')
+
+    def ReadDfs(self, key, IsMemoryMap=True):
+        """
+        Return key's list of df's (or None if not cached); touch entry's .json
+        so eviction is least-recently-used
+        10/17/26
+        """
+        if not self.IsEntry(key): return None
+        dEntry = self.ReadEntry(key)
+        lst_dfs = [ReadDfFile(self.path_cache + f, IsMemoryMap) for f in dEntry['files']]
+        os.utime(self.path_cache + key + '.json')
+        return lst_dfs
+
+    def ReadEntry(self, key):
+        """
+        Return dict from key's .json (df file names and optional metadata)
+        10/17/26
+        """
+        with open(self.path_cache + key + '.json') as f:
+            return json.load(f)
+
+    def WriteDfs(self, key, lst_dfs, dMeta=None):
+        """
+        Write key's list of df's and then its .json (marks entry complete)
+        10/17/26
+        """
+        # Remove any earlier entry for key so stale df files don't linger
+        self.DeleteEntry(key)
+
+        lst_files = []
+        for i, df in enumerate(lst_dfs):
+            pf = WriteDfFile(df, self.path_cache + f'{key}_{i}')
+            lst_files.append(os.path.basename(pf))
+
+        # Write .json to temp name and rename so readers never see partial entry
+        pf_json = self.path_cache + key + '.json'
+        with open(pf_json + '.tmp', 'w') as f:
+            json.dump({'files':lst_files, 'meta':dMeta or {}}, f)
+        os.replace(pf_json + '.tmp', pf_json)
+
+    def DeleteEntry(self, key):
+        """
+        Delete key's .json and df files if they exist
+        10/17/26
+        """
+        if not self.IsEntry(key): return
+        for f in self.ReadEntry(key)['files'] + [key + '.json']:
+            if os.path.isfile(self.path_cache + f): os.remove(self.path_cache + f)
+
+    def ListKeys(self, prefix=''):
+        """
+        Return list of entry keys (optionally starting with prefix) sorted
+        from least- to most-recently used
+        10/17/26
+        """
+        lst = [f[:-5] for f in os.listdir(self.path_cache)
+            if f.endswith('.json') and f.startswith(prefix)]
+        return sorted(lst, key=lambda k: os.path.getmtime(self.path_cache + k + '.json'))
+
+    def EntryBytes(self, key):
+        """
+        Return total bytes of key's df files and .json
+        10/17/26
+        """
+        lst = self.ReadEntry(key)['files'] + [key + '.json']
+        return sum(os.path.getsize(self.path_cache + f) for f in lst
+            if os.path.isfile(self.path_cache + f))
+
+    def EvictToMaxSize(self):
+        """
+        Delete least-recently-used entries until cache is within .max_mb
+        10/17/26
+        """
+        if self.max_mb is None: return
+        lst_keys = self.ListKeys()
+        dBytes = {key: self.EntryBytes(key) for key in lst_keys}
+        n_bytes = sum(dBytes.values())
+        for key in lst_keys:
+            if n_bytes <= self.max_mb * 1024**2: break
+            self.DeleteEntry(key)
+            n_bytes -= dBytes[key]
+
+"""
+================================================================================
+Utility functions for DfCache and other on-disk df stores
+================================================================================
+"""
+def WriteDfFile(df, pf_base):
+    """
+    Write df to pf_base + '.arrow' (Arrow IPC/feather) if it round-trips
+    exactly through Arrow; else to pf_base + '.pkl'. Return file written
+    10/17/26
+    """
+    if IsArrowRoundTrip(df):
+        pf = pf_base + '.arrow'
+        feather.write_feather(df, pf)
+    else:
+        pf = pf_base + '.pkl'
+        df.to_pickle(pf)
+    return pf
+
+def ReadDfFile(pf, IsMemoryMap=True):
+    """
+    Read df written by WriteDfFile (Arrow files optionally memory-mapped)
+    10/17/26
+    """
+    if pf.endswith('.arrow'):
+        return feather.read_table(pf, memory_map=IsMemoryMap).to_pandas()
+    return pd.read_pickle(pf)
+
+def IsArrowRoundTrip(df):
+    """
+    Return True if df can be written to Arrow and read back unchanged: default
+    RangeIndex, unique str column names, no pyarrow-backed 'string' columns
+    (read back as python storage) and object columns containing only str or
+    date values with None for blanks
+    10/17/26
+    """
+    if feather is None: return False
+    if not df.index.equals(pd.RangeIndex(len(df))) or df.index.name is not None:
+        return False
+    if not df.columns.is_unique or not all(isinstance(c, str) for c in df.columns):
+        return False
+
+    for dtype in df.dtypes:
+        if isinstance(dtype, pd.StringDtype) and dtype.storage != 'python': return False
+
+    # Arrow infers int/float/mixed types for object cols and reads NaN back as None
+    for col in df.columns[df.dtypes == object]:
+        ser = df[col]
+        if pd.api.types.infer_dtype(ser, skipna=True) not in ['string', 'date', 'empty']:
+            return False
+        if not all(val is None for val in ser[ser.isna()]): return False
+    return True
+
+def FingerprintFile(pf, IsHash=False):
+    """
+    Return tuple identifying file contents: (abs path, size, mtime) and
+    optionally a sha1 hash of the file's bytes
+    10/17/26
+    """
+    stat = os.stat(pf)
+    tup = (os.path.abspath(pf), stat.st_size, stat.st_mtime_ns)
+    if IsHash:
+        with open(pf, 'rb') as f:
+            tup += (hashlib.sha1(f.read()).hexdigest(),)
+    return tup
+
+def HashDf(df):
+    """
+    Return sha1 hex of df's contents: values and index (by row) plus column
+    names and dtypes (repr so e.g. 'string' storage and categories count)
+    10/17/26
+    """
+    h = hashlib.sha1(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    h.update(repr([(str(col), repr(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    return h.hexdigest()
+
+def HashKey(*args):
+    """
+    Return a filename-safe key (sha1 hex) from repr of args
+    10/17/26
+    """
+    return hashlib.sha1(repr(args).encode()).hexdigest()
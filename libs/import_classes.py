@@ -12,7 +12,7 @@ within-project use case as needed.
 def instance_model_classes(IsTest=False, IsParse=False, IsModel=False):
     """
     Instance customized [production-mode] classes for sales model Jupyter notebook
-    JDL 11/20/24; customized 3/4/25
+    JDL 11/20/24; customized 3/4/25; 10/17/26 IsCacheColInfo, IsLazy
     """
     #Tuples of libs aka *.py filename, module/class name) 
     mods_cls_names = [('libs.projfiles', 'Files'), 
@@ -28,9 +28,11 @@ def instance_model_classes(IsTest=False, IsParse=False, IsModel=False):
         IsTest=IsTest, subdir_tests='tests')
 
     #UseColInfo causes .__init__() to import col_info.xlsx making it available
-    #to Table objects
+    #to Table objects (IsCacheColInfo reuses a binary copy until xlsx changes;
+    #IsLazy defers each Table's import until its .df is first accessed)
     ProjectTables = class_objs['ProjectTables']
-    tbls = ProjectTables(files, UseTblInfo=False, UseColInfo=True, IsPrint=False)
+    tbls = ProjectTables(files, UseTblInfo=False, UseColInfo=True, IsPrint=False,
+        IsCacheColInfo=True, IsLazy=True)
 
     #Custom sales model
     SalesModel = class_objs['SalesModel']
@@ -1,6 +1,7 @@
-# Version 6/6/25
+# Version 10/17/26
 import pandas as pd
 import numpy as np
+from proc_stats import instrument
 
 class ParseColMajorTbl():
     """
@@ -14,8 +15,9 @@ class ParseColMajorTbl():
         # Raw DataFrame from input table
         self.df_raw = tbl.df_raw
 
-        # Output DataFrame
+        # Output DataFrame and list of parsed pieces to concatenate into it
         self.df = pd.DataFrame()
+        self.lst_dfs_parsed = []
 
         # Data start and end flags and their column indices
         self.flag_start = tbl.dParseParams['flag_start_bound']
@@ -28,6 +30,11 @@ class ParseColMajorTbl():
         self.data_start_row_offset = tbl.dParseParams['nrows_data_offset_from_flag']
         self.data_end_row_offset = tbl.dParseParams['nrows_data_end_offset_from_flag']
 
+        # Parse engine: 'iterative' (column by column) or 'vectorized'
+        self.parse_engine = 'iterative'
+        if 'parse_engine' in tbl.dParseParams:
+            self.parse_engine = tbl.dParseParams['parse_engine']
+
         # Data boundary indices and list of categories
         self.idx_header_row = None
         self.idx_data_start = None
@@ -37,15 +44,21 @@ class ParseColMajorTbl():
         # Iteration variables
         self.idx_col_cur = None
 
+    @instrument(df_in='df_raw', df_out='df')
     def ParseDfRawProcedure(self):
         """
         Procedure to parse blocks of columns in self.df_raw and set self.df
-        JDL 6/6/25
+        JDL 6/6/25; 10/17/26 add vectorized engine
         """
         self.FindDataBoundaries()
         self.SetDfCategories()
-        self.TransferAllCols()
+        if self.parse_engine == 'vectorized':
+            self.TransferAllColsVectorized()
+        else:
+            self.TransferAllCols()
+        self.ConcatParsedDfs()
     
+    @instrument()
     def FindDataBoundaries(self):
         """
         Set data boundary indices for parsing using parse params and flag columns.
@@ -64,6 +77,7 @@ class ParseColMajorTbl():
         self.idx_data_start = idx_start_flag + self.data_start_row_offset
         self.idx_data_end = idx_end_flag + self.data_end_row_offset
         
+    @instrument()
     def SetDfCategories(self):
         """
         Set list of categories from the first column between data start and end
@@ -72,6 +86,7 @@ class ParseColMajorTbl():
         """
         self.lstCategories = self.df_raw.iloc[self.idx_data_start:self.idx_data_end+1, 0].tolist()
 
+    @instrument(df_out='+lst_dfs_parsed')
     def TransferAllCols(self):
         """
         Iterate over data columns and transfer their data to self.df
@@ -84,9 +99,38 @@ class ParseColMajorTbl():
             # Read and write the column data
             self.ReadWriteColData()
 
+    @instrument(df_out='+lst_dfs_parsed')
+    def TransferAllColsVectorized(self):
+        """
+        Transfer all data columns to self.lst_dfs_parsed as one df (same output
+        as TransferAllCols for cols with consistent value types): slice the
+        data rectangle once up to the first blank header and build col_header,
+        category and value with NumPy repeat/tile/ravel
+        10/17/26
+        """
+        # Number of data cols is up to first blank header cell
+        headers = self.df_raw.iloc[self.idx_header_row, 1:]
+        n_cols = len(headers) if headers.notna().all() else int(headers.isna().argmax())
+        if n_cols == 0: return
+
+        # Data rectangle (category rows x data cols) read column by column
+        row_slice = slice(self.idx_data_start, self.idx_data_end + 1)
+        values = self.df_raw.iloc[row_slice, 1:n_cols + 1].to_numpy()
+        n_cats = len(self.lstCategories)
+
+        # Infer dtypes as in ReadWriteColData (headers and categories before repeat)
+        headers = pd.Series(headers.values[:n_cols].tolist())
+        categories = pd.Series(self.lstCategories)
+        df_cols = pd.DataFrame({
+            'col_header': headers.repeat(n_cats).values,
+            'category': categories.iloc[np.tile(np.arange(n_cats), n_cols)].values,
+            'value': pd.Series(values.ravel(order='F')).infer_objects().values})
+        self.lst_dfs_parsed.append(df_cols)
+
     def ReadWriteColData(self):
         """
-        Add one date column's data to self.df using self.idx_col_cur.
+        Add one date column's data to self.lst_dfs_parsed using self.idx_col_cur.
+        10/17/26 append to list instead of concat to self.df
         """
         # Read the date from the header row for this column
         header_val = self.df_raw.iloc[self.idx_header_row, self.idx_col_cur]
@@ -99,8 +143,18 @@ class ParseColMajorTbl():
         df_col = pd.DataFrame({'col_header': [header_val] * len(self.lstCategories),
             'category': self.lstCategories, 'value': n_orders})
 
-        # Append column's data to self.df
-        self.df = pd.concat([self.df, df_col], ignore_index=True)
+        # Append column's data to list for concatenation into self.df
+        self.lst_dfs_parsed.append(df_col)
+
+    @instrument(df_in='lst_dfs_parsed', df_out='df')
+    def ConcatParsedDfs(self):
+        """
+        Concatenate parsed pieces into self.df in one step and reset the list
+        10/17/26
+        """
+        if len(self.lst_dfs_parsed) == 0: return
+        self.df = pd.concat([self.df] + self.lst_dfs_parsed, ignore_index=True)
+        self.lst_dfs_parsed = []
 
 """
 ================================================================================
@@ -129,22 +183,35 @@ class InterleavedColBlocksTbl():
         # n columns per block
         self.n_cols_block = tbl.dParseParams['n_cols_block']
 
+        # Parse engine: 'iterative' (column by column) or 'vectorized'
+        self.parse_engine = 'iterative'
+        if 'parse_engine' in tbl.dParseParams:
+            self.parse_engine = tbl.dParseParams['parse_engine']
+
+        # Output DataFrame and list of parsed pieces to concatenate into it
         self.df = pd.DataFrame()
+        self.lst_dfs_parsed = []
 
         # Iteration variables
         self.idx_col_block_cur = None
         self.block_name_cur = None
         self.idx_col_cur = None
 
+    @instrument(df_in='df_raw', df_out='df')
     def ParseDfRawProcedure(self):
         """
         Procedure to parse interleaved blocks of columns
-        JDL 3/17/25; Name updated 5/30/25
+        JDL 3/17/25; Name updated 5/30/25; 10/17/26 add vectorized engine
         """
         self.SetDfMetadata()
         self.DeleteTrailingRows()
-        self.TransferAllBlocks()
+        if self.parse_engine == 'vectorized':
+            self.TransferAllBlocksVectorized()
+        else:
+            self.TransferAllBlocks()
+        self.ConcatParsedDfs()
     
+    @instrument()
     def SetDfMetadata(self):
         """
         Set .df_metadata as a subset of .df_raw 
@@ -157,19 +224,20 @@ class InterleavedColBlocksTbl():
         self.df_metadata.columns = self.df_raw.iloc[1, self.idx_start:col_last]
         self.df_metadata.columns.name = None
 
+    @instrument(df_in='df_raw', df_out='df_raw')
     def DeleteTrailingRows(self):
         """
         Delete trailing rows with blank metadata
-        JDL 3/17/25
+        JDL 3/17/25; 10/17/26 vectorize row check
         """
         # Find the index of last non-null metadata row
-        idx_last = self.df_metadata.apply(lambda row: \
-            not row.isnull().all(), axis=1).cumsum().idxmax()
+        idx_last = self.df_metadata.notna().any(axis=1).cumsum().idxmax()
 
         # Delete trailing rows from .df_metadata and corresponding .df_raw rows
         self.df_metadata = self.df_metadata.iloc[:idx_last + 1]
         self.df_raw = self.df_raw.iloc[:idx_last + 3]
 
+    @instrument(df_out='+lst_dfs_parsed')
     def TransferAllBlocks(self):
         """
         Transfer all blocks of columns to .df
@@ -184,6 +252,42 @@ class InterleavedColBlocksTbl():
             self.ReadWriteBlock()
             self.idx_col_cur += 1
 
+    @instrument(df_out='+lst_dfs_parsed')
+    def TransferAllBlocksVectorized(self):
+        """
+        Transfer all blocks of columns to .lst_dfs_parsed as one long-format df
+        (same output as TransferAllBlocks): tile .df_metadata once per data
+        column, repeat block and variable names and ravel the value block
+        10/17/26
+        """
+        idx_col_first = self.idx_start + self.n_cols_metadata
+        n_rows = len(self.df_metadata)
+
+        # Blocks start every n_cols_block cols until a blank block name
+        ser_names = self.df_raw.iloc[0, idx_col_first::self.n_cols_block]
+        n_blocks = len(ser_names) if ser_names.notna().all() else int(ser_names.isna().argmax())
+        if n_blocks == 0: return
+        idx_col_last = idx_col_first + n_blocks * self.n_cols_block
+        if idx_col_last > len(self.df_raw.columns):
+            raise IndexError(f'Last block at col {idx_col_last - self.n_cols_block} is incomplete')
+
+        # Tile metadata rows once per data column
+        n_cols_data = n_blocks * self.n_cols_block
+        df = self.df_metadata.iloc[np.tile(np.arange(n_rows), n_cols_data)]
+        df = df.reset_index(drop=True)
+
+        # Repeat block names and var names (dtypes inferred as for scalar assignment)
+        block_names = pd.Series(ser_names.values[:n_blocks], dtype=object).infer_objects()
+        var_names = self.df_raw.iloc[1, idx_col_first:idx_col_last]
+        var_names = pd.Series(var_names.values, dtype=object).infer_objects()
+        df['block_name'] = block_names.repeat(self.n_cols_block * n_rows).values
+        df['var_name'] = var_names.repeat(n_rows).values
+
+        # Values column by column (Fortran order ravel of data rows x cols)
+        values = self.df_raw.iloc[2:, idx_col_first:idx_col_last].to_numpy()
+        df['values'] = values.ravel(order='F')
+        self.lst_dfs_parsed.append(df)
+
     def ReadWriteBlock(self):
         """
         Read and write a block of columns to .df
@@ -200,21 +304,30 @@ class InterleavedColBlocksTbl():
 
     def ReadWriteColData(self):
         """
-        Transfer one column's data to .df by reading from a column block
-        JDL 3/17/25
+        Transfer one column's data to .lst_dfs_parsed by reading from a column block
+        JDL 3/17/25; 10/17/26 append to list instead of concat to .df
         """
-        # Append .df_metadata to .df and write block name to new rows
-        self.df = pd.concat([self.df, self.df_metadata], ignore_index=True)
-        n_rows_new = len(self.df_metadata)
-        self.df.loc[self.df.index[-n_rows_new:], 'block_name'] = self.block_name_cur
+        # Copy .df_metadata and write block name
+        df_col = self.df_metadata.copy()
+        df_col['block_name'] = self.block_name_cur
 
         # Write the variable name (.df_raw row index 1)
-        var_name = self.df_raw.iloc[1, self.idx_col_cur]
-        self.df.loc[self.df.index[-n_rows_new:], 'var_name'] = var_name
+        df_col['var_name'] = self.df_raw.iloc[1, self.idx_col_cur]
 
         # write values (as array to avoid index conflict between values and .df
         values = self.df_raw.iloc[2:, self.idx_col_cur].reset_index(drop=True)
-        self.df.loc[self.df.index[-n_rows_new:], 'values'] = values.values
+        df_col['values'] = values.values
+        self.lst_dfs_parsed.append(df_col)
+
+    @instrument(df_in='lst_dfs_parsed', df_out='df')
+    def ConcatParsedDfs(self):
+        """
+        Concatenate parsed pieces into .df in one step and reset the list
+        10/17/26
+        """
+        if len(self.lst_dfs_parsed) == 0: return
+        self.df = pd.concat([self.df] + self.lst_dfs_parsed, ignore_index=True)
+        self.lst_dfs_parsed = []
 """
 ================================================================================
 RowMajorTbl Class - parsing files containing multiple row major blocks
@@ -240,8 +353,9 @@ class RowMajorTbl():
         self.lst_block_ids = tbl.dParseParams.get('block_id_vars', [])
         if isinstance(self.lst_block_ids, tuple): self.lst_block_ids = [self.lst_block_ids]
 
-        # Output DataFrame
+        # Output DataFrame and list of parsed blocks to concatenate into it
         self.df = pd.DataFrame()
+        self.lst_dfs_parsed = []
 
         #Start, header, end, first data row indices for current block in loop
         self.idx_start_current = None
@@ -252,27 +366,53 @@ class RowMajorTbl():
         #Current block's columns and parsed data
         self.cols_df_block = []
         self.df_block = pd.DataFrame()
+
+        # Parse engine: 'iterative' (block by block) or 'vectorized'
+        self.parse_engine = tbl.dParseParams.get('parse_engine', 'iterative')
+
+        # Header, first data and end bound row indices for all blocks (vectorized)
+        self.idx_header_rows = None
+        self.idx_start_data_rows = None
+        self.idx_end_bounds = None
     """
     ================================================================================
     """
+    @instrument(df_in='df_raw', df_out='df')
     def ParseDfRawProcedure(self):
         """
         Procedure to iteratively parse row major blocks into self.df
-        JDL 9/26/24; Refactored 5/30/25
+        JDL 9/26/24; Refactored 5/30/25; 10/17/26 add vectorized engine
         """
-        # Append blank row at end of .df_raw (to ensure find last <blank> flag)
-        self.AddTrailingBlankRow()
+        if self.parse_engine == 'vectorized':
+            self.ParseAllBlocksVectorized()
+        else:
 
-        #Create list of row indices with start bound flag
-        self.SetStartBoundIndices()
+            # Append blank row at end of .df_raw (to ensure find last <blank> flag)
+            self.AddTrailingBlankRow()
+
+            #Create list of row indices with start bound flag
+            self.SetStartBoundIndices()
 
-        #Iteratively read blocks 
-        for i in self.start_bound_indices:
-            self.idx_start_current = i
-            self.ParseBlockProcedure()
+            #Iteratively read blocks 
+            for i in self.start_bound_indices:
+                self.idx_start_current = i
+                self.ParseBlockProcedure()
 
+        self.ConcatParsedDfs()
         self.df = self.df.reset_index(drop=True)
 
+    @instrument(df_in='df_raw', df_out='+lst_dfs_parsed')
+    def ParseAllBlocksVectorized(self):
+        """
+        Procedure to parse all row major blocks at once (same output as
+        iterating ParseBlockProcedure; .df_raw is not copied or modified)
+        10/17/26
+        """
+        self.SetStartBoundIndices()
+        self.SetBlockBoundsVectorized()
+        self.TransferAllBlocksVectorized()
+
+    @instrument()
     def AddTrailingBlankRow(self):
         """
         Add a trailing blank row to self.df_raw (to ensure last <blank> flag to
@@ -282,6 +422,7 @@ class RowMajorTbl():
         blank_row = pd.Series([np.nan] * len(self.df_raw.columns), index=self.df_raw.columns)
         self.df_raw = pd.concat([self.df_raw, pd.DataFrame([blank_row])], ignore_index=True)
 
+    @instrument()
     def SetStartBoundIndices(self):
         """
         Populate list of row indices whereflag_start_bound is found
@@ -293,10 +434,118 @@ class RowMajorTbl():
         fil = self.df_raw.iloc[:, icol] == flag
         self.start_bound_indices = self.df_raw[fil].index.tolist()
 
+    @instrument()
+    def SetBlockBoundsVectorized(self):
+        """
+        Set arrays of header, first data and end bound row indices for all
+        blocks with one searchsorted over flag_end_bound rows. A virtual
+        trailing blank row ends the last <blank>-terminated block; if a string
+        flag isn't found, the block is empty (as in FindFlagEndBound)
+        10/17/26
+        """
+        flag = self.tbl.dParseParams['flag_end_bound']
+        icol = self.tbl.dParseParams['icol_end_bound']
+        iheader_offset = self.tbl.dParseParams['iheader_rowoffset_from_flag']
+        ioffset = self.tbl.dParseParams['idata_rowoffset_from_flag']
+
+        idx_starts = np.array(self.start_bound_indices, dtype=int)
+        self.idx_header_rows = idx_starts + iheader_offset
+        self.idx_start_data_rows = idx_starts + ioffset
+
+        # Find first end flag row at or below each block's first data row
+        if flag == '<blank>':
+            idx_flags = np.flatnonzero(self.df_raw.iloc[:, icol].isnull().to_numpy())
+            idx_flags = np.append(idx_flags, len(self.df_raw))
+            self.idx_end_bounds = idx_flags[np.searchsorted(idx_flags, self.idx_start_data_rows)]
+        else:
+            idx_flags = np.flatnonzero(self.df_raw.iloc[:, icol].eq(flag).to_numpy())
+            i = np.searchsorted(idx_flags, self.idx_start_data_rows)
+            idx_found = np.append(idx_flags, 0)[i]
+            self.idx_end_bounds = np.where(i < len(idx_flags), idx_found, self.idx_start_data_rows)
+
+    @instrument(df_out='+lst_dfs_parsed')
+    def TransferAllBlocksVectorized(self):
+        """
+        Append all blocks' data rows to self.lst_dfs_parsed as one df. Per block,
+        drop cols with blank header or all-blank data; blocks with the same
+        columns are gathered from .df_raw with one .iloc and block order is
+        restored after concatenating
+        10/17/26
+        """
+        n_blocks = len(self.idx_start_data_rows)
+        if n_blocks == 0: return
+
+        # Row indices of all blocks' data rows and block index of each row
+        lengths = self.idx_end_bounds - self.idx_start_data_rows
+        idx_blocks = np.repeat(np.arange(n_blocks), lengths)
+        idx_rows = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths) \
+            + np.repeat(self.idx_start_data_rows, lengths)
+
+        # Keep cols with header and non-blank data (count from cumsum of notna)
+        headers = self.df_raw.iloc[self.idx_header_rows].to_numpy()
+        n_notna = np.zeros((len(self.df_raw) + 1, len(self.df_raw.columns)), dtype=np.int64)
+        np.cumsum(self.df_raw.notna().to_numpy(), axis=0, out=n_notna[1:])
+        keep = ~pd.isna(headers) & \
+            (n_notna[self.idx_end_bounds] > n_notna[self.idx_start_data_rows])
+
+        # Group blocks by kept col positions and names (in order of first appearance)
+        dGroups = {}
+        for i in range(n_blocks):
+            key = (tuple(np.flatnonzero(keep[i])), tuple(headers[i, keep[i]]))
+            dGroups.setdefault(key, []).append(i)
+        idx_group = np.empty(n_blocks, dtype=int)
+        for i_group, lst in enumerate(dGroups.values()): idx_group[lst] = i_group
+
+        # Sort rows by group and gather each group's rows and cols at once
+        order = np.argsort(idx_group[idx_blocks], kind='stable')
+        idx_rows, idx_blocks = idx_rows[order], idx_blocks[order]
+        bounds = np.searchsorted(idx_group[idx_blocks], np.arange(len(dGroups) + 1))
+        dBlockIDs = self.BlockIDValuesVectorized()
+        lst_dfs = []
+        for i_group, lst in enumerate(dGroups.values()):
+            i, rows = lst[0], slice(bounds[i_group], bounds[i_group + 1])
+            df = self.df_raw.iloc[idx_rows[rows], keep[i]]
+            df = df.set_axis(pd.Index(headers[i])[keep[i]], axis=1)
+
+            # Add block ID cols (gathered by row's block) and move them first
+            for name, values in dBlockIDs.items():
+                df[name] = values[idx_blocks[rows]]
+            if 'block_id_vars' in self.tbl.dParseParams:
+                blockid_cols = list(dBlockIDs.keys())
+                df = df[blockid_cols + [col for col in df.columns if col not in blockid_cols]]
+            lst_dfs.append(df)
+
+        # Restore rows to block order
+        df = pd.concat(lst_dfs, axis=0)
+        self.lst_dfs_parsed.append(df.iloc[np.argsort(order, kind='stable')])
+
+    def BlockIDValuesVectorized(self):
+        """
+        Return dict of block_id name and array of its value for each block
+        (row offset from first data row; virtual trailing blank row as in
+        AddTrailingBlankRow); dtype as from concatenating per-block scalar
+        columns (e.g. None and trailing np.nan stay object, not float64)
+        10/17/26
+        """
+        dBlockIDs = {}
+        for tup_block_id in self.lst_block_ids:
+            name, row_offset, idx_col = tup_block_id[0], tup_block_id[1], tup_block_id[2]
+            values = np.append(self.df_raw.iloc[:, idx_col].to_numpy(dtype=object), np.nan)
+            values = values[self.idx_start_data_rows + row_offset].tolist()
+
+            # Common dtype of one scalar column per value type (as iterative engine)
+            ser = pd.Series(values, dtype=object)
+            if len(values) > 0:
+                reps = {type(value): value for value in values}.values()
+                ser = ser.astype(pd.concat([pd.Series([value]) for value in reps]).dtype)
+            dBlockIDs[name] = ser.array
+        return dBlockIDs
+
+    @instrument(df_out='+lst_dfs_parsed')
     def ParseBlockProcedure(self):
         """
-        Parse the table and set self.df resulting DataFrame
-        JDL 9/25/24; Modified 5/30/25
+        Parse the current block and append it to self.lst_dfs_parsed
+        JDL 9/25/24; Modified 5/30/25; 10/17/26 append instead of concat
         """
         self.FindFlagEndBound()
         self.ReadHeader()
@@ -306,10 +555,20 @@ class RowMajorTbl():
         if 'block_id_vars' in self.tbl.dParseParams: 
             self.df_block = RowMajorBlockID(self).ExtractBlockIDs
 
-        #Concatenate into tbl.df and re-initialize df_block
-        self.df = pd.concat([self.df, self.df_block], axis=0)
+        #Append to list of parsed blocks and re-initialize df_block
+        self.lst_dfs_parsed.append(self.df_block)
         self.df_block = pd.DataFrame()
 
+    @instrument(df_in='lst_dfs_parsed', df_out='df')
+    def ConcatParsedDfs(self):
+        """
+        Concatenate parsed blocks into self.df in one step and reset the list
+        10/17/26
+        """
+        if len(self.lst_dfs_parsed) == 0: return
+        self.df = pd.concat([self.df] + self.lst_dfs_parsed, axis=0)
+        self.lst_dfs_parsed = []
+
     def FindFlagEndBound(self):
         """
         Find index of flag_end_bound
@@ -0,0 +1,304 @@
+# Version 10/17/26
+import os, time, inspect, threading, tracemalloc
+from collections import deque
+from functools import wraps
+import pandas as pd
+import numpy as np
+
+# Collector of the innermost recorded call on each thread (recorded calls on
+# parse instances inherit it from the Table call that made them)
+LOCAL = threading.local()
+
+# Running collectors using tracemalloc and whether ProcStats started it
+TRACE_LOCK = threading.Lock()
+N_TRACE_USERS = 0
+IsTraceOwned = False
+
+"""
+================================================================================
+ProcStats Class -- opt-in timing and memory records for procedures and the
+single-action methods they call (methods decorated with @instrument)
+================================================================================
+"""
+class ProcStats():
+    """
+    Collector of per-call records: wall and CPU time, tracemalloc peak and
+    rows/bytes in and out by table, file and sheet. Records calls of Tables
+    whose .proc_stats it is (Tables of ProjectTables(IsInstrument=True))
+    while started
+    10/17/26
+    """
+    def __init__(self, IsTraceMem=True, IsDeepBytes=False, max_records=100_000):
+
+        # Record tracemalloc peaks (slows Python allocations while tracing);
+        # measure object column contents (deep) vs only their pointers
+        self.IsTraceMem = IsTraceMem
+        self.IsDeepBytes = IsDeepBytes
+        self.IsActive = False
+
+        # Records (dicts) in call completion order (oldest dropped beyond
+        # max_records; None for no limit); per-thread call stacks
+        self.records = deque(maxlen=max_records)
+        self.local = threading.local()
+
+        # Threads with open calls and count of calls opened while another
+        # thread had one open (tracemalloc peaks are process-wide, so calls
+        # that overlap other threads' calls get no peak_bytes)
+        self.lock = threading.Lock()
+        self.n_threads_open = 0
+        self.n_overlaps = 0
+
+    def Start(self):
+        """
+        Start recording (and start tracemalloc if not tracing)
+        10/17/26
+        """
+        global N_TRACE_USERS, IsTraceOwned
+        if self.IsActive: return self
+        if self.IsTraceMem:
+            with TRACE_LOCK:
+                if not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    IsTraceOwned = True
+                N_TRACE_USERS += 1
+        self.IsActive = True
+        return self
+
+    def Stop(self):
+        """
+        Stop recording (records are kept); stop tracemalloc if ProcStats
+        started it and no other running collector uses it
+        10/17/26
+        """
+        global N_TRACE_USERS, IsTraceOwned
+        if not self.IsActive: return
+        self.IsActive = False
+        if not self.IsTraceMem: return
+        with TRACE_LOCK:
+            N_TRACE_USERS -= 1
+            if N_TRACE_USERS == 0 and IsTraceOwned:
+                tracemalloc.stop()
+                IsTraceOwned = False
+
+    @property
+    def df(self):
+        """
+        DataFrame of call records (columns in COLS_RECORD order)
+        10/17/26
+        """
+        return pd.DataFrame(list(self.records), columns=COLS_RECORD)
+
+    def SummaryDf(self):
+        """
+        Return records totaled by procedure/method and table, sorted by wall time
+        10/17/26
+        """
+        df = self.df
+        dAgg = {'n_calls':('wall_s', 'size'), 'wall_s':('wall_s', 'sum'),
+            'cpu_s':('cpu_s', 'sum'), 'peak_bytes':('peak_bytes', 'max'),
+            'rows_in':('rows_in', 'sum'), 'rows_out':('rows_out', 'sum')}
+        df = df.groupby(['proc', 'tbl'], dropna=False, sort=False).agg(**dAgg)
+        return df.sort_values('wall_s', ascending=False)
+
+    def CallStack(self):
+        """
+        Return current thread's stack of open call frames
+        10/17/26
+        """
+        if not hasattr(self.local, 'stack'): self.local.stack = []
+        return self.local.stack
+
+    def RunCall(self, fn, obj, args, kwargs, df_in, df_out):
+        """
+        Call fn and append its record: data object obj (Table, parse instance
+        or Table arg of ColumnInfo methods) is measured before/after the call;
+        table/file/sheet come from the Table or are inherited from the caller
+        10/17/26
+        """
+        stack = self.CallStack()
+        parent = stack[-1] if stack else None
+        frame = self.CallContext(obj, parent)
+        rows_in, bytes_in = self.Measure(obj, df_in, args)
+        dLens = self.ListLens(obj, df_out)
+
+        # No peak if another thread has a call open at start (-1) or opens one
+        if parent is None: self.SetThreadOpen(True)
+        n_overlaps = -1 if self.n_threads_open > 1 else self.n_overlaps
+
+        # Fold tracemalloc peak so far into caller's frame, then reset for this call
+        mem_start = 0
+        if self.IsTraceMem and tracemalloc.is_tracing():
+            mem_start, peak = tracemalloc.get_traced_memory()
+            if parent is not None: parent['peak'] = max(parent['peak'], peak)
+            tracemalloc.reset_peak()
+
+        stack.append(frame)
+        stats_caller, LOCAL.stats = getattr(LOCAL, 'stats', None), self
+        t0, cpu0 = time.perf_counter(), time.thread_time()
+        result = None
+        try:
+            result = fn(*args, **kwargs)
+            return result
+        finally:
+            wall, cpu = time.perf_counter() - t0, time.thread_time() - cpu0
+            LOCAL.stats = stats_caller
+            stack.pop()
+            peak_bytes = None
+            if self.IsTraceMem and tracemalloc.is_tracing():
+                frame['peak'] = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                if parent is not None: parent['peak'] = max(parent['peak'], frame['peak'])
+                peak_bytes = max(frame['peak'] - mem_start, 0)
+            if self.n_overlaps != n_overlaps or self.n_threads_open > 1: peak_bytes = None
+            if parent is None: self.SetThreadOpen(False)
+            rows_out, bytes_out = self.Measure(obj, df_out, args, result, dLens)
+            self.records.append({'proc':fn.__qualname__, 'tbl':frame['tbl'],
+                'file':frame['file'], 'sheet':frame['sheet'], 'depth':len(stack),
+                'wall_s':wall, 'cpu_s':cpu, 'peak_bytes':peak_bytes,
+                'rows_in':rows_in, 'bytes_in':bytes_in, 'rows_out':rows_out,
+                'bytes_out':bytes_out, 'thread':threading.current_thread().name})
+
+    def SetThreadOpen(self, IsOpen):
+        """
+        Count current thread as having (or no longer having) an open call;
+        count overlap if another thread has one open
+        10/17/26
+        """
+        with self.lock:
+            self.n_threads_open += 1 if IsOpen else -1
+            if IsOpen and self.n_threads_open > 1: self.n_overlaps += 1
+
+    def CallContext(self, obj, parent):
+        """
+        Return new call frame with table name, file and sheet: from obj if it
+        is a Table (its .pf and .sht are set while importing) else from parent
+        frame
+        10/17/26
+        """
+        frame = {'tbl':None, 'file':None, 'sheet':None, 'peak':0}
+        if parent is not None: frame.update({k: parent[k] for k in ['tbl', 'file', 'sheet']})
+        if not hasattr(obj, 'dImportParams'): return frame
+
+        # Table: inherit file/sheet only from caller working on same table
+        if frame['tbl'] != obj.name: frame.update({'file':None, 'sheet':None})
+        frame['tbl'] = obj.name
+        if isinstance(obj.pf, str): frame['file'] = os.path.basename(obj.pf)
+        if not obj.sht is None: frame['sheet'] = obj.sht
+        return frame
+
+    def Measure(self, obj, names, args, result=None, dLens=None):
+        """
+        Return (rows, bytes) summed over names: obj attributes (backing '_'
+        attribute read if present so lazy/spilled Tables aren't loaded),
+        '+name' for df's appended to a list attribute during the call (dLens
+        has its length before the call), 'pf' for file size and 'arg' and
+        'return' for df arg and return value. None's if names is empty (rows
+        None if only 'pf')
+        10/17/26
+        """
+        if not names: return None, None
+        rows, n_bytes = None, 0
+        for name in names:
+            if name == 'pf':
+                pf = getattr(obj, 'pf', None)
+                if isinstance(pf, str) and os.path.isfile(pf): n_bytes += os.path.getsize(pf)
+                continue
+            if name == 'arg':
+                val = [x for x in args if isinstance(x, pd.DataFrame)][:1]
+            elif name == 'return':
+                val = result
+            else:
+                val = self.GetAttr(obj, name.lstrip('+'))
+                if name.startswith('+') and isinstance(val, list):
+                    val = val[(dLens or {}).get(name[1:], 0):]
+            r, b = self.DfsRowsBytes(val)
+            rows, n_bytes = (rows or 0) + r, n_bytes + b
+        return rows, n_bytes
+
+    def ListLens(self, obj, names):
+        """
+        Return dict of list lengths for '+name' list attributes in names
+        10/17/26
+        """
+        dLens = {}
+        for name in names:
+            val = self.GetAttr(obj, name[1:]) if name.startswith('+') else None
+            if isinstance(val, list): dLens[name[1:]] = len(val)
+        return dLens
+
+    def GetAttr(self, obj, attr):
+        """
+        Return obj's attr, reading backing '_' attribute if present (Table
+        .df/.lst_dfs properties would trigger lazy load or spill reload)
+        10/17/26
+        """
+        if hasattr(obj, '_' + attr): return getattr(obj, '_' + attr)
+        return getattr(obj, attr, None)
+
+    def DfsRowsBytes(self, val):
+        """
+        Return rows and memory bytes of a df or list of df's (0, 0 otherwise)
+        10/17/26
+        """
+        if isinstance(val, pd.DataFrame): val = [val]
+        if not isinstance(val, list): return 0, 0
+        lst = [df for df in val if isinstance(df, pd.DataFrame)]
+        return sum(len(df) for df in lst), sum(self.DfBytes(df) for df in lst)
+
+    def DfBytes(self, df):
+        """
+        Return df's memory bytes incl. index; shallow is rows x itemsize for
+        NumPy dtypes (object: pointers) and column memory_usage for extension
+        dtypes (same as memory_usage(deep=False) without df.items() Series
+        that would stay cached on the df)
+        10/17/26
+        """
+        if self.IsDeepBytes: return int(df.memory_usage(index=True, deep=True).sum())
+        n_bytes = df.index.nbytes
+        for i, dtype in enumerate(df.dtypes):
+            if isinstance(dtype, np.dtype):
+                n_bytes += len(df) * dtype.itemsize
+            else:
+                n_bytes += df.iloc[:, i].memory_usage(index=False)
+        return int(n_bytes)
+
+# ProcStats record columns
+COLS_RECORD = ['proc', 'tbl', 'file', 'sheet', 'depth', 'wall_s', 'cpu_s', 'peak_bytes',
+    'rows_in', 'bytes_in', 'rows_out', 'bytes_out', 'thread']
+
+def GetProcStats(obj):
+    """
+    Return started ProcStats collector for a call on obj (None if not
+    recorded): a Table's .proc_stats; else (e.g. parse instances) the
+    collector of the recorded call running on this thread
+    10/17/26
+    """
+    if hasattr(obj, 'dImportParams'):
+        stats = obj.proc_stats
+    else:
+        stats = getattr(LOCAL, 'stats', None)
+    if stats is None or not stats.IsActive: return None
+    return stats
+
+def instrument(df_in=(), df_out=(), IsTblArg=False):
+    """
+    Decorator for procedures and single-action methods: if the call has a
+    started ProcStats collector (see GetProcStats), record the call (see
+    ProcStats.Measure for df_in and df_out names; IsTblArg for methods whose
+    first arg is the Table, passed by position or keyword)
+    10/17/26
+    """
+    if isinstance(df_in, str): df_in = (df_in,)
+    if isinstance(df_out, str): df_out = (df_out,)
+    def decorator(fn):
+        arg_tbl = list(inspect.signature(fn).parameters)[1] if IsTblArg else None
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not IsTblArg:
+                obj = args[0]
+            else:
+                obj = args[1] if len(args) > 1 else kwargs.get(arg_tbl)
+            stats = GetProcStats(obj)
+            if stats is None: return fn(*args, **kwargs)
+            return stats.RunCall(fn, obj, args, kwargs, df_in, df_out)
+        return wrapper
+    return decorator
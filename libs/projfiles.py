@@ -49,6 +49,8 @@ class Files():
         self.subdir_tests = subdir_tests #optional path to tests subfolder
         self.path_subdir_home = '' #optional path to home subfolder (within proj_case_studies)
         self.pathfile_error_codes = '' #path to ErrorCodes.xlsx
+        self.path_cache = '' #cache folder for on-disk copies of imported data
+        self.path_snapshot = '' #folder for ProjectTables snapshot
 
         #Optional subdirectory within tests folder - to contain issue-specific files
         if IsTest: self.subdir_tests = subdir_tests
@@ -93,6 +95,14 @@ class Files():
         # For security, store user-specific credentials/tokens outside of root folder
         self.pf_credentials = self.path_root + 'credentials.csv'
 
+        # Cache folder for on-disk copies of imported data
+        self.path_cache = self.path_root + 'cache' + os.sep
+        if self.IsTest: self.path_cache = self.path_data + 'cache' + os.sep
+
+        # ProjectTables snapshot (saved Table df's and metadata)
+        self.path_snapshot = self.path_root + 'snapshot' + os.sep
+        if self.IsTest: self.path_snapshot = self.path_data + 'snapshot' + os.sep
+
         # ColInfo
         self.pf_col_info = self.path_libs + 'col_info.xlsx'
         if self.IsTest: self.pf_col_info = self.path_data + 'col_info.xlsx'
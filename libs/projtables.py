@@ -1,13 +1,41 @@
 #Version 6/4/25
-import os, sys
+import os, sys, time, threading, weakref
+from functools import wraps
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import repeat
 import pandas as pd
 import numpy as np
-from openpyxl import load_workbook
 
 path_libs = os.getcwd() + os.sep + 'libs' + os.sep
 if not path_libs in sys.path: sys.path.append(path_libs)
 import parsetables
 from col_info import ColumnInfo
+from df_cache import DfCache, FingerprintFile, HashKey, HashDf, ReadDfFile
+from proc_stats import ProcStats, instrument
+
+# Serializes Table spill/reload (threaded builds may reload the same Table)
+# and memory budget enforcement; keys of this process's spilled Tables
+SPILL_LOCK = threading.Lock()
+BUDGET_LOCK = threading.Lock()
+SPILL_KEYS = set()
+
+def enforce_mem_budget(fn):
+    """
+    Decorator for Table procedures that set .df/.lst_dfs: the ProjectTables
+    memory budget is enforced once the outermost procedure finishes (not on
+    each intermediate .df set)
+    10/17/26
+    """
+    @wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        self.n_proc_depth += 1
+        try:
+            result = fn(self, *args, **kwargs)
+        finally:
+            self.n_proc_depth -= 1
+        self.EnforceMemBudget()
+        return result
+    return wrapper
 
 """
 ================================================================================
@@ -21,16 +49,46 @@ JDL 9/3/24
 class ProjectTables():
     """
     Collection of imported or generated data tables for a project
-    JDL 9/26/24; Modified 5/28/25 add UseTblInfo flag
+    JDL 9/26/24; Modified 5/28/25 add UseTblInfo flag; 10/17/26 IsCacheColInfo,
+        IsLazy, mem_budget_mb, IsInstrument
     """
-    def __init__(self, files, UseTblInfo=False, UseColInfo=False, IsPrint=False):
+    def __init__(self, files, UseTblInfo=False, UseColInfo=False, IsPrint=False,
+            IsCacheColInfo=False, IsLazy=False, mem_budget_mb=None, IsInstrument=False):
         """
-        Instance attributes including Table instances
+        Instance attributes including Table instances (IsCacheColInfo loads
+        col_info.xlsx from a binary copy in files.path_cache when unchanged;
+        IsLazy to make Tables with import params that are set as tbls
+        attributes (and not yet loaded) build .df on first access;
+        mem_budget_mb to spill least-recently-used Table data to disk;
+        IsInstrument to record procedure timing/memory in .dfProcStats)
         """
         self.files = files
         self.UseTblInfo = UseTblInfo
         self.UseColInfo = UseColInfo
         self.IsPrint = IsPrint
+        self.IsLazy = IsLazy
+
+        # Optional memory budget for Tables' .df/.lst_dfs (spill folder cache)
+        self.mem_budget_mb = mem_budget_mb
+        self.spill_cache = None
+        if not mem_budget_mb is None: self.ClearStaleSpills()
+
+        # Table build graph (attribute name: upstream names) and build functions
+        self.dTblDeps = {}
+        self.dTblBuildFns = {}
+        self.lst_build_order = []
+
+        # Build results: start/end times, failures and critical path
+        self.dfBuildTimes = None
+        self.dBuildErrors = {}
+        self.lst_critical_path = []
+
+        # Optional timing/memory records of this tbls' Tables' @instrument
+        # procedures and methods (stopped by StopInstrument or when tbls is freed)
+        self.proc_stats = None
+        if IsInstrument:
+            self.proc_stats = ProcStats().Start()
+            weakref.finalize(self, self.proc_stats.Stop)
 
         # instance self.tbl_info and import from files.pf_col_info
         if self.UseTblInfo:
@@ -38,7 +96,8 @@ class ProjectTables():
             pass
 
         if self.UseColInfo:
-            self.col_info = ColumnInfo(files, IsInit=True, IsPrint=self.IsPrint)
+            self.col_info = ColumnInfo(files, IsInit=True, IsPrint=self.IsPrint,
+                IsCache=IsCacheColInfo)
 
         #Instance project-specific tables if any
         #self.InstanceTblObjs()
@@ -51,21 +110,359 @@ class ProjectTables():
         # Add project-specific table instantiations here
         # Typical is do define dImportParams and dParseParams dicts and pass as
         # arguments to Table(name, dImportParams, dParseParams, tbls.col_info) along
-        # with optional col_info instance
+        # with optional col_info instance (tbls.IsLazy makes them defer import)
         pass
 
+    def __setattr__(self, name, val):
+        """
+        Set attribute; Tables get a weak reference back to tbls and their
+        attribute name (so their loads/sets can enforce the memory budget) and
+        are made lazy if tbls.IsLazy and they have import params and no data
+        10/17/26
+        """
+        if isinstance(val, Table):
+            val.tbls_ref, val.tbls_attr = weakref.ref(self), name
+            if self.__dict__.get('IsLazy') and val.dImportParams and not val.IsLoaded:
+                val.IsLazy = True
+        super().__setattr__(name, val)
+
+    def GetTbls(self):
+        """
+        Return dict of Table instances by attribute name
+        10/17/26
+        """
+        return {name: obj for name, obj in vars(self).items() if isinstance(obj, Table)}
+
+    def LoadTbls(self, lst_names=None):
+        """
+        Build .df of lazy Tables (all or by attribute name) not yet loaded
+        10/17/26
+        """
+        dTbls = self.GetTbls()
+        if lst_names is None: lst_names = list(dTbls)
+        for name in lst_names:
+            if dTbls[name].IsLazy and not dTbls[name].IsLoaded:
+                dTbls[name].LoadTblProcedure()
+                self.EnforceMemBudget()
+
+    def LoadedTblNames(self):
+        """
+        Return list of attribute names of Tables whose .df is loaded (or not lazy)
+        10/17/26
+        """
+        return [name for name, tbl in self.GetTbls().items() if tbl.IsLoaded or not tbl.IsLazy]
+
+    @property
+    def dfProcStats(self):
+        """
+        DataFrame of procedure/method call records (wall/CPU seconds, tracemalloc
+        peak bytes, rows/bytes in and out by tbl, file and sheet) if IsInstrument
+        10/17/26
+        """
+        if self.proc_stats is None: return None
+        return self.proc_stats.df
+
+    def StopInstrument(self):
+        """
+        Stop recording .proc_stats (records are kept in .dfProcStats) and
+        stop tracemalloc if ProcStats started it
+        10/17/26
+        """
+        if not self.proc_stats is None: self.proc_stats.Stop()
+
+    """
+    ================================================================================
+    Memory budget -- spill least-recently-used Tables' data to disk
+    ================================================================================
+    """
+    def EnforceMemBudget(self, lst_exclude=None):
+        """
+        If .mem_budget_mb, spill least-recently-accessed Tables' .df/.lst_dfs
+        (except lst_exclude names and Tables inside a .df-setting procedure)
+        to the spill cache until Tables' total deep memory is within budget.
+        Spilled data reload on access. Also run by Tables after lazy loads,
+        spill reloads, procedures and .df sets (see Table.EnforceMemBudget)
+        10/17/26
+        """
+        if self.mem_budget_mb is None: return
+        lst_exclude = lst_exclude or []
+        with BUDGET_LOCK:
+            dTbls = self.GetTbls()
+            dBytes = {name: tbl.MemoryBytes() for name, tbl in dTbls.items()}
+            n_bytes = sum(dBytes.values())
+
+            for name in sorted(dTbls, key=lambda name: dTbls[name].t_access):
+                if n_bytes <= self.mem_budget_mb * 1024**2: break
+                if name in lst_exclude or dBytes[name] == 0: continue
+                if dTbls[name].n_proc_depth > 0: continue
+                dTbls[name].Spill(self.SetSpillCache())
+                n_bytes -= dBytes[name]
+
+    def SetSpillCache(self):
+        """
+        Return DfCache for spilled Table data (files.path_cache spill folder)
+        10/17/26
+        """
+        if self.spill_cache is None:
+            self.spill_cache = DfCache(self.files.path_cache + 'spill' + os.sep)
+        return self.spill_cache
+
+    def ClearStaleSpills(self):
+        """
+        Delete spill cache entries not held by a spilled Table in this process
+        (left by earlier sessions; keys are per Table instance so they are
+        never reused). Processes running concurrently need separate
+        files.path_cache folders
+        10/17/26
+        """
+        cache = self.SetSpillCache()
+        for key in cache.ListKeys('spill_'):
+            if not key in SPILL_KEYS: cache.DeleteEntry(key)
+
+    """
+    ================================================================================
+    Snapshot -- save/restore all Tables' df's and metadata
+    ================================================================================
+    """
+    def SaveSnapshot(self, path=None):
+        """
+        Write every Table's .df (one DfCache entry: Arrow IPC files where
+        exact, else pickles) to path (default files.path_snapshot) with
+        metadata pickle of name, idx, import/parse params and content hash.
+        A snapshot_id in both marks them as written together
+        10/17/26
+        """
+        path = path or self.files.path_snapshot
+        cache = DfCache(path)
+        dTbls = self.GetTbls()
+        snapshot_id = HashKey(time.time_ns(), list(dTbls))
+
+        dMeta = {}
+        for name, tbl in dTbls.items():
+
+            # Access .df first so lazy Tables are built (and set .idx)
+            hash_df = HashDf(tbl.df)
+            dMeta[name] = {'tbl_name':tbl.name, 'idx':tbl.idx, 'hash':hash_df,
+                'dImportParams':tbl.dImportParams, 'dParseParams':tbl.dParseParams}
+        pd.to_pickle({'snapshot_id':snapshot_id, 'tbls':dMeta}, path + 'tbls_meta.pkl.tmp')
+        os.replace(path + 'tbls_meta.pkl.tmp', path + 'tbls_meta.pkl')
+
+        cache.WriteDfs('tbls', [tbl.df for tbl in dTbls.values()],
+            {'snapshot_id':snapshot_id, 'names':list(dTbls)})
+
+    def RestoreSnapshot(self, path=None):
+        """
+        Instance Tables saved by SaveSnapshot as lazy Tables whose .df is
+        read from the snapshot and checked against its saved hash on first
+        access
+        10/17/26
+        """
+        path = path or self.files.path_snapshot
+        cache = DfCache(path)
+        if not cache.IsEntry('tbls'): raise FileNotFoundError(f'No snapshot in {path}')
+        dEntry = cache.ReadEntry('tbls')
+        dSnapshot = pd.read_pickle(path + 'tbls_meta.pkl')
+        if dSnapshot['snapshot_id'] != dEntry['meta']['snapshot_id']:
+            raise ValueError(f'Snapshot in {path} is incomplete (metadata and df files differ)')
+
+        col_info = self.col_info if self.UseColInfo else None
+        for name, f in zip(dEntry['meta']['names'], dEntry['files']):
+            d = dSnapshot['tbls'][name]
+            tbl = Table(d['tbl_name'], d['dImportParams'], d['dParseParams'], col_info, IsLazy=True)
+            tbl.idx = d['idx']
+            tbl.snapshot_hash = d['hash']
+            tbl.pf_snapshot = path + f
+            setattr(self, name, tbl)
+
+    """
+    ================================================================================
+    BuildTblsProcedure -- build Tables in dependency order with independent
+    builds running concurrently in a thread pool
+    ================================================================================
+    """
+    def AddTblBuild(self, name, lst_upstream=None, build_fn=None):
+        """
+        Declare build of Table attribute name: its upstream Table names and
+        build_fn(tbls) (default: the Table's LoadTblProcedure)
+        10/17/26
+        """
+        self.dTblDeps[name] = list(lst_upstream or [])
+        self.dTblBuildFns[name] = build_fn
+
+    def BuildTblsProcedure(self, n_workers=None):
+        """
+        Procedure to build all declared Tables with up to n_workers threads
+        and set critical path
+        10/17/26
+        """
+        self.SetTblBuildOrder()
+        self.RunTblBuilds(n_workers)
+        self.SetCriticalPath()
+
+    def SetTblBuildOrder(self):
+        """
+        Set .lst_build_order as a topological order of .dTblDeps; raise
+        ValueError for undeclared upstream tables or dependency cycles
+        10/17/26
+        """
+        for name, lst_upstream in self.dTblDeps.items():
+            lst_missing = [u for u in lst_upstream if not u in self.dTblDeps]
+            if lst_missing: raise ValueError(f'{name}: upstream table(s) {lst_missing} not declared')
+
+        # Kahn's algorithm (declaration order among ready tables)
+        dDownstream = self.SetDownstreamTbls()
+        dIndegree = {name: len(lst) for name, lst in self.dTblDeps.items()}
+        lst_ready = [name for name, n in dIndegree.items() if n == 0]
+        self.lst_build_order = []
+        while lst_ready:
+            name = lst_ready.pop(0)
+            self.lst_build_order.append(name)
+            for down in dDownstream[name]:
+                dIndegree[down] -= 1
+                if dIndegree[down] == 0: lst_ready.append(down)
+
+        if len(self.lst_build_order) < len(self.dTblDeps):
+            lst = [name for name in self.dTblDeps if not name in self.lst_build_order]
+            raise ValueError(f'Dependency cycle among tables {lst}')
+
+    def SetDownstreamTbls(self):
+        """
+        Return dict of downstream Table names by name
+        10/17/26
+        """
+        dDownstream = {name: [] for name in self.dTblDeps}
+        for name, lst_upstream in self.dTblDeps.items():
+            for u in lst_upstream: dDownstream[u].append(name)
+        return dDownstream
+
+    def RunTblBuilds(self, n_workers=None):
+        """
+        Run Table builds in a thread pool, submitting each once its upstream
+        builds finish. Sets .dfBuildTimes (seconds from start); failures stop
+        new submissions, are recorded in .dBuildErrors and raised together as
+        RuntimeError
+        10/17/26
+        """
+        dDownstream = self.SetDownstreamTbls()
+        dRemaining = {name: set(lst) for name, lst in self.dTblDeps.items()}
+        dOrder = {name: i for i, name in enumerate(self.lst_build_order)}
+        self.dBuildErrors, dTimes, dFutures = {}, {}, {}
+
+        t0 = time.perf_counter()
+        lst_ready = [name for name in self.lst_build_order if not dRemaining[name]]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            while lst_ready or dFutures:
+                if not self.dBuildErrors:
+                    for name in sorted(lst_ready, key=dOrder.get):
+                        dFutures[executor.submit(self.RunTblBuild, name, t0)] = name
+                lst_ready = []
+                if not dFutures: break
+
+                done, _ = wait(dFutures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = dFutures.pop(future)
+                    try:
+                        dTimes[name] = future.result()
+                    except Exception as e:
+                        self.dBuildErrors[name] = e
+                        continue
+                    for down in dDownstream[name]:
+                        dRemaining[down].discard(name)
+                        if not dRemaining[down]: lst_ready.append(down)
+
+                # Spill finished Tables' data if over memory budget
+                self.EnforceMemBudget(list(dFutures.values()))
+
+        self.dfBuildTimes = pd.DataFrame.from_dict(dTimes, orient='index', columns=['start', 'end'])
+        self.dfBuildTimes['duration'] = self.dfBuildTimes['end'] - self.dfBuildTimes['start']
+
+        if len(self.dBuildErrors) > 0:
+            msg = '; '.join(f'{name} {type(e).__name__}: {e}' for name, e in self.dBuildErrors.items())
+            raise RuntimeError(f'Build failed for {len(self.dBuildErrors)} of '
+                f'{len(self.dTblDeps)} tables -- {msg}')
+
+    def RunTblBuild(self, name, t0):
+        """
+        Run Table name's build function; return (start, end) seconds from t0
+        10/17/26
+        """
+        t_start = time.perf_counter() - t0
+        if self.dTblBuildFns[name] is None:
+            getattr(self, name).LoadTblProcedure()
+        else:
+            self.dTblBuildFns[name](self)
+        return t_start, time.perf_counter() - t0
+
+    def SetCriticalPath(self):
+        """
+        Set .lst_critical_path: chain of dependent builds with the longest
+        total duration (lower bound on build time with unlimited workers);
+        flag it in .dfBuildTimes['IsCritical']
+        10/17/26
+        """
+        self.lst_critical_path = []
+        if len(self.lst_build_order) == 0: return
+
+        durations = self.dfBuildTimes['duration']
+        dFinish, dPrev = {}, {}
+        for name in self.lst_build_order:
+            lst_upstream = self.dTblDeps[name]
+            dPrev[name] = max(lst_upstream, key=dFinish.get) if lst_upstream else None
+            dFinish[name] = durations[name] + (dFinish[dPrev[name]] if dPrev[name] else 0.)
+
+        # Backtrack from latest-finishing table
+        name = max(dFinish, key=dFinish.get)
+        while name is not None:
+            self.lst_critical_path.insert(0, name)
+            name = dPrev[name]
+        self.dfBuildTimes['IsCritical'] = self.dfBuildTimes.index.isin(self.lst_critical_path)
+
+        if self.IsPrint:
+            print(f"Critical path {' -> '.join(self.lst_critical_path)}: "
+                f"{dFinish[self.lst_critical_path[-1]]:.2f}s of "
+                f"{self.dfBuildTimes['end'].max():.2f}s build")
+
 class Table():
     """
     Attributes for a data table including import instructions and other
     metadata. Table instances are attributes of ProjectTables Class
     JDL Modified 4/8/25 refactor to fully use dImportParams and dParseParams
-        5/28/25 to add col_info attribute; 6/4/25 add .idx
+        5/28/25 to add col_info attribute; 6/4/25 add .idx; 10/17/26 IsLazy,
+        .dManifest
     """
-    def __init__(self, name, dImportParams=None, dParseParams=None, col_info=None):
+    def __init__(self, name, dImportParams=None, dParseParams=None, col_info=None,
+            IsLazy=False):
         
         #Table name
         self.name = name
 
+        # If IsLazy, .df is imported/parsed/cleaned up (or read from
+        # ProjectTables snapshot file) on first access
+        self.IsLazy = IsLazy
+        self.IsLoaded = False
+
+        # Held while LoadTblProcedure runs (other threads reading .df wait for
+        # the build; the building thread re-enters)
+        self.load_lock = threading.RLock()
+        self.pf_snapshot = None
+        self.snapshot_hash = None
+
+        # If spilled by ProjectTables memory budget, .df/.lst_dfs are in
+        # .spill_cache under .spill_key (reloaded on access); last access time
+        self.spill_cache = None
+        self.spill_key = None
+        self.t_access = 0.
+        self.mem_bytes = (None, 0)
+
+        # ProjectTables (weak reference) and attribute name if Table is a tbls
+        # attribute; depth of running .df-setting procedures (budget deferred)
+        self.tbls_ref = None
+        self.tbls_attr = None
+        self.n_proc_depth = 0
+
+        # ProcStats collector of a Table that is not a tbls attribute
+        self._proc_stats = None
+
         # Dicts of import and parse parameters
         self.dImportParams = dImportParams or {}
         self.dParseParams = dParseParams or {'parse_type':'none'}
@@ -74,29 +471,213 @@ class Table():
         self.df_raw = pd.DataFrame()
 
         # Parsed data .df and list of column names (or individual column name) for indexing df
-        self.df = pd.DataFrame()
+        self._df = pd.DataFrame()
         self.idx = []
 
         # Optionally create Column Info df (subset of col_info.df) for this table
+        self.col_info = col_info
         self.dfColInfo = None
+        self.col_plan = None
         if not col_info is None: self.SetTblColInfo(col_info)
 
         # Temp variables for looping through files
         self.pf = None
         self.sht = None
-        self.lst_dfs = None
+        self.xl = None
+        self.pf_xl = None
+        self._lst_dfs = None
+        self.lst_dfs_parsed = []
+        self.IsParseOnRead = False
         self.sht_type = None
+        self.excel_reader = None
+        self.n_max_blank_rows = None
         self.is_unstructured = None
         self.IsAddFilenameCol = None
-        self.lst_dfs = None
+        self.n_workers = None
+        self.chunksize = None
+        self.dReadKwargs = {}
+        self.cache = None
+
+        # Parse failures by .lst_dfs index (parallel parsing)
+        self.dParseErrors = {}
+
+        # Incremental import: ingested files by basename and files read last update
+        self.dManifest = {}
+        self.lst_files_read = []
+
+    @property
+    def df(self):
+        """
+        Table's data; if .IsLazy, built by LoadTblProcedure on first access
+        (waits if another thread is building it); reloaded if spilled.
+        Resets memoized .mem_bytes (caller may edit .df in place)
+        10/17/26
+        """
+        self.t_access = time.perf_counter()
+        if not self.spill_key is None:
+            self.ReloadSpilled()
+            self.EnforceMemBudget()
+        if self.IsLazy:
+            with self.load_lock:
+                if not self.IsLoaded: self.LoadTblProcedure()
+        self.mem_bytes = (None, 0)
+        return self._df
+
+    @df.setter
+    def df(self, df):
+        self.t_access = time.perf_counter()
+        if not self.spill_key is None: self.ReloadSpilled()
+        self._df = df
+        self.IsLoaded = True
+        self.EnforceMemBudget()
+
+    @property
+    def lst_dfs(self):
+        """
+        Imported raw df's (unstructured, pre-parsing); reloaded if spilled.
+        Resets memoized .mem_bytes (caller may edit df's in place)
+        10/17/26
+        """
+        self.t_access = time.perf_counter()
+        if not self.spill_key is None:
+            self.ReloadSpilled()
+            self.EnforceMemBudget()
+        self.mem_bytes = (None, 0)
+        return self._lst_dfs
+
+    @lst_dfs.setter
+    def lst_dfs(self, lst_dfs):
+        if not self.spill_key is None: self.ReloadSpilled()
+        self._lst_dfs = lst_dfs
+
+    @property
+    def proc_stats(self):
+        """
+        ProcStats collector recording this Table's @instrument calls: its
+        tbls' .proc_stats if Table is a tbls attribute (else set directly)
+        10/17/26
+        """
+        tbls = None if self.tbls_ref is None else self.tbls_ref()
+        if tbls is None: return self._proc_stats
+        return tbls.proc_stats
+
+    @proc_stats.setter
+    def proc_stats(self, proc_stats):
+        self._proc_stats = proc_stats
+
+    """
+    ================================================================================
+    Memory budget spill/reload (called by ProjectTables.EnforceMemBudget)
+    ================================================================================
+    """
+    def EnforceMemBudget(self):
+        """
+        Enforce memory budget of the ProjectTables this Table is an attribute
+        of (keeping this Table in memory); deferred while a .df-setting
+        procedure of this Table runs
+        10/17/26
+        """
+        tbls = None if self.tbls_ref is None else self.tbls_ref()
+        if tbls is None or tbls.mem_budget_mb is None or self.n_proc_depth > 0: return
+        tbls.EnforceMemBudget([self.tbls_attr])
+
+    def MemoryBytes(self):
+        """
+        Return deep memory bytes of in-memory .df and .lst_dfs (0 if spilled);
+        memoized in .mem_bytes until .df or .lst_dfs is replaced, resized or
+        accessed (.df/.lst_dfs getters reset it)
+        10/17/26
+        """
+        key = (id(self._df), self._df.shape, id(self._lst_dfs), len(self._lst_dfs or []))
+        if self.mem_bytes[0] == key: return self.mem_bytes[1]
+
+        n_bytes = self._df.memory_usage(deep=True).sum()
+        if self._lst_dfs: n_bytes += sum(df.memory_usage(deep=True).sum() for df in self._lst_dfs)
+        self.mem_bytes = (key, int(n_bytes))
+        return self.mem_bytes[1]
+
+    def Spill(self, cache):
+        """
+        Write .df and .lst_dfs to DfCache cache and release them from memory
+        10/17/26
+        """
+        with SPILL_LOCK:
+            if not self.spill_key is None: return
+            n_lst_dfs = None if self._lst_dfs is None else len(self._lst_dfs)
+            key = 'spill_' + HashKey(self.name, id(self))
+            cache.WriteDfs(key, [self._df] + (self._lst_dfs or []), {'n_lst_dfs':n_lst_dfs})
+            SPILL_KEYS.add(key)
+
+            self._df = pd.DataFrame()
+            self._lst_dfs = None if n_lst_dfs is None else []
+            self.spill_cache, self.spill_key = cache, key
+
+    def ReloadSpilled(self):
+        """
+        Reload spilled .df and .lst_dfs and delete their spill entry
+        10/17/26
+        """
+        with SPILL_LOCK:
+            if self.spill_key is None: return
+            lst_dfs = self.spill_cache.ReadDfs(self.spill_key, IsMemoryMap=False)
+            n_lst_dfs = self.spill_cache.ReadEntry(self.spill_key)['meta']['n_lst_dfs']
+            self.spill_cache.DeleteEntry(self.spill_key)
+            SPILL_KEYS.discard(self.spill_key)
+
+            self._df = lst_dfs[0]
+            self._lst_dfs = None if n_lst_dfs is None else lst_dfs[1:]
+            self.spill_cache, self.spill_key = None, None
+
+    @instrument(df_out='df')
+    @enforce_mem_budget
+    def LoadTblProcedure(self):
+        """
+        Procedure to build .df of a lazy Table: import, parse (if unstructured
+        and not parsed on read) and ColumnInfo cleanup and index list (if
+        Table has col_info; chunked reads are cleaned up as read). Restored
+        Tables read .df from their snapshot file instead (hash checked);
+        dImportParams['incremental'] uses ImportToTblDfIncremental. Holds
+        .load_lock so other threads' .df reads wait for the build
+        10/17/26
+        """
+        with self.load_lock:
+            self.IsLoaded = True
+            try:
+                if not self.pf_snapshot is None:
+                    self.df = self.ReadSnapshotDf()
+                    return
+                if self.SetImportParam(False, 'incremental'):
+                    self.ImportToTblDfIncremental()
+                else:
+                    self.ImportToTblDf()
+                    if self.is_unstructured and not self.IsParseOnRead: self.ParseRawData()
+                    if not self.dfColInfo is None and self.chunksize is None:
+                        self.col_info.CleanupImportedDataProcedure(self)
+                if not self.dfColInfo is None: self.col_info.SetTblIndexList(self)
+            except Exception:
+                self.IsLoaded = False
+                raise
+
+    def ReadSnapshotDf(self):
+        """
+        Return df read from .pf_snapshot; raise ValueError if its content
+        hash differs from the hash saved with the snapshot
+        10/17/26
+        """
+        df = ReadDfFile(self.pf_snapshot, IsMemoryMap=True)
+        if not self.snapshot_hash is None and HashDf(df) != self.snapshot_hash:
+            raise ValueError(f'{self.name}: snapshot file {self.pf_snapshot} does not '
+                'match its saved hash (modified or corrupted)')
+        return df
 
     def SetTblColInfo(self, col_info):
         """
         Subset overall column info for this table
-        JDL 5/28/25; Updated 6/2/25 for readability
+        JDL 5/28/25; Updated 6/2/25 for readability; 10/17/26 reset .col_plan;
+        rows looked up from col_info's tbl_name index
         """
-        fil = col_info.df['tbl_name'] == self.name
-        self.dfColInfo = col_info.df[fil].copy()
+        self.dfColInfo = col_info.GetTblColInfo(self.name)
+        self.col_plan = None
         """
     ================================================================================
     ParseRawData Procedure
@@ -106,19 +687,65 @@ class Table():
     JDL 4/21/25; updated 5/30/25
     ================================================================================
     """
+    @instrument(df_in='lst_dfs', df_out='df')
+    @enforce_mem_budget
     def ParseRawData(self):
         """
         Procedure to parse raw data for a given Table instance
-        Updated 5/30/25
+        Updated 5/30/25; 10/17/26 collect parsed df's and concat once; add
+        optional process pool; mark loaded (no lazy build); release last .df_raw
+        """
+        self.IsLoaded = True
+
+        # Optionally parse raw df's in a process pool
+        if self.SetParseParam(1, 'n_workers') > 1:
+            lst_dfs_parsed = self.ParseRawDataParallel()
+        else:
+            lst_dfs_parsed = []
+            for self.df_raw in self.lst_dfs:
+                lst_dfs_parsed.append(self.ParseDfRaw())
+            self.df_raw = pd.DataFrame()
+
+        # Concatenate parsed data to tbl.df
+        if len(lst_dfs_parsed) > 0:
+            self.df = ConcatDfs([self.df] + lst_dfs_parsed)
+
+    @instrument(df_in='df_raw', df_out='return')
+    def ParseDfRaw(self):
+        """
+        Parse .df_raw and return parsed df
+        10/17/26 moved from ParseRawData loop
         """
-        for self.df_raw in self.lst_dfs:
+        # instance parse class with tbl (aka self) as argument and parse
+        parse = getattr(parsetables, self.dParseParams['parse_type'])(self)
+        parse.ParseDfRawProcedure()
+        return parse.df
 
-            # instance parse class with tbl (aka self) as argument and parse
-            parse = getattr(parsetables, self.dParseParams['parse_type'])(self)
-            parse.ParseDfRawProcedure()
-                
-            # Concatenate parsed data to tbl.df
-            self.df = pd.concat([self.df, parse.df], ignore_index=True)
+    @instrument(df_in='lst_dfs', df_out='return')
+    def ParseRawDataParallel(self):
+        """
+        Parse .lst_dfs in a process pool with dParseParams['n_workers'] processes
+        and return parsed df's in .lst_dfs order. Failures are recorded in
+        .dParseErrors by .lst_dfs index and raised together as RuntimeError
+        10/17/26
+        """
+        self.dParseErrors = {}
+        lst_dfs_parsed = []
+        with ProcessPoolExecutor(max_workers=self.dParseParams['n_workers']) as executor:
+            futures = [executor.submit(ParseDfRawWorker, self.name, self.dParseParams, df_raw)
+                for df_raw in self.lst_dfs]
+            for i, future in enumerate(futures):
+                try:
+                    lst_dfs_parsed.append(future.result())
+                except Exception as e:
+                    self.dParseErrors[i] = e
+
+        if len(self.dParseErrors) > 0:
+            msg = '; '.join(f'lst_dfs[{i}] {type(e).__name__}: {e}'
+                for i, e in self.dParseErrors.items())
+            raise RuntimeError(f'{self.name}: parse failed for {len(self.dParseErrors)} of '
+                f'{len(self.lst_dfs)} raw dfs -- {msg}')
+        return lst_dfs_parsed
 
     """
     ================================================================================
@@ -126,6 +753,8 @@ class Table():
     JDL 4/10/25 Rewritten to allow multisheet Excel and separate ingest/parse
     ================================================================================
     """
+    @instrument(df_out=('df', 'lst_dfs'))
+    @enforce_mem_budget
     def ImportToTblDf(self, lst_files=None):
         """
         Procedure to import file(s) + sheet(s) to self.df (structured rows/cols)
@@ -133,8 +762,13 @@ class Table():
         set options
 
         Can directly specify lst_files as arg or as dImportParams['lst_files']
-        Refactored JDL 4/10/25; Add IsAddFilenameCol option 4/29/25
+        With dParseParams['parse_on_read'], unstructured raw df's are parsed as
+        they are read (not held in .lst_dfs) and concatenated to self.df
+        Refactored JDL 4/10/25; Add IsAddFilenameCol option 4/29/25; 10/17/26
+        add parse_on_read; mark loaded (explicit import means no lazy build);
+        reset .pf after file loop
         """
+        self.IsLoaded = True
 
         # Set lst_files based on dImportParams['lst_files'] or input arg    
         lst_files = self.SetLstFiles(lst_files)
@@ -144,32 +778,104 @@ class Table():
 
         # initialize list df's and temp df (temp if structured; or for parsing later)
         self.lst_dfs = []
+        self.lst_dfs_parsed = []
         self.df_temp = pd.DataFrame()
 
-        # Loop over input list of files to ingest
-        for self.pf in lst_files:
+        # Loop over input list of files to ingest (or read them in a process pool)
+        if self.n_workers > 1:
+            self.ReadFilesParallel(lst_files)
+        else:
+            for self.pf in lst_files:
+                self.ReadFile()
+            self.pf = None
+
+        # Optionally trim import cache to its size limit
+        if self.cache is not None: self.cache.EvictToMaxSize()
+
+        #Concat if rows/cols aka structured (e.g. no parsing needed) and list is non-empty
+        if not self.is_unstructured and self.lst_dfs:
+            self.df = ConcatDfs(self.lst_dfs)
+            self.lst_dfs = []
+
+        # Concat parsed df's if parsed on read (as ParseRawData does)
+        if self.IsParseOnRead and self.lst_dfs_parsed:
+            self.df = ConcatDfs([self.df] + self.lst_dfs_parsed)
+            self.lst_dfs_parsed = []
 
-            # Read from Excel single/multiple sheets self.pf; append to lst_dfs
-            if self.dImportParams['ftype'] == 'excel':
+    @instrument(df_in='pf', df_out=('+lst_dfs', '+lst_dfs_parsed'))
+    def ReadFile(self):
+        """
+        Read current file, self.pf, and append its df(s) to lst_dfs (or parsed
+        df's to lst_dfs_parsed if .IsParseOnRead)
+        10/17/26 moved from ImportToTblDf loop; add optional import cache;
+        close .xl even if a sheet read fails
+        """
+        # Optionally reuse df(s) cached from an earlier read of unchanged self.pf
+        # (parsed df's if parsing on read)
+        lst_dfs_out = self.lst_dfs_parsed if self.IsParseOnRead else self.lst_dfs
+        if self.cache is not None:
+            key = self.SetCacheKey()
+            lst_dfs_cached = self.cache.ReadDfs(key)
+            if lst_dfs_cached is not None:
+                lst_dfs_out.extend(lst_dfs_cached)
+                return
+            n_dfs = len(lst_dfs_out)
+
+        # Read from Excel single/multiple sheets self.pf; append to lst_dfs
+        if self.dImportParams['ftype'] == 'excel':
+            try:
                 self.SetLstSheets()
                 self.ReadExcelFileSheets()
+            finally:
+                self.CloseExcelFile()
 
-            # Read from CSV self.pf; append to lst_dfs
-            elif self.dImportParams['ftype'] == 'csv':
-                self.ReadCSVFile()
+        # Read from CSV self.pf; append to lst_dfs
+        elif self.dImportParams['ftype'] == 'csv':
+            self.ReadCSVFile()
 
-            # Read from feather self.pf; append to lst_dfs
-            elif self.dImportParams['ftype'] == 'feather':
-                pass
+        # Read from Arrow-backed feather or parquet self.pf; append to lst_dfs
+        elif self.dImportParams['ftype'] in ['feather', 'parquet']:
+            self.ReadColumnarFile()
 
-        #Concat if rows/cols aka structured (e.g. no parsing needed) and list is non-empty
-        if not self.is_unstructured and self.lst_dfs:
-            self.df = pd.concat(self.lst_dfs, ignore_index=True)
-            self.lst_dfs = []
+        # Optionally cache the df(s) just read from self.pf
+        if self.cache is not None: self.cache.WriteDfs(key, lst_dfs_out[n_dfs:])
 
-    def SetLstFiles(self, lst_files):
+    def SetCacheKey(self):
+        """
+        Set import cache key for self.pf from its fingerprint (path, size,
+        mtime and optional content hash), the import/parse params and (if
+        pushed down to the readers or applied to chunks) .dfColInfo
+        10/17/26
+        """
+        lst_omit = ['lst_files', 'import_path', 'n_workers', 'path_cache', 'cache_max_mb']
+        dImport = {k: v for k, v in self.dImportParams.items() if not k in lst_omit}
+        fingerprint = FingerprintFile(self.pf, self.SetImportParam(False, 'cache_hash'))
+
+        # With pushdown_col_info or chunked cleanup, cached df's also depend on .dfColInfo
+        col_info_vals = None
+        IsChunkCleanup = self.chunksize is not None and not self.dfColInfo is None
+        if self.dReadKwargs or IsChunkCleanup: col_info_vals = self.dfColInfo.values.tolist()
+        return HashKey(fingerprint, sorted(dImport.items()),
+            sorted(self.dParseParams.items()), col_info_vals)
+
+    @instrument(df_out=('+lst_dfs', '+lst_dfs_parsed'))
+    def ReadFilesParallel(self, lst_files):
+        """
+        Read files in a process pool with .n_workers processes; each worker
+        returns its file's list of df's (parsed if .IsParseOnRead), and
+        executor.map keeps lst_files order
+        10/17/26
+        """
+        lst_dfs_out = self.lst_dfs_parsed if self.IsParseOnRead else self.lst_dfs
+        args = (self.name, self.dImportParams, self.dParseParams, self.col_info)
+        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
+            for lst_dfs_file in executor.map(ReadFileWorker, repeat(args), lst_files):
+                lst_dfs_out.extend(lst_dfs_file)
+
+    def SetLstFiles(self, lst_files, IsPrependPath=True):
         """
         Set lst_files based on input and dImportParams.
+        10/17/26 IsPrependPath=False returns names without import_path
         """
         # If lst_files is not specified, use dImportParams['lst_files']
         if lst_files is None: lst_files = self.dImportParams['lst_files']
@@ -178,7 +884,7 @@ class Table():
         if not isinstance(lst_files, list): lst_files = [lst_files]
 
         # Optionally prepend import_path to each file name
-        if 'import_path' in self.dImportParams:
+        if IsPrependPath and 'import_path' in self.dImportParams:
             lst_files = [self.dImportParams['import_path'] + f for f in lst_files]
         return lst_files
 
@@ -187,14 +893,75 @@ class Table():
         Set Table attributes for the current file 
         (concise vs referencing dict items and also factors in default vals if
         dict item not specified)
-        JDL 4/10/25; Updated 6/3/25 add IsAddFilenameCol
+        JDL 4/10/25; Updated 6/3/25 add IsAddFilenameCol; 10/17/26 add n_workers,
+        cache, IsParseOnRead, excel_reader
         """
         self.is_unstructured = self.SetParseParam(False, 'is_unstructured')
         self.n_skip_rows = self.SetParseParam(0, 'n_skip_rows')
         self.parse_type = self.SetParseParam('none', 'parse_type')
         self.IsAddFilenameCol = self.SetParseParam(False, 'add_filename_col')
+        self.IsParseOnRead = self.is_unstructured and self.SetParseParam(False, 'parse_on_read')
+        self.n_workers = self.SetImportParam(1, 'n_workers')
+        self.chunksize = self.SetImportParam(None, 'chunksize')
         if self.dImportParams['ftype'] == 'excel':
             self.sht_type = self.SetImportParam('single', 'sht_type')
+            self.excel_reader = self.SetImportParam('pandas', 'excel_reader')
+            self.n_max_blank_rows = self.SetImportParam(None, 'n_max_blank_rows')
+
+        # Optional usecols/dtype read args from .dfColInfo
+        self.SetReadColInfo()
+
+        # Optional on-disk import cache (e.g. dImportParams['path_cache'] = files.path_cache)
+        self.cache = None
+        if 'path_cache' in self.dImportParams:
+            max_mb = self.SetImportParam(1024, 'cache_max_mb')
+            self.cache = DfCache(self.dImportParams['path_cache'], max_mb)
+
+    def SetReadColInfo(self):
+        """
+        If dImportParams['pushdown_col_info'], set .dReadKwargs usecols and
+        dtype args from .dfColInfo so structured CSV/Excel reads skip non-keep
+        columns and parse numeric keep columns to their data_type at read
+        (str and date types are left to ColumnInfo cleanup so blanks/dates
+        convert identically). dtype is keyed on names with whitespace stripped
+        (see FileReadKwargs)
+        10/17/26
+        """
+        self.dReadKwargs = {}
+        if not self.SetImportParam(False, 'pushdown_col_info') or self.dfColInfo is None:
+            return
+
+        # Keep (non-calculated) columns and their import names
+        fil = self.col_info.SetFilterColInfoPopulated(self, ['cols_order', 'cols'], True)
+        df = self.dfColInfo.loc[fil]
+        cols_import = df['cols_raw'].fillna(df['cols']).astype(str).str.strip()
+        set_cols = set(cols_import)
+
+        # Match names with whitespace stripped (as in ReadCSVFile)
+        self.dReadKwargs['usecols'] = lambda col: str(col).strip() in set_cols
+
+        # Numeric data types can be parsed by the reader directly
+        dTypes = {}
+        for col, data_type in zip(cols_import, df['data_type']):
+            if IsNumericDataType(data_type): dTypes[col] = data_type
+        if dTypes: self.dReadKwargs['dtype'] = dTypes
+
+    def FileReadKwargs(self, IsExcel=False):
+        """
+        Return .dReadKwargs for current file (and sheet) with dtype keyed on
+        the names in its header row (which may have whitespace that
+        .dReadKwargs['dtype'] names are stripped of)
+        10/17/26
+        """
+        if not 'dtype' in self.dReadKwargs: return self.dReadKwargs
+        if IsExcel:
+            cols = pd.read_excel(self.xl, sheet_name=self.sht, skiprows=self.n_skip_rows,
+                nrows=0).columns
+        else:
+            cols = pd.read_csv(self.pf, skiprows=self.n_skip_rows, nrows=0).columns
+        dTypes = self.dReadKwargs['dtype']
+        dTypesFile = {col: dTypes[str(col).strip()] for col in cols if str(col).strip() in dTypes}
+        return dict(self.dReadKwargs, dtype=dTypesFile)
 
     def SetImportParam(self, valDefault, param_name):
         """
@@ -214,11 +981,26 @@ class Table():
         if param_name in self.dParseParams: val = self.dParseParams[param_name]
         return val
 
+    @instrument(df_in='df_temp', df_out=('+lst_dfs', '+lst_dfs_parsed'))
+    def AppendDfTemp(self):
+        """
+        Append .df_temp to .lst_dfs or, if .IsParseOnRead, parse it and append
+        the parsed df to .lst_dfs_parsed (raw df is not kept)
+        10/17/26
+        """
+        if self.IsParseOnRead:
+            self.df_raw = self.df_temp
+            self.lst_dfs_parsed.append(self.ParseDfRaw())
+            self.df_raw = pd.DataFrame()
+        else:
+            self.lst_dfs.append(self.df_temp)
+
+    @instrument()
     def SetLstSheets(self):
         """
         Set .lst_sheets based on sht_type and sht in dImportParams
         (Called within iteration with self.pf file)
-        JDL 4/10/25; Updated 5/30/25
+        JDL 4/10/25; Updated 5/30/25; 10/17/26 use .xl workbook handle
         """
         self.lst_sheets = []
 
@@ -229,14 +1011,12 @@ class Table():
 
             # If sheet name 0, reset to first sheet name (must open to see sht names)
             if self.lst_sheets[0] == 0:
-                wb = load_workbook(filename=self.pf, read_only=True)
-                self.lst_sheets[0] = wb.sheetnames[0]
-                wb.close()
+                self.OpenExcelFile()
+                self.lst_sheets[0] = self.xl.sheet_names[0]
 
         elif self.sht_type == 'all':
-            wb = load_workbook(filename=self.pf, read_only=True)
-            self.lst_sheets = wb.sheetnames
-            wb.close()
+            self.OpenExcelFile()
+            self.lst_sheets = self.xl.sheet_names
         
         elif self.sht_type == 'list':
             pass
@@ -253,10 +1033,11 @@ class Table():
         elif self.sht_type == 'contains':
             pass
 
+    @instrument(df_out=('+lst_dfs', '+lst_dfs_parsed'))
     def ReadExcelFileSheets(self):
         """
         Loop through sheets in lst_sheets and read their data
-        JDL 4/10/25; 6/3/25 add IsAddFilenameCol
+        JDL 4/10/25; 6/3/25 add IsAddFilenameCol; 10/17/26 reset .sht after loop
         """
         for self.sht in self.lst_sheets:
             self.ReadExcelSht()
@@ -266,35 +1047,88 @@ class Table():
                 self.df_temp['filename'] = os.path.basename(self.pf)
                 self.df_temp['sheet'] = self.sht
 
-            self.lst_dfs.append(self.df_temp)
+            self.AppendDfTemp()
             self.df_temp = pd.DataFrame()
+        self.sht = None
 
+    @instrument(df_out='df_temp')
     def ReadExcelSht(self):
         """
         Read data from the current sheet into a temporary DataFrame.
+        (Updated 10/17/26 to read from .xl handle shared by file's sheets,
+        to use vectorized import_dtype=str conversion and optional openpyxl
+        raw reader)
         """
-        if self.is_unstructured:
-            self.df_temp = pd.read_excel(self.pf, sheet_name=self.sht, header=None)
+        self.OpenExcelFile()
+
+        # Optionally stream unstructured .xlsx sheet with openpyxl
+        if self.is_unstructured and self.excel_reader == 'openpyxl' and \
+                self.xl.engine == 'openpyxl':
+            self.ReadExcelShtOpenpyxl()
+
+        elif self.is_unstructured:
+            self.df_temp = pd.read_excel(self.xl, sheet_name=self.sht, header=None)
 
             # Negate Pandas inferring float data type for integers and NaNs for blanks
             if 'import_dtype' in self.dParseParams and self.dParseParams['import_dtype'] == str:
-                self.df_temp = self.df_temp.astype(object)
-                self.df_temp = self.df_temp.map(lambda x: None if pd.isna(x) \
-                    else str(int(x)) if isinstance(x, float) and x.is_integer() else str(x))
+                self.df_temp = ConvertRawDfToStr(self.df_temp)
+        else:
+            self.df_temp = pd.read_excel(self.xl, sheet_name=self.sht,
+                skiprows=self.n_skip_rows, **self.FileReadKwargs(IsExcel=True))
+
+    @instrument(df_out='df_temp')
+    def ReadExcelShtOpenpyxl(self):
+        """
+        Read unstructured sheet self.sht from .xl's read-only openpyxl workbook
+        into .df_temp by streaming rows (str conversion if import_dtype=str)
+        10/17/26
+        """
+        if isinstance(self.sht, int):
+            ws = self.xl.book.worksheets[self.sht]
         else:
-            self.df_temp = pd.read_excel(self.pf, sheet_name=self.sht, skiprows=self.n_skip_rows)
+            ws = self.xl.book[self.sht]
+        IsStr = self.SetParseParam(None, 'import_dtype') == str
+        self.df_temp = ReadWorksheetRaw(ws, IsStr, self.n_max_blank_rows)
 
+    @instrument(df_in='pf')
+    def OpenExcelFile(self):
+        """
+        Open self.pf as pd.ExcelFile handle, .xl (if not already open) so
+        sheet names and all sheets' data come from one open/unzip of the file;
+        a handle left open on another file (.pf_xl) is closed first
+        10/17/26
+        """
+        if self.xl is not None and self.pf_xl != self.pf: self.CloseExcelFile()
+        if self.xl is None:
+            self.xl = pd.ExcelFile(self.pf)
+            self.pf_xl = self.pf
+
+    def CloseExcelFile(self):
+        """
+        Close and reset .xl workbook handle after reading self.pf's sheets
+        10/17/26
+        """
+        if self.xl is not None: self.xl.close()
+        self.xl = None
+        self.pf_xl = None
+
+    @instrument(df_in='pf', df_out=('+lst_dfs', '+lst_dfs_parsed'))
     def ReadCSVFile(self):
         """
         Import current CSV file into a temporary df and append to lst_dfs
-        JDL 4/10/25; 6/3/25 add IsAddFilenameCol
+        JDL 4/10/25; 6/3/25 add IsAddFilenameCol; 10/17/26 add chunksize option
         """
         if self.is_unstructured:
             # Read CSV without treating first row as headers
             self.df_temp = pd.read_csv(self.pf, header=None)
+
+        # Optionally stream large structured CSV in chunks
+        elif self.chunksize is not None:
+            self.ReadCSVFileChunks()
         else:
             # Read CSV with optional skiprows
-            self.df_temp = pd.read_csv(self.pf, skiprows=self.n_skip_rows)
+            self.df_temp = pd.read_csv(self.pf, skiprows=self.n_skip_rows,
+                **self.FileReadKwargs())
 
             # Strip leading/trailing whitespace from column names
             self.df_temp.columns = self.df_temp.columns.str.strip()
@@ -304,9 +1138,410 @@ class Table():
                 self.df_temp['filename'] = os.path.basename(self.pf)
 
         # Append temp df to lst_dfs and re-initialize
-        self.lst_dfs.append(self.df_temp)
+        self.AppendDfTemp()
         self.df_temp = pd.DataFrame()
 
+    @instrument(df_in='pf', df_out='df_temp')
+    def ReadCSVFileChunks(self):
+        """
+        Stream current structured CSV in dImportParams['chunksize'] row chunks
+        and set .df_temp. If Table has col_info, each chunk is renamed,
+        subset and typed by ColumnInfo cleanup as it is read so only compact
+        keep columns accumulate (peak is one raw chunk plus typed data)
+        10/17/26
+        """
+        lst_chunks = []
+        reader = pd.read_csv(self.pf, skiprows=self.n_skip_rows, chunksize=self.chunksize,
+            **self.FileReadKwargs())
+        for df_chunk in reader:
+
+            # Strip whitespace from column names; optionally add filename column
+            df_chunk.columns = df_chunk.columns.str.strip()
+            if self.IsAddFilenameCol: df_chunk['filename'] = os.path.basename(self.pf)
+
+            lst_chunks.append(self.CleanupChunk(df_chunk))
+
+        # Single concat of typed chunks
+        self.df_temp = ConcatDfs(lst_chunks)
+
+    @instrument(df_in='arg', df_out='return')
+    def CleanupChunk(self, df_chunk):
+        """
+        Return df_chunk after ColumnInfo cleanup (if Table has col_info). Uses
+        a temp Table that shares .dfColInfo and .col_plan so self.df is
+        untouched and the plan is compiled once per Table
+        10/17/26
+        """
+        if self.col_info is None or self.dfColInfo is None: return df_chunk
+
+        tbl_chunk = Table(self.name, dImportParams=self.dImportParams)
+        tbl_chunk.dfColInfo = self.dfColInfo
+        tbl_chunk.col_plan = self.col_info.SetTblColPlan(self)
+        tbl_chunk.df = df_chunk
+        self.col_info.CleanupImportedDataProcedure(tbl_chunk)
+        return tbl_chunk.df
+
+    @instrument(df_in='pf', df_out=('+lst_dfs', '+lst_dfs_parsed'))
+    def ReadColumnarFile(self):
+        """
+        Import current feather or parquet file into a temporary df and append
+        to lst_dfs. Optional dImportParams['usecols'] list projects columns at
+        read and dImportParams['dtype_backend']='pyarrow' keeps Arrow buffers
+        (n_skip_rows does not apply; columnar files store their header)
+        10/17/26
+        """
+        # Column projection and optional Arrow-backed dtypes
+        kwargs = {'columns':self.SetImportParam(None, 'usecols')}
+        if 'dtype_backend' in self.dImportParams:
+            kwargs['dtype_backend'] = self.dImportParams['dtype_backend']
+
+        if self.dImportParams['ftype'] == 'feather':
+            self.df_temp = pd.read_feather(self.pf, **kwargs)
+        else:
+            self.df_temp = pd.read_parquet(self.pf, **kwargs)
+
+        # Unstructured raw data uses column positions as names (like header=None)
+        if self.is_unstructured:
+            self.df_temp.columns = range(self.df_temp.shape[1])
+
+        #Optionally, add filename column to rows/cols df
+        elif self.IsAddFilenameCol:
+            self.df_temp['filename'] = os.path.basename(self.pf)
+
+        # Append temp df to lst_dfs and re-initialize
+        self.AppendDfTemp()
+        self.df_temp = pd.DataFrame()
+
+    """
+    ================================================================================
+    ImportToTblDfIncremental Procedure
+    Sweep-folder ingest: only new/changed files are read; rows are tracked by
+    the 'filename' provenance column (dParseParams['add_filename_col'])
+    ================================================================================
+    """
+    @instrument(df_in='df', df_out='df')
+    @enforce_mem_budget
+    def ImportToTblDfIncremental(self, lst_files=None):
+        """
+        Procedure to update self.df from lst_files (structured only) by reading
+        only files that are new or changed vs .dManifest, dropping rows of
+        changed or deleted files and appending the new rows. With col_info,
+        new rows are cleaned up before appending. Optional
+        dImportParams['path_manifest'] persists rows by file and .dManifest
+        between runs
+        10/17/26
+        """
+        self.IsLoaded = True
+        if self.SetParseParam(False, 'is_unstructured') or \
+                not self.SetParseParam(False, 'add_filename_col'):
+            raise ValueError(f"{self.name}: incremental import requires structured data "
+                "with dParseParams['add_filename_col']")
+        lst_files = self.SetLstFiles(lst_files, IsPrependPath=False)
+        lst_pfs = self.SetLstFiles(lst_files)
+
+        # Resume from persisted rows and .dManifest (if not already in memory)
+        self.ReadManifestStore()
+
+        # Compare files to manifest; drop rows of changed and deleted files
+        dManifest, set_drop = self.SetManifestChanges(lst_pfs)
+        df_keep = self.df
+        if set_drop and len(df_keep) > 0:
+            df_keep = df_keep[~df_keep['filename'].isin(set_drop)]
+
+        # Import (and optionally clean up) only new/changed files
+        df_new = pd.DataFrame()
+        if self.lst_files_read:
+            self.df = pd.DataFrame()
+            self.ImportToTblDf([f for f, pf in zip(lst_files, lst_pfs)
+                if pf in self.lst_files_read])
+            if not self.dfColInfo is None and self.chunksize is None:
+                self.col_info.CleanupImportedDataProcedure(self)
+            df_new = self.df
+            if len(df_new) > 0 and not 'filename' in df_new.columns:
+                raise ValueError(f"{self.name}: 'filename' column missing after import "
+                    "(keep it in col_info for incremental import)")
+
+        # Combine kept and new rows; record manifest and optionally persist
+        lst_dfs = [df for df in [df_keep, df_new] if len(df) > 0]
+        self.df = pd.DataFrame()
+        if len(lst_dfs) == 1: self.df = lst_dfs[0].reset_index(drop=True)
+        if len(lst_dfs) == 2: self.df = ConcatDfs(lst_dfs)
+        self.dManifest = dManifest
+        self.WriteManifestStore(df_new, set_drop)
+
+    def SetManifestChanges(self, lst_files):
+        """
+        Set .lst_files_read to files new or changed vs .dManifest and return
+        updated manifest (basename: [abs path, size, mtime_ns, sha1]) and set
+        of basenames whose rows must be dropped (changed or deleted). Files
+        with new size/mtime but same sha1 (e.g. touched or copied) are not read
+        10/17/26
+        """
+        self.lst_files_read = []
+        dManifest, set_drop = {}, set()
+        for pf in lst_files:
+            f = os.path.basename(pf)
+            entry_old = self.dManifest.get(f)
+            entry = list(FingerprintFile(pf))
+            if not entry_old is None and entry_old[:3] == entry:
+                dManifest[f] = entry_old
+                continue
+
+            # Hash only files that are new or have new path/size/mtime
+            entry = list(FingerprintFile(pf, IsHash=True))
+            dManifest[f] = entry
+            if not entry_old is None and entry_old[3] == entry[3]: continue
+            self.lst_files_read.append(pf)
+            if not entry_old is None: set_drop.add(f)
+
+        set_drop |= set(self.dManifest) - set(dManifest)
+        return dManifest, set_drop
+
+    def ManifestKey(self, f=None):
+        """
+        Return manifest store key for this Table's manifest (or file f's rows)
+        10/17/26
+        """
+        if f is None: return 'manifest_' + HashKey(self.name)
+        return 'manifest_' + HashKey(self.name, f)
+
+    def ReadManifestStore(self):
+        """
+        If .dManifest is empty, set it and .df from dImportParams['path_manifest']
+        (if specified); files whose rows entry is missing are left out of
+        .dManifest so they are re-read
+        10/17/26
+        """
+        if self.dManifest or not 'path_manifest' in self.dImportParams: return
+        store = DfCache(self.dImportParams['path_manifest'])
+        if not store.IsEntry(self.ManifestKey()): return
+        dManifest = store.ReadEntry(self.ManifestKey())['meta']['manifest']
+
+        lst_dfs = []
+        for f in list(dManifest):
+            lst_dfs_file = store.ReadDfs(self.ManifestKey(f))
+            if lst_dfs_file is None:
+                del dManifest[f]
+            elif len(lst_dfs_file[0]) > 0:
+                lst_dfs.append(lst_dfs_file[0])
+        if lst_dfs: self.df = ConcatDfs(lst_dfs)
+        self.dManifest = dManifest
+
+    def WriteManifestStore(self, df_new, set_drop):
+        """
+        Update dImportParams['path_manifest'] (if specified): delete rows of
+        dropped files, write rows of files just read and then .dManifest
+        10/17/26
+        """
+        if not 'path_manifest' in self.dImportParams: return
+        store = DfCache(self.dImportParams['path_manifest'])
+        for f in set_drop: store.DeleteEntry(self.ManifestKey(f))
+        dDfsNew = {}
+        if len(df_new) > 0: dDfsNew = dict(tuple(df_new.groupby('filename', sort=False)))
+        for pf in self.lst_files_read:
+            f = os.path.basename(pf)
+            df_file = dDfsNew.get(f, df_new.iloc[0:0])
+            store.WriteDfs(self.ManifestKey(f), [df_file.reset_index(drop=True)])
+        store.WriteDfs(self.ManifestKey(), [], {'manifest':self.dManifest})
+
+def IsNumericDataType(data_type):
+    """
+    Return True if col_info data_type string is a numpy int or float dtype
+    10/17/26
+    """
+    try:
+        return np.dtype(data_type).kind in 'iuf'
+    except TypeError:
+        return False
+
+def ConcatDfs(lst_dfs):
+    """
+    Concat df's (ignore_index) keeping 'category' columns as category:
+    unordered category columns get the union of their categories first
+    (pd.concat falls back to object if categories differ by chunk or file)
+    10/17/26
+    """
+    lst_dfs = list(lst_dfs)
+    cols_cat = {col for df in lst_dfs for col, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype) and not dtype.ordered}
+    for col in cols_cat:
+        lst_sers = [df[col] for df in lst_dfs if col in df.columns]
+        if not all(isinstance(ser.dtype, pd.CategoricalDtype) for ser in lst_sers): continue
+        cats = lst_sers[0].cat.categories.append([ser.cat.categories for ser in lst_sers[1:]])
+        dtype = pd.CategoricalDtype(cats.unique())
+        lst_dfs = [df.astype({col:dtype}) if col in df.columns else df for df in lst_dfs]
+    return pd.concat(lst_dfs, ignore_index=True)
+
+def ConvertRawDfToStr(df):
+    """
+    Convert raw (header=None) df to object dtype strings with None for blanks.
+    Vectorized by column; same result as cell-by-cell conversion:
+    None if pd.isna(x) else str(int(x)) if x is integer-valued float else str(x)
+    10/17/26
+    """
+    dCols = {i: ConvertRawColToStr(df.iloc[:, i]) for i in range(df.shape[1])}
+    df_str = pd.DataFrame(dCols, index=df.index)
+    df_str.columns = df.columns
+    return df_str
+
+def ConvertRawColToStr(ser):
+    """
+    Return object array of str/None for one raw column (see ConvertRawDfToStr)
+    10/17/26
+    """
+    vals = ser.to_numpy()
+    out = np.full(len(vals), None, dtype=object)
+
+    # Numeric and bool cols: convert unique values and gather with factorize codes
+    if vals.dtype.kind in 'fiub':
+        codes, uniques = pd.factorize(vals)
+        if vals.dtype.kind == 'f':
+            uniques_str = ConvertFloatsToStr(uniques)
+        else:
+            uniques_str = uniques.astype(str).astype(object)
+
+        # NaN blanks have code -1 which takes the appended None
+        out[:] = np.append(uniques_str, None)[codes]
+
+    # Object cols: all-str cols pass through
+    elif vals.dtype.kind == 'O':
+        notna = ser.notna().to_numpy()
+        if pd.api.types.infer_dtype(vals, skipna=True) == 'string':
+            out[notna] = vals[notna]
+        else:
+            out[notna] = ConvertMixedToStr(vals[notna])
+
+    # Other types (e.g. datetime64) cell by cell
+    else:
+        out[:] = [ConvertCellToStr(x) for x in ser.astype(object)]
+    return out
+
+def ConvertMixedToStr(vals):
+    """
+    Return object array of str for non-blank mixed-type object array. Without
+    float/bool cells (which hash equal to ints), convert unique values and
+    gather; else str() cells with builtin map and convert floats as array
+    10/17/26
+    """
+    is_float = np.fromiter(map(isinstance, vals, repeat(float)), bool, len(vals))
+    is_bool = np.fromiter(map(isinstance, vals, repeat((bool, np.bool_))), bool, len(vals))
+    if not is_float.any() and not is_bool.any():
+        codes, uniques = pd.factorize(vals)
+        return np.array(list(map(str, uniques)) + [None], dtype=object)[codes]
+
+    vals_str = np.empty(len(vals), dtype=object)
+    vals_str[:] = list(map(str, vals))
+    vals_str[is_float] = ConvertFloatsToStr(vals[is_float].astype(float))
+    return vals_str
+
+def ConvertFloatsToStr(vals):
+    """
+    Return object array of str/None for float array: NaN to None, integer-valued
+    to int strings (values beyond int64 via Python int), others to str
+    10/17/26
+    """
+    out = np.full(len(vals), None, dtype=object)
+    notna = ~np.isnan(vals)
+    with np.errstate(invalid='ignore'):
+        is_int = notna & np.isfinite(vals) & (np.floor(vals) == vals)
+    is_int64 = is_int & (np.abs(vals) < 2**63)
+    is_big = is_int & ~is_int64
+    out[is_int64] = list(map(str, vals[is_int64].astype(np.int64).tolist()))
+    out[is_big] = [str(int(x)) for x in vals[is_big]]
+    out[notna & ~is_int] = list(map(str, vals[notna & ~is_int].tolist()))
+    return out
+
+def ConvertCellToStr(x):
+    """
+    Cell-by-cell conversion used by ConvertRawColToStr for non-vectorized cases
+    10/17/26
+    """
+    if pd.isna(x): return None
+    if isinstance(x, float) and x.is_integer(): return str(int(x))
+    return str(x)
+
+def ReadWorksheetRaw(ws, IsStr=False, n_max_blank_rows=None):
+    """
+    Return raw (header=None) df of openpyxl worksheet ws. Rows from
+    ws.iter_rows(values_only=True) fill an object array (grown as needed to
+    the rows and cols with data, not ws.max_column) with cells optionally
+    converted to str in the same pass. Reading stops after n_max_blank_rows
+    consecutive blank rows following data (for sheets whose used range is far
+    bigger than their data); trailing blank rows and cols are dropped as with
+    pd.read_excel. Unlike pd.read_excel, cell values are not re-inferred
+    (e.g. numeric-looking text and 'NA' strings are kept as text; bools are
+    'True'/'False')
+    10/17/26
+    """
+    arr = np.empty((1024, 1), dtype=object)
+    i, n_rows, n_blank = 0, 0, 0
+    for row in ws.iter_rows(values_only=True):
+
+        # Empty str cells are blank (as in pd.read_excel)
+        if '' in row: row = tuple(None if x == '' else x for x in row)
+
+        # Count consecutive blank rows after first data row (left as None in
+        # arr) and optionally stop
+        if row.count(None) == len(row):
+            if n_rows > 0: n_blank += 1
+            if n_max_blank_rows is not None and n_blank > n_max_blank_rows: break
+            i += 1
+            continue
+        n_blank = 0
+
+        # Row's width through its last value (rows are padded to ws.max_column)
+        n_cols = arr.shape[1]
+        if row[n_cols:].count(None) < len(row) - n_cols:
+            n_cols = len(row) - next(k for k, x in enumerate(reversed(row)) if x is not None)
+
+        # Grow array by doubling rows (or to fit a wider row)
+        if i >= arr.shape[0] or n_cols > arr.shape[1]:
+            n_alloc = arr.shape[0] if i < arr.shape[0] else max(2 * arr.shape[0], i + 1)
+            arr_new = np.empty((n_alloc, n_cols), dtype=object)
+            arr_new[:arr.shape[0], :arr.shape[1]] = arr
+            arr = arr_new
+
+        row = row[:arr.shape[1]]
+        if IsStr:
+            row = [x if x is None or x.__class__ is str else ConvertCellToStr(x) for x in row]
+        arr[i, :len(row)] = row
+        i += 1
+        n_rows = i
+
+    # Drop trailing blank rows and cols
+    arr = arr[:n_rows]
+    IsCol = pd.notna(arr).any(axis=0)
+    arr = arr[:, :len(IsCol) - int(IsCol[::-1].argmax()) if IsCol.any() else 0]
+
+    if IsStr: return pd.DataFrame(arr)
+    arr[pd.isna(arr)] = np.nan
+    return pd.DataFrame(arr).infer_objects()
+
+def ReadFileWorker(args, pf):
+    """
+    Process pool worker for Table.ReadFilesParallel. Instance a Table from
+    (name, dImportParams, dParseParams, col_info) args, read file pf and
+    return lst_dfs (or lst_dfs_parsed if parsing on read)
+    10/17/26
+    """
+    tbl = Table(*args)
+    tbl.SetFileIngestParams()
+    tbl.lst_dfs, tbl.lst_dfs_parsed, tbl.df_temp = [], [], pd.DataFrame()
+    tbl.pf = pf
+    tbl.ReadFile()
+    if tbl.IsParseOnRead: return tbl.lst_dfs_parsed
+    return tbl.lst_dfs
+
+def ParseDfRawWorker(name, dParseParams, df_raw):
+    """
+    Process pool worker for Table.ParseRawDataParallel. Parse df_raw with
+    dParseParams['parse_type'] class and return parsed df
+    10/17/26
+    """
+    tbl = Table(name, dParseParams=dParseParams)
+    tbl.df_raw = df_raw
+    return tbl.ParseDfRaw()
+
 class CheckInputs:
     """
     Check the tbls dataframes for errors
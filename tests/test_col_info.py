@@ -1,6 +1,6 @@
-# Version 6/4/25
+# Version 10/17/26
 # cd Box\ Sync/Projects/Python_Modeling_Toolbox/tests
-import sys, os
+import sys, os, shutil, warnings
 import pandas as pd
 import numpy as np
 import pytest
@@ -10,7 +10,7 @@ from datetime import datetime
 # Add libs folder to sys.path and import project-specific modules
 libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
 sys.path.insert(0, os.path.abspath(libs_path))
-from col_info import ColumnInfo
+from col_info import ColumnInfo, ColumnPlan
 from projfiles import Files
 from projtables import ProjectTables
 from projtables import Table
@@ -58,6 +58,15 @@ class TestInitColInfoProcedure:
         cinfo_no_init.ImportColInfoDf(files)
         assert len(cinfo_no_init.df) == 17
 
+    def test_SetTblColInfoIndex(self, cinfo):
+        """
+        Split cinfo.df by tbl_name
+        10/17/26
+        """
+        assert sorted(cinfo.dTblColInfo) == ['ExampleTbl1', 'ExampleTbl2', 'Model', 'ModelRaw']
+        assert list(cinfo.dTblColInfo['ExampleTbl2']) == [12, 13, 14, 15, 16]
+        assert cinfo.df_indexed is cinfo.df
+
     def test_RecodeColInfoFlagCols(self, cinfo_no_init, files):
         """
         Recode ColInfo flag columns to boolean (from imported True/NaN)
@@ -73,6 +82,29 @@ class TestInitColInfoProcedure:
         assert (col == False).sum() == 16
         assert col.iloc[16] == True  # Last row is True
 
+    def test_ReadColInfoCached(self, files, tmp_path):
+        """
+        Read col_info from binary cache; rebuild cache when xlsx changes
+        10/17/26
+        """
+        files.pf_col_info = str(shutil.copy(files.pf_col_info, tmp_path / 'col_info.xlsx'))
+        files.path_cache = str(tmp_path / 'cache') + os.sep
+
+        # First instance writes cache entry; second reads it
+        cinfo = ColumnInfo(files, IsPrint=False, IsCache=True)
+        lst = [f for f in os.listdir(files.path_cache) if f.startswith('col_info_')]
+        assert len(lst) == 2
+        cinfo2 = ColumnInfo(files, IsPrint=False, IsCache=True)
+        pd.testing.assert_frame_equal(cinfo2.df, cinfo.df)
+        assert cinfo2.df['IsCalculated'].dtype == bool
+
+        # Overwrite cached df; changed xlsx mtime triggers re-read from Excel
+        f_cached = [f for f in lst if f.endswith('.pkl')][0]
+        pd.to_pickle(cinfo.df.iloc[:2], files.path_cache + f_cached)
+        assert len(ColumnInfo(files, IsPrint=False, IsCache=True).df) == 2
+        os.utime(files.pf_col_info, ns=(0, 10**18))
+        assert len(ColumnInfo(files, IsPrint=False, IsCache=True).df) == 17
+
     def test_cinfo_no_init_fixture(self, cinfo_no_init):
         """
         Instance ColumnInfo (typically as cinfo); optionally initialize df
@@ -115,6 +147,36 @@ Other Methods
 =========================================================================
 """
 class TestOtherMethods:
+    def test_GetTblColInfo(self, cinfo):
+        """
+        Return copy of tbl_name's rows of cinfo.df from tbl_name index
+        10/17/26
+        """
+        df = cinfo.GetTblColInfo('ExampleTbl2')
+        assert df.index.tolist() == [12, 13, 14, 15, 16]
+        assert len(cinfo.GetTblColInfo('NoSuchTbl')) == 0
+
+        # Tables get independent frames; editing one leaves cinfo.df and others as is
+        tbl1 = Table('ExampleTbl2', col_info=cinfo)
+        tbl2 = Table('ExampleTbl2', col_info=cinfo)
+        tbl1.dfColInfo.loc[:, 'data_type'] = 'category'
+        assert not (tbl2.dfColInfo['data_type'] == 'category').any()
+        assert not (cinfo.df['data_type'] == 'category').any()
+
+        # Adding a column doesn't warn (own copy, not a view of cinfo.df)
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            tbl1.dfColInfo['date_format'] = None
+
+        # In-place edits of cinfo.df are picked up
+        cinfo.df.loc[16, 'data_type'] = 'float64'
+        assert cinfo.GetTblColInfo('ExampleTbl2').loc[16, 'data_type'] == 'float64'
+
+        # Replacing cinfo.df re-indexes
+        cinfo.df = cinfo.df.iloc[:5]
+        assert len(cinfo.GetTblColInfo('ExampleTbl2')) == 0
+        assert len(cinfo.GetTblColInfo('ModelRaw')) == 5
+
     def test_SetTblIndexList(self, tbls1):
         """
         Set tbl's .idx attribute to a list of index columns
@@ -124,6 +186,55 @@ class TestOtherMethods:
         tbls1.col_info.SetTblIndexList(tbls1.ModelRaw)
         assert tbls1.ModelRaw.idx == ['date_wk_start', 'pl_abbr', 'retailer']
 
+"""
+=========================================================================
+ColumnPlan Procedure
+=========================================================================
+"""
+class TestColumnPlan:
+    def test_CompileColPlan(self, cinfo_no_init, tbls1):
+        """
+        Return ColumnPlan of rename map, keep columns, data types and index
+        10/17/26
+        """
+        plan = cinfo_no_init.CompileColPlan(tbls1.ModelRaw)
+        assert isinstance(plan, ColumnPlan)
+        assert dict(plan.rename_map) == {'ABBREV':'pl_abbr', 'DATE':'date_wk_start',
+            'RETAILER':'retailer', 'units_redeemed':'units_redeemed'}
+        assert plan.keep_cols == ('date_wk_start', 'pl_abbr', 'retailer', 'units_redeemed')
+        assert dict(plan.dtypes) == {'pl_abbr':'str', 'date_wk_start':'dt.date',
+            'retailer':'str', 'units_redeemed':'float64'}
+        assert plan.idx == ('date_wk_start', 'pl_abbr', 'retailer')
+
+        # Plan is immutable
+        with pytest.raises(TypeError):
+            plan.rename_map['DUMMY'] = 'dummy'
+
+    def test_SetTblColPlan(self, cinfo_no_init, tbls1):
+        """
+        Compile tbl.col_plan on first use and reuse it
+        10/17/26
+        """
+        tbl = tbls1.ModelRaw
+        assert tbl.col_plan is None
+        plan = cinfo_no_init.SetTblColPlan(tbl)
+        assert tbl.col_plan is plan
+        assert cinfo_no_init.SetTblColPlan(tbl) is plan
+
+        # Cleanup reuses cached plan; SetTblColInfo resets it
+        cinfo_no_init.CleanupImportedDataProcedure(tbl)
+        assert tbl.col_plan is plan
+        tbl.SetTblColInfo(tbls1.col_info)
+        assert tbl.col_plan is None
+
+        # In-place edit of .dfColInfo recompiles the plan
+        plan = cinfo_no_init.SetTblColPlan(tbl)
+        tbl.dfColInfo.loc[tbl.dfColInfo['cols'] == 'retailer', 'data_type'] = 'category'
+        plan2 = cinfo_no_init.SetTblColPlan(tbl)
+        assert not plan2 is plan
+        assert plan2.dtypes['retailer'] == 'category'
+        assert cinfo_no_init.SetTblColPlan(tbl) is plan2
+
 
 class TestColInfoCleanupImportedSales:
     def test_CleanupImportedDataProcedure1(self, cinfo_no_init, tbls1):
@@ -180,6 +291,96 @@ class TestColInfoCleanupImportedSales:
         assert tbls1.ModelRaw.df['date_wk_start'].apply(lambda x: isinstance(x, dt.date)).all()
         assert tbls1.ModelRaw.df['units_redeemed'].apply(lambda x: isinstance(x, float)).all()
 
+    def test_SetTblDataTypesBatched(self, cinfo_no_init, tbls1):
+        """
+        Set data types in one pass (default) identical to column-by-column
+        conversion (dImportParams['batch_dtypes']=False)
+        10/17/26
+        """
+        tbl = tbls1.ModelRaw
+        df_raw = tbl.df.copy()
+        tbl.dImportParams = {'batch_dtypes':False}
+        cinfo_no_init.CleanupImportedDataProcedure(tbl)
+        df_expected = tbl.df
+
+        tbl.df, tbl.dImportParams = df_raw, {}
+        cinfo_no_init.CleanupImportedDataProcedure(tbl)
+        pd.testing.assert_frame_equal(tbl.df, df_expected)
+
+    @pytest.mark.parametrize('batch_dtypes', [False, True])
+    def test_SetTblDataTypes_date_format(self, cinfo_no_init, tbls1, batch_dtypes):
+        """
+        Compact 'date' data_type and explicit date_format from dfColInfo
+        10/17/26
+        """
+        tbl = tbls1.ModelRaw
+        tbl.dImportParams = {'batch_dtypes':batch_dtypes}
+        tbl.df['DATE'] = 2 * ['04/01/2025', '04/08/2025', '04/15/2025']
+        fil = tbl.dfColInfo['cols'] == 'date_wk_start'
+        tbl.dfColInfo.loc[fil, 'data_type'] = 'date'
+        tbl.dfColInfo.loc[fil, 'date_format'] = '%m/%d/%Y'
+
+        cinfo_no_init.CleanupImportedDataProcedure(tbl)
+        ser = tbl.df['date_wk_start']
+        assert ser.dtype == 'datetime64[s]'
+        assert ser.iloc[2] == pd.Timestamp('2025-04-15')
+        assert tbl.df['units_redeemed'].dtype == float
+
+    def test_ConvertDateCol(self, cinfo_no_init):
+        """
+        Convert str dates to DATE_TYPES data_type with optional date_format
+        10/17/26
+        """
+        ser = pd.Series(['2025-04-01 10:30', '2025-04-08 00:00'])
+        ser_dt = cinfo_no_init.ConvertDateCol(ser, 'datetime')
+        assert ser_dt.iloc[0] == pd.Timestamp('2025-04-01 10:30')
+        ser_d = cinfo_no_init.ConvertDateCol(ser, 'date', '%Y-%m-%d %H:%M')
+        assert ser_d.dtype == 'datetime64[s]'
+        assert ser_d.iloc[0] == pd.Timestamp('2025-04-01')
+        ser_obj = cinfo_no_init.ConvertDateCol(ser, 'dt.date')
+        assert ser_obj.iloc[1] == dt.date(2025, 4, 8)
+
+    @pytest.mark.parametrize('batch_dtypes', [False, True])
+    def test_SetTblDataTypes_memory_types(self, tbls1, batch_dtypes):
+        """
+        'category', 'string[pyarrow]' and 'auto_downcast' data_types with
+        bytes saved report
+        10/17/26
+        """
+        cinfo = tbls1.col_info
+        tbl = tbls1.ModelRaw
+        tbl.dImportParams = {'batch_dtypes':batch_dtypes, 'report_bytes_saved':True}
+        dTypes = {'pl_abbr':'category', 'retailer':'string[pyarrow]',
+            'units_redeemed':'auto_downcast'}
+        for col, data_type in dTypes.items():
+            tbl.dfColInfo.loc[tbl.dfColInfo['cols'] == col, 'data_type'] = data_type
+
+        cinfo.CleanupImportedDataProcedure(tbl)
+        assert isinstance(tbl.df['pl_abbr'].dtype, pd.CategoricalDtype)
+        assert tbl.df['retailer'].dtype == 'string[pyarrow]'
+        assert tbl.df['units_redeemed'].dtype == 'float32'
+
+        df = cinfo.BytesSavedReport()
+        assert df.index.tolist() == ['ModelRaw']
+        assert df.loc['ModelRaw', 'bytes_saved'] > 0
+        assert df.loc['ModelRaw', 'bytes_saved'] == \
+            df.loc['ModelRaw', 'bytes_before'] - df.loc['ModelRaw', 'bytes_after']
+
+    def test_DowncastNumericCol(self, cinfo_no_init):
+        """
+        Downcast to smallest safe numeric width
+        10/17/26
+        """
+        ser = cinfo_no_init.DowncastNumericCol(pd.Series(['1', '2', '300']))
+        assert ser.dtype == 'int16'
+        ser = cinfo_no_init.DowncastNumericCol(pd.Series([1.5, np.nan, 100.25]))
+        assert ser.dtype == 'float32'
+
+        # float64 kept if float32 would lose precision
+        ser = cinfo_no_init.DowncastNumericCol(pd.Series([0.1, 2.]))
+        assert ser.dtype == 'float64'
+        assert ser.iloc[0] == 0.1
+
     def test_tbls1_fixture(self, files, tbls1):
         """
         Check Raw Data
@@ -0,0 +1,195 @@
+# Version 10/17/26
+import sys, os, time
+import pandas as pd
+import numpy as np
+import pytest
+import datetime as dt
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from projfiles import Files
+import df_cache
+from df_cache import DfCache
+
+@pytest.fixture
+def files():
+    return Files(IsTest=True, subdir_tests='test_data')
+
+@pytest.fixture
+def cache(tmp_path):
+    return DfCache(str(tmp_path) + os.sep, max_mb=None)
+
+@pytest.fixture
+def df_typed():
+    """ df with types that round-trip through Arrow """
+    return pd.DataFrame({'pl_abbr':['ProdA', None, 'ProdB'],
+        'units':[1.0, np.nan, 3.0],
+        'date1':[dt.date(2025, 4, 1), dt.date(2025, 4, 8), None],
+        'date2':pd.to_datetime(3 * ['2025-04-01'])})
+
+@pytest.fixture
+def df_raw():
+    """ Unstructured raw df (positional col names; mixed types) """
+    return pd.DataFrame([[np.nan, 'flag', 1], ['Stuff', 2.5, None]])
+
+"""
+================================================================================
+DfCache Class
+================================================================================
+"""
+class TestDfCache:
+    def test_ReadDfs(self, cache, df_typed, df_raw):
+        """
+        Return key's list of df's (or None if not cached)
+        10/17/26
+        """
+        assert cache.ReadDfs('abc') is None
+        cache.WriteDfs('abc', [df_typed, df_raw])
+        lst_dfs = cache.ReadDfs('abc')
+        pd.testing.assert_frame_equal(lst_dfs[0], df_typed)
+        pd.testing.assert_frame_equal(lst_dfs[1], df_raw)
+
+    def test_WriteDfs(self, cache, df_typed, df_raw):
+        """
+        Write key's list of df's and then its .json (marks entry complete)
+        10/17/26
+        """
+        cache.WriteDfs('abc', [df_typed, df_raw], dMeta={'sheet':'data'})
+        assert cache.IsEntry('abc')
+        dEntry = cache.ReadEntry('abc')
+        assert dEntry['files'] == ['abc_0.arrow', 'abc_1.pkl']
+        assert dEntry['meta'] == {'sheet':'data'}
+
+    def test_DeleteEntry(self, cache, df_typed):
+        """
+        Delete key's .json and df files if they exist
+        10/17/26
+        """
+        cache.WriteDfs('abc', [df_typed])
+        cache.DeleteEntry('abc')
+        assert not cache.IsEntry('abc')
+        assert os.listdir(cache.path_cache) == []
+
+    def test_ListKeys(self, cache, df_typed):
+        """
+        Return list of entry keys sorted from least- to most-recently used
+        10/17/26
+        """
+        for key in ['k1', 'k2', 'x3']:
+            cache.WriteDfs(key, [df_typed])
+            os.utime(cache.path_cache + key + '.json', (time.time(), time.time()))
+            time.sleep(0.01)
+
+        # Reading k1 makes it most recently used
+        cache.ReadDfs('k1')
+        assert cache.ListKeys() == ['k2', 'x3', 'k1']
+        assert cache.ListKeys(prefix='k') == ['k2', 'k1']
+
+    def test_EvictToMaxSize(self, cache, df_typed):
+        """
+        Delete least-recently-used entries until cache is within .max_mb
+        10/17/26
+        """
+        for key in ['k1', 'k2', 'k3']:
+            cache.WriteDfs(key, [df_typed])
+            time.sleep(0.01)
+
+        # Limit to just over two entries' bytes
+        cache.max_mb = 2.5 * cache.EntryBytes('k1') / 1024**2
+        cache.EvictToMaxSize()
+        assert cache.ListKeys() == ['k2', 'k3']
+
+"""
+================================================================================
+Utility functions
+================================================================================
+"""
+def test_IsArrowRoundTrip(tmp_path, df_typed, df_raw):
+    """
+    Return True if df can be written to Arrow and read back unchanged
+    10/17/26
+    """
+    assert df_cache.IsArrowRoundTrip(df_typed)
+    assert not df_cache.IsArrowRoundTrip(df_raw)
+
+    # NaN blanks in str col would read back as None
+    df = pd.DataFrame({'a':['x', np.nan]})
+    assert not df_cache.IsArrowRoundTrip(df)
+
+    # Non-default index
+    assert not df_cache.IsArrowRoundTrip(df_typed.set_index('pl_abbr'))
+
+    # pyarrow-backed 'string' reads back as python storage (pickled instead)
+    df = pd.DataFrame({'a':pd.array(['x', None], dtype='string[python]')})
+    assert df_cache.IsArrowRoundTrip(df)
+    df = df.astype('string[pyarrow]')
+    assert not df_cache.IsArrowRoundTrip(df)
+    pf = df_cache.WriteDfFile(df, str(tmp_path / 'str'))
+    assert pf.endswith('.pkl') and df_cache.ReadDfFile(pf)['a'].dtype.storage == 'pyarrow'
+
+def test_WriteDfFile(tmp_path, df_typed, df_raw):
+    """
+    Write df to Arrow IPC if it round-trips exactly; else to pickle
+    10/17/26
+    """
+    pf_base = str(tmp_path) + os.sep + 'df'
+    assert df_cache.WriteDfFile(df_typed, pf_base).endswith('.arrow')
+    assert df_cache.WriteDfFile(df_raw, pf_base).endswith('.pkl')
+
+def test_ReadDfFile(tmp_path, df_typed):
+    """
+    Read df written by WriteDfFile (Arrow files optionally memory-mapped)
+    10/17/26
+    """
+    pf = df_cache.WriteDfFile(df_typed, str(tmp_path) + os.sep + 'df')
+    pd.testing.assert_frame_equal(df_cache.ReadDfFile(pf), df_typed)
+    pd.testing.assert_frame_equal(df_cache.ReadDfFile(pf, IsMemoryMap=False), df_typed)
+
+def test_FingerprintFile(files, tmp_path):
+    """
+    Return tuple identifying file contents
+    10/17/26
+    """
+    pf = files.path_data + 'Example2.csv'
+    tup = df_cache.FingerprintFile(pf)
+    assert tup[0] == os.path.abspath(pf)
+    assert tup[1] == os.path.getsize(pf)
+    assert len(df_cache.FingerprintFile(pf, IsHash=True)) == 4
+
+def test_HashKey():
+    """
+    Return a filename-safe key (sha1 hex) from repr of args
+    10/17/26
+    """
+    key = df_cache.HashKey(('a', 1), {'import_dtype':str})
+    assert len(key) == 40
+    assert key == df_cache.HashKey(('a', 1), {'import_dtype':str})
+    assert key != df_cache.HashKey(('a', 2), {'import_dtype':str})
+
+def test_HashDf(df_typed, df_raw):
+    """
+    Return sha1 hex of df's contents
+    10/17/26
+    """
+    key = df_cache.HashDf(df_typed)
+    assert key == df_cache.HashDf(df_typed.copy())
+    assert key != df_cache.HashDf(df_typed.iloc[::-1])
+    assert key != df_cache.HashDf(df_typed.astype({'units':'float32'}))
+    df = pd.DataFrame({'a':pd.array(['x', None], dtype='string[python]')})
+    assert df_cache.HashDf(df) != df_cache.HashDf(df.astype('string[pyarrow]'))
+    assert len(df_cache.HashDf(df_raw)) == 40
+
+def test_files_path_cache(files):
+    """
+    Test - files.path_cache is cache folder within test data folder
+    10/17/26
+    """
+    assert files.path_cache == files.path_data + 'cache' + os.sep
+
+def test_files_path_snapshot(files):
+    """
+    Test - files.path_snapshot is snapshot folder within test data folder
+    10/17/26
+    """
+    assert files.path_snapshot == files.path_data + 'snapshot' + os.sep
@@ -1,4 +1,4 @@
-#Version 5/29/25
+#Version 10/17/26
 #python -m pytest test_parsetables.py -v -s
 import sys, os
 import pandas as pd
@@ -121,6 +121,78 @@ class TestParseRawData:
             print(f'\nParsed df\n{tbls_both.Survey.df}\n\n')
             print(tbls_both.Survey.df.info(), '\n')
 
+    @pytest.mark.parametrize('n_workers', [1, 2])
+    def test_ImportToTblDf_parse_on_read(self, tbls_both, n_workers):
+        """
+        With dParseParams['parse_on_read'], ImportToTblDf parses each raw df as
+        it is read (same .df as ImportToTblDf + ParseRawData; no .lst_dfs)
+        10/17/26
+        """
+        lst_files = 2 * ['interleaved_test_data.xlsx']
+        tbls_both.Promos.ImportToTblDf(lst_files=lst_files)
+        tbls_both.Promos.ParseRawData()
+        df_expected = tbls_both.Promos.df
+
+        tbls_both.Promos.df = pd.DataFrame()
+        tbls_both.Promos.dParseParams['parse_on_read'] = True
+        tbls_both.Promos.dImportParams['n_workers'] = n_workers
+        tbls_both.Promos.ImportToTblDf(lst_files=lst_files)
+        pd.testing.assert_frame_equal(tbls_both.Promos.df, df_expected)
+        assert tbls_both.Promos.lst_dfs == []
+        assert tbls_both.Promos.lst_dfs_parsed == []
+
+    def test_AppendDfTemp(self, tbls_both):
+        """
+        Append .df_temp to .lst_dfs or, if .IsParseOnRead, parse it and append
+        the parsed df to .lst_dfs_parsed
+        10/17/26
+        """
+        tbls_both.Survey.ImportToTblDf(lst_files='tbl1_survey.xlsx')
+        df_raw = tbls_both.Survey.lst_dfs[0]
+
+        tbls_both.Survey.df_temp = df_raw
+        tbls_both.Survey.AppendDfTemp()
+        assert len(tbls_both.Survey.lst_dfs) == 2
+
+        tbls_both.Survey.IsParseOnRead = True
+        tbls_both.Survey.AppendDfTemp()
+        assert len(tbls_both.Survey.lst_dfs) == 2
+        assert len(tbls_both.Survey.lst_dfs_parsed) == 1
+        assert len(tbls_both.Survey.lst_dfs_parsed[0]) == 11
+
+    def test_ParseRawData_parallel(self, tbls_both):
+        """
+        ParseRawData with dParseParams['n_workers'] > 1 gives same .df as serial
+        10/17/26
+        """
+        tbls_both.Survey.ImportToTblDf(lst_files='tbl1_survey.xlsx')
+        tbls_both.Survey.lst_dfs = 3 * tbls_both.Survey.lst_dfs
+        tbls_both.Survey.ParseRawData()
+        df_serial = tbls_both.Survey.df
+
+        tbls_both.Survey.df = pd.DataFrame()
+        tbls_both.Survey.dParseParams['n_workers'] = 2
+        tbls_both.Survey.ParseRawData()
+        pd.testing.assert_frame_equal(tbls_both.Survey.df, df_serial)
+        assert tbls_both.Survey.dParseErrors == {}
+
+    def test_ParseRawDataParallel(self, tbls_both):
+        """
+        Parse .lst_dfs in a process pool; failures recorded by .lst_dfs index
+        and raised together as RuntimeError
+        10/17/26
+        """
+        tbls_both.Survey.ImportToTblDf(lst_files='tbl1_survey.xlsx')
+        df_raw = tbls_both.Survey.lst_dfs[0]
+        tbls_both.Survey.lst_dfs = [df_raw, df_raw.iloc[:, :0], df_raw]
+        tbls_both.Survey.dParseParams['n_workers'] = 2
+
+        with pytest.raises(RuntimeError, match='parse failed for 1 of 3'):
+            tbls_both.Survey.ParseRawData()
+        assert list(tbls_both.Survey.dParseErrors.keys()) == [1]
+        assert isinstance(tbls_both.Survey.dParseErrors[1], IndexError)
+        assert tbls_both.Survey.df.empty
+
 """
 ===============================================================================
 Test Class parsefiles.ParseColMajorTbl (6/6/25)
@@ -175,6 +247,38 @@ class TestParseColMajorTbl:
             print('\n', parse_cm.df, '\n')
             print(parse_cm.df.info())
 
+    def test_ParseDfRawProcedure_ColMajor_vectorized(self, tbls_cm):
+        """
+        Vectorized engine gives same parsed df as iterative engine
+        10/17/26
+        """
+        tbls_cm.ColMajor.ImportToTblDf()
+        tbls_cm.ColMajor.df_raw = tbls_cm.ColMajor.lst_dfs[0]
+        parse_iter = parsetables.ParseColMajorTbl(tbls_cm.ColMajor)
+        parse_iter.ParseDfRawProcedure()
+
+        tbls_cm.ColMajor.dParseParams['parse_engine'] = 'vectorized'
+        parse_vec = parsetables.ParseColMajorTbl(tbls_cm.ColMajor)
+        parse_vec.ParseDfRawProcedure()
+        pd.testing.assert_frame_equal(parse_vec.df, parse_iter.df)
+
+    def test_TransferAllColsVectorized(self, parse_cm):
+        """
+        Transfer all data columns to self.lst_dfs_parsed as one df
+        10/17/26
+        """
+        parse_cm.FindDataBoundaries()
+        parse_cm.SetDfCategories()
+        parse_cm.TransferAllColsVectorized()
+        assert len(parse_cm.lst_dfs_parsed) == 1
+
+        parse_cm.ConcatParsedDfs()
+        assert list(parse_cm.df.columns) == ['col_header', 'category', 'value']
+        assert parse_cm.df['category'].tolist() == 3 * ['category1', 'category2']
+        assert parse_cm.df['value'].tolist() == [10, 50, 20, 60, 30, 70]
+        expected = 2 * [dt.date(2017,9,2)] + 2 * [dt.date(2017,9,9)] + 2 * [dt.date(2017,9,16)]
+        assert parse_cm.df['col_header'].dt.date.tolist() == expected
+
     def test_TransferAllCols(self, parse_cm):
         """
         Iterate over data columns and transfer their data to self.df.
@@ -182,6 +286,8 @@ class TestParseColMajorTbl:
         parse_cm.FindDataBoundaries()
         parse_cm.SetDfCategories()
         parse_cm.TransferAllCols()
+        assert len(parse_cm.lst_dfs_parsed) == 3
+        parse_cm.ConcatParsedDfs()
         assert parse_cm.df.shape[0] == 6
         assert parse_cm.df['category'].tolist() == 3 * ['category1', 'category2']
         assert parse_cm.df['value'].tolist() == [10, 50, 20, 60, 30, 70]
@@ -202,6 +308,7 @@ class TestParseColMajorTbl:
         # Set idx_col_cur to 1 (first date column in test data)
         parse_cm.idx_col_cur = 1
         parse_cm.ReadWriteColData()
+        parse_cm.ConcatParsedDfs()
 
         # Check that .df has 2 rows and correct columns
         assert parse_cm.df.shape[0] == 2
@@ -211,6 +318,22 @@ class TestParseColMajorTbl:
         assert parse_cm.df['category'].tolist() == ['category1', 'category2']
         assert parse_cm.df['value'].tolist() == [10, 50]
 
+    def test_ConcatParsedDfs(self, parse_cm):
+        """
+        Concatenate parsed pieces into self.df in one step and reset the list
+        10/17/26
+        """
+        parse_cm.FindDataBoundaries()
+        parse_cm.SetDfCategories()
+        for parse_cm.idx_col_cur in [1, 2]:
+            parse_cm.ReadWriteColData()
+        assert parse_cm.df.empty
+
+        parse_cm.ConcatParsedDfs()
+        assert parse_cm.lst_dfs_parsed == []
+        assert parse_cm.df['value'].tolist() == [10, 50, 20, 60]
+        assert parse_cm.df.index.tolist() == [0, 1, 2, 3]
+
     def test_SetDfCategories(self, parse_cm):
         """
         Set list of categories from the first column between data start and end
@@ -300,6 +423,40 @@ class TestInterleavedColBlocks:
         if IsPrint: print('\n', parse_int.df)
         assert len(parse_int.df) == 48
 
+    def test_ParseDfRawProcedure_vectorized(self, tbls):
+        """
+        Test - vectorized engine gives same parsed df as iterative engine
+        10/17/26
+        """
+        tbls.Promos.ImportToTblDf()
+        tbls.Promos.df_raw = tbls.Promos.lst_dfs[0]
+        parse_iter = parsetables.InterleavedColBlocksTbl(tbls.Promos)
+        parse_iter.ParseDfRawProcedure()
+
+        tbls.Promos.dParseParams['parse_engine'] = 'vectorized'
+        parse_vec = parsetables.InterleavedColBlocksTbl(tbls.Promos)
+        assert parse_vec.parse_engine == 'vectorized'
+        parse_vec.ParseDfRawProcedure()
+        pd.testing.assert_frame_equal(parse_vec.df, parse_iter.df)
+
+    def test_TransferAllBlocksVectorized(self, parse_int):
+        """
+        Test - Transfer all blocks of columns to .lst_dfs_parsed as one
+        long-format df
+        10/17/26
+        """
+        parse_int.SetDfMetadata()
+        parse_int.DeleteTrailingRows()
+        parse_int.TransferAllBlocksVectorized()
+        assert len(parse_int.lst_dfs_parsed) == 1
+
+        parse_int.ConcatParsedDfs()
+        assert len(parse_int.df) == 48
+        assert parse_int.df.loc[0, 'values'] == 500
+        assert parse_int.df.loc[12, 'var_name'] == 'Redemption Budget Used'
+        assert parse_int.df.loc[47, 'values'] == 600
+        assert parse_int.df.loc[47, 'Offer Group Name'] == 'Item 12'
+
     def test_TransferAllBlocks(self, parse_int):
         """
         Test - TransferAllBlocks method
@@ -307,6 +464,7 @@ class TestInterleavedColBlocks:
         parse_int.SetDfMetadata()
         parse_int.DeleteTrailingRows()
         parse_int.TransferAllBlocks()
+        parse_int.ConcatParsedDfs()
 
         # Check that .df has expected number of rows
         assert len(parse_int.df) == 48
@@ -324,6 +482,7 @@ class TestInterleavedColBlocks:
         # Set the current column index and call method
         parse_int.idx_col_cur = 4
         parse_int.ReadWriteBlock()
+        parse_int.ConcatParsedDfs()
 
         assert len(parse_int.df) == 24
         assert parse_int.df.loc[0, 'Offer Group Name'] == 'Item 1'
@@ -354,6 +513,7 @@ class TestInterleavedColBlocks:
         parse_int.block_name_cur = parse_int.df_raw.loc[0, parse_int.idx_col_block_cur]
         parse_int.idx_col_cur = 4
         parse_int.ReadWriteColData()
+        parse_int.ConcatParsedDfs()
 
         assert len(parse_int.df) == 12
         assert parse_int.df.loc[0, 'Offer Group Name'] == 'Item 1'
@@ -368,6 +528,7 @@ class TestInterleavedColBlocks:
         # Increment to next column and re-run
         parse_int.idx_col_cur = 5
         parse_int.ReadWriteColData()
+        parse_int.ConcatParsedDfs()
         assert len(parse_int.df) == 24
         assert parse_int.df.loc[12, 'var_name'] == 'Redemption Budget Used'
         assert parse_int.df.loc[23, 'var_name'] == 'Redemption Budget Used'
@@ -527,6 +688,7 @@ class TestParseRowMajorTbl1Survey:
         """
         SetListFirstStartBoundIndex(row_maj_tbl1_survey)
         row_maj_tbl1_survey.ParseBlockProcedure()
+        row_maj_tbl1_survey.ConcatParsedDfs()
 
         #Check resulting .df relative to tbl1_survey.xlsx
         assert len(row_maj_tbl1_survey.df) == 5
@@ -553,6 +715,7 @@ class TestParseRowMajorTbl1Survey:
         assert row_maj_tbl1_survey.idx_start_current == 24
 
         row_maj_tbl1_survey.ParseBlockProcedure()
+        row_maj_tbl1_survey.ConcatParsedDfs()
 
         if IsPrint: print('\n\n', row_maj_tbl1_survey.df, '\n')
 
@@ -597,6 +760,90 @@ class TestParseRowMajorTbl1Survey:
         lst_expected = ['Answer Choices', 'Response Percent', 'Responses', None, None, None]
         check_series_values(row_maj_tbl1_survey.cols_df_block, lst_expected)
 
+    def test_survey_ParseDfRawProcedure_vectorized(self, tbl1_survey):
+        """
+        Vectorized engine gives same parsed df as iterative engine (and
+        doesn't add trailing blank row to .df_raw)
+        10/17/26
+        """
+        tbl1_survey.dParseParams['block_id_vars'] = ('question_text', -2, 0)
+        tbl1_survey.df_raw = tbl1_survey.lst_dfs[0]
+        parse_iter = parsetables.RowMajorTbl(tbl1_survey)
+        parse_iter.ParseDfRawProcedure()
+
+        tbl1_survey.dParseParams['parse_engine'] = 'vectorized'
+        parse_vec = parsetables.RowMajorTbl(tbl1_survey)
+        parse_vec.ParseDfRawProcedure()
+        pd.testing.assert_frame_equal(parse_vec.df, parse_iter.df)
+        assert parse_vec.df_raw.shape == (28, 4)
+
+    def test_survey_ParseDfRawProcedure_vectorized_blank_ids(self, tbl1_survey):
+        """
+        Vectorized engine gives iterative engine's block ID dtype when IDs
+        are None and the last block reads the virtual trailing blank row
+        10/17/26
+        """
+        tbl1_survey.dParseParams['block_id_vars'] = ('blank', 3, 3)
+        tbl1_survey.df_raw = tbl1_survey.lst_dfs[0]
+        parse_iter = parsetables.RowMajorTbl(tbl1_survey)
+        parse_iter.ParseDfRawProcedure()
+
+        tbl1_survey.dParseParams['parse_engine'] = 'vectorized'
+        tbl1_survey.df_raw = tbl1_survey.lst_dfs[0]
+        parse_vec = parsetables.RowMajorTbl(tbl1_survey)
+        parse_vec.ParseDfRawProcedure()
+        assert parse_vec.df['blank'].dtype == object
+        pd.testing.assert_frame_equal(parse_vec.df, parse_iter.df)
+
+    def test_survey_SetBlockBoundsVectorized(self, row_maj_tbl1_survey):
+        """
+        Set arrays of header, first data and end bound row indices for all blocks
+        (last block ends at virtual trailing blank row)
+        10/17/26
+        """
+        row_maj_tbl1_survey.SetStartBoundIndices()
+        row_maj_tbl1_survey.SetBlockBoundsVectorized()
+        assert row_maj_tbl1_survey.idx_header_rows.tolist() == [3, 14, 24]
+        assert row_maj_tbl1_survey.idx_start_data_rows.tolist() == [4, 15, 25]
+        assert row_maj_tbl1_survey.idx_end_bounds.tolist() == [9, 18, 28]
+
+        # String end flag: block is empty if flag not found below first data row
+        row_maj_tbl1_survey.tbl.dParseParams['flag_end_bound'] = 'Rarely'
+        row_maj_tbl1_survey.SetBlockBoundsVectorized()
+        assert row_maj_tbl1_survey.idx_end_bounds.tolist() == [8, 15, 25]
+
+    def test_survey_TransferAllBlocksVectorized(self, row_maj_tbl1_survey):
+        """
+        Append all blocks' data rows to .lst_dfs_parsed as one df
+        10/17/26
+        """
+        row_maj_tbl1_survey.SetStartBoundIndices()
+        row_maj_tbl1_survey.SetBlockBoundsVectorized()
+        row_maj_tbl1_survey.TransferAllBlocksVectorized()
+        assert len(row_maj_tbl1_survey.lst_dfs_parsed) == 1
+
+        df = row_maj_tbl1_survey.lst_dfs_parsed[0]
+        assert len(df) == 11
+        assert list(df.columns) == ['Answer Choices', 'Response Percent', 'Responses', '1', '2', '3']
+        assert df.iloc[5].tolist()[:2] == ['Turtle Wax', '46.45%']
+        assert df.iloc[-1].tolist()[3:] == ['18', '11', '17']
+
+    def test_survey_BlockIDValuesVectorized(self, row_maj_tbl1_survey):
+        """
+        Return dict of block_id name and array of its value for each block
+        10/17/26
+        """
+        row_maj_tbl1_survey.lst_block_ids = [('question_text', -2, 0)]
+        row_maj_tbl1_survey.SetStartBoundIndices()
+        row_maj_tbl1_survey.SetBlockBoundsVectorized()
+        dBlockIDs = row_maj_tbl1_survey.BlockIDValuesVectorized()
+        assert dBlockIDs['question_text'][1] == 'Q2. What brands of car wash cleaner do you use'
+        assert len(dBlockIDs['question_text']) == 3
+
+        # Offset to virtual trailing blank row
+        row_maj_tbl1_survey.lst_block_ids = [('blank', 3, 0)]
+        assert pd.isna(row_maj_tbl1_survey.BlockIDValuesVectorized()['blank'][2])
+
     def test_survey_FindFlagEndBound(self, row_maj_tbl1_survey):
         """
         Find index of flag_end_bound row
@@ -730,6 +977,8 @@ class TestParseRowMajorTbl1Raw:
         # Set first (only for tbl1) index as current and Parse the block
         row_maj_tbl1.idx_start_current = row_maj_tbl1.start_bound_indices[0]
         row_maj_tbl1.ParseBlockProcedure()
+        assert len(row_maj_tbl1.lst_dfs_parsed) == 1
+        row_maj_tbl1.ConcatParsedDfs()
 
         assert row_maj_tbl1.df.shape == (5, 4)
         assert row_maj_tbl1.df_raw.shape == (14, 5)
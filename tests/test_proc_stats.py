@@ -0,0 +1,223 @@
+# Version 10/17/26
+import sys, os
+import pandas as pd
+import numpy as np
+import pytest
+import threading, tracemalloc
+
+# Add libs folder to sys.path and import project-specific modules
+libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
+sys.path.insert(0, os.path.abspath(libs_path))
+from projfiles import Files
+from projtables import ProjectTables, Table
+import proc_stats
+from proc_stats import ProcStats
+
+@pytest.fixture
+def files():
+    return Files(IsTest=True, subdir_tests='test_data')
+
+@pytest.fixture
+def tbls_stats(files):
+    """
+    ProjectTables with instrumentation on (stopped after test)
+    """
+    tbls_stats = ProjectTables(files, UseColInfo=True, IsInstrument=True)
+    yield tbls_stats
+    tbls_stats.StopInstrument()
+
+@pytest.fixture
+def df_survey():
+    """
+    Raw unstructured df with three RowMajorTbl blocks (2, 3 and 1 data rows)
+    """
+    lst_rows = []
+    for i, n in enumerate([2, 3, 1]):
+        lst_rows += [[f'Question {i}', None, None], [None, None, None],
+            ['Answer Choices', 'Responses', 'Count']]
+        lst_rows += [[f'Answer {j}', str(j), str(10 * j)] for j in range(n)]
+        lst_rows += [[None, None, None]]
+    return pd.DataFrame(lst_rows, dtype=object)
+
+"""
+================================================================================
+ProcStats Class and instrument decorator
+================================================================================
+"""
+def test_instrument_inactive(files):
+    """
+    With no collector, decorated methods call straight through
+    10/17/26
+    """
+    tbl = Table('CSVFile', dImportParams={'ftype':'csv', 'import_path':files.path_data,
+        'lst_files':'Example2.csv'})
+    assert tbl.proc_stats is None
+    tbl.ImportToTblDf()
+    assert len(tbl.df) == 6 and tbl.pf is None
+    assert ProjectTables(files).dfProcStats is None
+
+def test_StartStop():
+    """
+    Start starts recording and tracemalloc; tracemalloc is stopped by the
+    last running collector's Stop
+    10/17/26
+    """
+    stats = ProcStats().Start()
+    stats2 = ProcStats().Start()
+    assert stats.IsActive and tracemalloc.is_tracing()
+    stats.Stop()
+    assert not stats.IsActive and tracemalloc.is_tracing()
+    stats2.Stop()
+    assert not tracemalloc.is_tracing()
+
+def test_StopInstrument(files, tbls_stats):
+    """
+    Only Tables of the instrumented tbls are recorded, until StopInstrument
+    (also stopped when tbls is freed)
+    10/17/26
+    """
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+    tbls = ProjectTables(files)
+    tbls.CSVFile = Table('CSVFile', dImportParams=d)
+    tbls.CSVFile.ImportToTblDf()
+    Table('CSVFile', dImportParams=d).ImportToTblDf()
+    assert len(tbls_stats.dfProcStats) == 0
+
+    tbls_stats.CSVFile = Table('CSVFile', dImportParams=d)
+    tbls_stats.CSVFile.ImportToTblDf()
+    n_records = len(tbls_stats.dfProcStats)
+    assert n_records > 0
+    tbls_stats.StopInstrument()
+    tbls_stats.CSVFile.ImportToTblDf()
+    assert len(tbls_stats.dfProcStats) == n_records and not tracemalloc.is_tracing()
+
+    tbls2 = ProjectTables(files, IsInstrument=True)
+    assert tracemalloc.is_tracing()
+    del tbls2
+    assert not tracemalloc.is_tracing()
+
+def test_RunCall_threads(files):
+    """
+    Calls overlapping another thread's calls get no peak_bytes (tracemalloc
+    peak is process-wide); oldest records dropped beyond max_records
+    10/17/26
+    """
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+    stats = ProcStats(max_records=5).Start()
+    tbl1, tbl2 = Table('A', dImportParams=d), Table('B', dImportParams=d)
+    tbl1.proc_stats = tbl2.proc_stats = stats
+
+    # Both threads wait inside ImportToTblDf until the other is also inside
+    barrier = threading.Barrier(2)
+    def SetLstFiles(lst_files=None):
+        barrier.wait()
+        return [files.path_data + 'Example2.csv']
+    tbl1.SetLstFiles = tbl2.SetLstFiles = SetLstFiles
+    lst_threads = [threading.Thread(target=tbl.ImportToTblDf) for tbl in [tbl1, tbl2]]
+    for thread in lst_threads: thread.start()
+    for thread in lst_threads: thread.join()
+    stats.Stop()
+
+    df = stats.df
+    assert len(df) == 5
+    ser = df.set_index(['proc', 'tbl'])['peak_bytes']
+    assert pd.isna(ser.loc[('Table.ImportToTblDf', 'A')])
+    assert pd.isna(ser.loc[('Table.ImportToTblDf', 'B')])
+
+def test_dfProcStats_Import(files, tbls_stats):
+    """
+    Import records by file with nesting depth, file bytes in and rows out of
+    each file (rows appended to .lst_dfs during the call)
+    10/17/26
+    """
+    d = {'ftype':'csv', 'import_path':files.path_data,
+        'lst_files':['Example2a.csv', 'Example2b.csv']}
+    tbls_stats.CSVFile = Table('CSVFile', dImportParams=d)
+    tbls_stats.CSVFile.ImportToTblDf()
+    df = tbls_stats.dfProcStats
+    assert list(df.columns) == proc_stats.COLS_RECORD
+
+    df_read = df[df['proc'] == 'Table.ReadFile']
+    assert list(df_read['file']) == ['Example2a.csv', 'Example2b.csv']
+    assert list(df_read['rows_out']) == [2, 4] and df_read['rows_in'].isna().all()
+    assert list(df_read['bytes_in']) == [os.path.getsize(files.path_data + f)
+        for f in d['lst_files']]
+
+    # Procedure is last record (completes last) at depth 0 with no file
+    ser = df.iloc[-1]
+    assert ser['proc'] == 'Table.ImportToTblDf' and ser['depth'] == 0
+    assert ser['file'] is None and ser['rows_out'] == 6
+    assert (df['wall_s'] >= 0).all() and (df['peak_bytes'] >= 0).all()
+    assert set(df.loc[df['depth'] > 0, 'proc']) == {'Table.ReadFile',
+        'Table.ReadCSVFile', 'Table.AppendDfTemp'}
+
+def test_dfProcStats_Parse(tbls_stats, df_survey):
+    """
+    Parse records: one ParseBlockProcedure per block (rows appended) nested
+    in ParseDfRawProcedure; table inherited from the Table's ParseDfRaw
+    10/17/26
+    """
+    d2 = {'is_unstructured':True, 'parse_type':'RowMajorTbl',
+        'flag_start_bound':'Answer Choices', 'flag_end_bound':'<blank>',
+        'icol_start_bound':0, 'icol_end_bound':0,
+        'iheader_rowoffset_from_flag':0, 'idata_rowoffset_from_flag':1}
+    tbls_stats.Survey = Table('Survey', dParseParams=d2)
+    tbl = tbls_stats.Survey
+    tbl.lst_dfs = [df_survey]
+    tbl.ParseRawData()
+    df = tbls_stats.dfProcStats
+
+    df_block = df[df['proc'] == 'RowMajorTbl.ParseBlockProcedure']
+    assert list(df_block['rows_out']) == [2, 3, 1]
+    assert (df_block['tbl'] == 'Survey').all() and (df_block['depth'] == 3).all()
+    ser = df.set_index('proc').loc['RowMajorTbl.ParseDfRawProcedure']
+    assert ser['rows_in'] == len(df_survey) and ser['rows_out'] == 6
+
+    df_sum = tbls_stats.proc_stats.SummaryDf()
+    assert df_sum.loc[('RowMajorTbl.ParseBlockProcedure', 'Survey'), 'n_calls'] == 3
+    assert df_sum.index[0] == ('Table.ParseRawData', 'Survey')
+
+def test_dfProcStats_Cleanup(files, tbls_stats):
+    """
+    ColumnInfo methods record their Table arg's rows/bytes (lazy build)
+    10/17/26
+    """
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+    tbls_stats.Example2 = Table('ExampleTbl2', dImportParams=d,
+        col_info=tbls_stats.col_info, IsLazy=True)
+    tbls_stats.Example2.df
+    df = tbls_stats.dfProcStats.set_index('proc')
+    ser = df.loc['ColumnInfo.CleanupImportedDataProcedure']
+    assert ser['tbl'] == 'ExampleTbl2' and ser['depth'] == 1
+    assert ser['rows_out'] == 6 and ser['bytes_out'] < ser['bytes_in']
+    assert df.loc['Table.LoadTblProcedure', 'depth'] == 0
+
+def test_instrument_TblArg_keyword(files, tbls_stats):
+    """
+    ColumnInfo methods accept the Table as keyword arg (recorded or not)
+    10/17/26
+    """
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+    tbl = Table('ExampleTbl2', dImportParams=d, col_info=tbls_stats.col_info)
+    tbl.ImportToTblDf()
+    tbls_stats.col_info.CleanupImportedDataProcedure(tbl=tbl)
+    assert tbl.df.columns.tolist() == ['date2', 'col_2a', 'col_2c']
+    assert len(tbls_stats.dfProcStats) == 0
+
+    tbls_stats.Example2 = Table('ExampleTbl2', dImportParams=d, col_info=tbls_stats.col_info)
+    tbls_stats.Example2.ImportToTblDf()
+    tbls_stats.col_info.CleanupImportedDataProcedure(tbl=tbls_stats.Example2)
+    df = tbls_stats.dfProcStats.set_index('proc')
+    assert df.loc['ColumnInfo.CleanupImportedDataProcedure', 'tbl'] == 'ExampleTbl2'
+
+def test_Measure(files):
+    """
+    Measure reads backing ._df so lazy Tables are not loaded
+    10/17/26
+    """
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+    tbl = Table('CSVFile', dImportParams=d, IsLazy=True)
+    stats = ProcStats(IsTraceMem=False)
+    assert stats.Measure(tbl, ('df',), ()) == (0, tbl._df.memory_usage().sum())
+    assert not tbl.IsLoaded
+    assert stats.Measure(tbl, (), ()) == (None, None)
@@ -1,9 +1,10 @@
-# Version 4/21/25
+# Version 10/17/26
 # cd Box\ Sync/Projects/Python_Col_Info/tests
-import sys, os
+import sys, os, time
 import pandas as pd
 import numpy as np
 import pytest
+import datetime as dt
 
 # Add libs folder to sys.path and import project-specific modules
 libs_path = os.path.join(os.path.dirname(__file__), '..', 'libs')
@@ -11,7 +12,9 @@ sys.path.insert(0, os.path.abspath(libs_path))
 from projfiles import Files
 from projtables import ProjectTables
 from projtables import Table
+from projtables import ConvertRawDfToStr, ReadWorksheetRaw
 from col_info import ColumnInfo
+from df_cache import HashDf
 
 IsPrint = True
 
@@ -69,6 +72,409 @@ class TestTableInit:
 
         if IsPrint: print('\n', tbl.dfColInfo)
 
+"""
+================================================================================
+Lazy Table loading (Table.df property and LoadTblProcedure)
+10/17/26
+================================================================================
+"""
+@pytest.fixture
+def tbls_lazy(files):
+    """
+    ProjectTables with two lazy col_info tables (CSV and Excel)
+    10/17/26
+    """
+    tbls_lazy = ProjectTables(files, UseColInfo=True, IsLazy=True)
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+    tbls_lazy.Example2 = Table('ExampleTbl2', dImportParams=d,
+        col_info=tbls_lazy.col_info, IsLazy=tbls_lazy.IsLazy)
+    d = {'ftype':'excel', 'sht':'data', 'import_path':files.path_data,
+        'lst_files':'Example1.xlsx'}
+    tbls_lazy.Example1 = Table('ExampleTbl1', dImportParams=d,
+        col_info=tbls_lazy.col_info, IsLazy=tbls_lazy.IsLazy)
+    return tbls_lazy
+
+class TestLazyTables:
+    @pytest.mark.parametrize('chunksize', [None, 4])
+    def test_LoadTblProcedure(self, tbls_lazy, chunksize):
+        """
+        First .df access imports and cleans up lazy Table (same as eager)
+        10/17/26
+        """
+        tbl = tbls_lazy.Example2
+        if chunksize: tbl.dImportParams['chunksize'] = chunksize
+        assert not tbl.IsLoaded
+        assert tbl._df.empty
+
+        # Eager reference
+        tbl_eager = Table('ExampleTbl2', dImportParams=dict(tbl.dImportParams),
+            col_info=tbls_lazy.col_info)
+        tbl_eager.ImportToTblDf()
+        if not chunksize: tbls_lazy.col_info.CleanupImportedDataProcedure(tbl_eager)
+
+        df = tbl.df
+        assert tbl.IsLoaded
+        assert tbl.idx == ['date2', 'col_2a']
+        pd.testing.assert_frame_equal(df, tbl_eager.df)
+
+        # Memoized
+        assert tbl.df is df
+
+    def test_df_setter(self, tbls_lazy):
+        """
+        Setting .df (or explicit ImportToTblDf) skips lazy build
+        10/17/26
+        """
+        tbl = tbls_lazy.Example2
+        tbl.df = pd.DataFrame({'a':[1]})
+        assert tbl.IsLoaded
+        assert tbl.df.columns.tolist() == ['a']
+
+        tbl = tbls_lazy.Example1
+        tbl.ImportToTblDf()
+        assert tbl.df.columns.tolist()[0] == 'date1_import_name'
+
+    def test_LoadTblProcedure_error(self, tbls_lazy):
+        """
+        Failed lazy build leaves Table unloaded (retried on next access)
+        10/17/26
+        """
+        tbl = tbls_lazy.Example2
+        tbl.dImportParams['lst_files'] = 'NoSuchFile.csv'
+        with pytest.raises(FileNotFoundError):
+            tbl.df
+        assert not tbl.IsLoaded
+
+    def test_IsLazy_tbls(self, files, tbls_lazy):
+        """
+        tbls.IsLazy makes Tables with import params set as attributes lazy
+        10/17/26
+        """
+        d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+        tbls_lazy.CSVFile = Table('CSVFile', dImportParams=d)
+        tbls_lazy.Derived = Table('Derived')
+        assert tbls_lazy.CSVFile.IsLazy and not tbls_lazy.Derived.IsLazy
+        assert tbls_lazy.CSVFile.df.shape == (6, 4)
+        assert not ProjectTables(files).IsLazy
+
+    def test_LoadTbls(self, tbls_lazy):
+        """
+        ProjectTables helpers to list and load lazy Tables
+        10/17/26
+        """
+        assert list(tbls_lazy.GetTbls()) == ['Example2', 'Example1']
+        assert tbls_lazy.LoadedTblNames() == []
+        tbls_lazy.Example1.df
+        assert tbls_lazy.LoadedTblNames() == ['Example1']
+        tbls_lazy.LoadTbls(['Example2'])
+        assert tbls_lazy.LoadedTblNames() == ['Example2', 'Example1']
+        assert tbls_lazy.Example2._df.shape == (6, 3)
+
+"""
+================================================================================
+Memory budget -- spill least-recently-used Tables' data to disk
+10/17/26
+================================================================================
+"""
+@pytest.fixture
+def tbls_budget(files, tmp_path):
+    """
+    ProjectTables with memory budget, spill folder in tmp_path and three
+    in-memory Tables (.df; Raw also has .lst_dfs)
+    10/17/26
+    """
+    files.path_cache = str(tmp_path) + os.sep
+    tbls_budget = ProjectTables(files, mem_budget_mb=1)
+
+    # Set data with budget off (tests enforce it themselves)
+    tbls_budget.mem_budget_mb = None
+    for name in ['A', 'B', 'Raw']:
+        setattr(tbls_budget, name, Table(name))
+        getattr(tbls_budget, name).df = pd.DataFrame({'x':np.arange(50_000.),
+            'label':[f'{name}{i % 10}' for i in range(50_000)]})
+    tbls_budget.Raw.lst_dfs = [pd.DataFrame([['flag', None], [1, 'a']])]
+    tbls_budget.mem_budget_mb = 1
+    return tbls_budget
+
+class TestMemoryBudget:
+    def test_Spill(self, tbls_budget):
+        """
+        Spill .df/.lst_dfs to cache; reload both on access of either
+        10/17/26
+        """
+        tbl = tbls_budget.Raw
+        df, lst_dfs = tbl.df, tbl.lst_dfs
+        cache = tbls_budget.SetSpillCache()
+        tbl.Spill(cache)
+        assert tbl.MemoryBytes() == tbl._df.memory_usage(deep=True).sum()
+        assert tbl._df.empty
+        assert cache.IsEntry(tbl.spill_key)
+
+        key = tbl.spill_key
+        pd.testing.assert_frame_equal(tbl.lst_dfs[0], lst_dfs[0])
+        pd.testing.assert_frame_equal(tbl._df, df)
+        assert tbl.spill_key is None
+        assert not cache.IsEntry(key)
+
+    def test_MemoryBytes(self, tbls_budget):
+        """
+        Deep memory of .df plus .lst_dfs
+        10/17/26
+        """
+        tbl = tbls_budget.Raw
+        n_df = tbl.df.memory_usage(deep=True).sum()
+        assert tbl.MemoryBytes() == n_df + tbl.lst_dfs[0].memory_usage(deep=True).sum()
+        assert tbls_budget.A.MemoryBytes() == tbls_budget.A.df.memory_usage(deep=True).sum()
+
+        # In-place column replacement (via .df getter) is not memoized stale
+        tbl = tbls_budget.A
+        n_bytes = tbl.MemoryBytes()
+        tbl.df['x'] = tbl.df['x'].astype(str)
+        assert tbl.MemoryBytes() == tbl._df.memory_usage(deep=True).sum() > n_bytes
+
+    def test_EnforceMemBudget(self, tbls_budget):
+        """
+        Spill least-recently-accessed Tables until within budget
+        10/17/26
+        """
+        n_bytes = tbls_budget.A.MemoryBytes()
+        tbls_budget.mem_budget_mb = 1.5 * n_bytes / 1024**2
+        df_b = tbls_budget.B.df.copy()
+        tbls_budget.Raw.df
+        tbls_budget.A.df
+
+        # B is least recently used; Raw is next but excluded
+        tbls_budget.EnforceMemBudget(lst_exclude=['Raw'])
+        assert tbls_budget.B.spill_key is not None
+        assert tbls_budget.A.spill_key is not None
+        assert tbls_budget.Raw.spill_key is None
+
+        # Transparent reload
+        pd.testing.assert_frame_equal(tbls_budget.B.df, df_b)
+        tbls_budget.mem_budget_mb = None
+        tbls_budget.EnforceMemBudget()
+        assert tbls_budget.A.spill_key is not None
+
+    def test_EnforceMemBudget_Table(self, files, tbls_budget):
+        """
+        .df sets, spill reloads and lazy loads enforce budget (keeping the
+        Table just set/accessed)
+        10/17/26
+        """
+        tbls_budget.mem_budget_mb = 1.5 * tbls_budget.A.MemoryBytes() / 1024**2
+        tbls_budget.A.df = tbls_budget.A.df.copy()
+        assert tbls_budget.B.spill_key is not None
+        assert tbls_budget.Raw.spill_key is not None
+        assert tbls_budget.A.spill_key is None
+
+        tbls_budget.B.df
+        assert tbls_budget.A.spill_key is not None
+        assert tbls_budget.B.spill_key is None
+
+        # Lazy load (zero budget)
+        tbls_budget.mem_budget_mb = 0
+        d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+        tbls_budget.C = Table('CSVFile', dImportParams=d, IsLazy=True)
+        assert tbls_budget.C.df.shape == (6, 4)
+        assert tbls_budget.B.spill_key is not None
+        assert tbls_budget.C.spill_key is None
+
+    def test_ClearStaleSpills(self, tbls_budget):
+        """
+        New ProjectTables with memory budget deletes spill entries not held
+        by a spilled Table
+        10/17/26
+        """
+        cache = tbls_budget.SetSpillCache()
+        tbls_budget.A.Spill(cache)
+        cache.WriteDfs('spill_stale', [pd.DataFrame({'a':[1]})])
+        ProjectTables(tbls_budget.files, mem_budget_mb=1)
+        assert cache.ListKeys('spill_') == [tbls_budget.A.spill_key]
+
+    def test_LoadTbls_budget(self, tbls_lazy, tmp_path):
+        """
+        Lazy loads spill earlier Tables when over budget (zero budget)
+        10/17/26
+        """
+        tbls_lazy.files.path_cache = str(tmp_path) + os.sep
+        tbls_lazy.mem_budget_mb = 0
+        tbls_lazy.LoadTbls()
+        assert all(not tbl.spill_key is None for tbl in tbls_lazy.GetTbls().values())
+        assert tbls_lazy.Example2.df.shape == (6, 3)
+        assert tbls_lazy.Example2.idx == ['date2', 'col_2a']
+
+"""
+================================================================================
+Snapshot -- save/restore all Tables' df's and metadata
+10/17/26
+================================================================================
+"""
+class TestSnapshot:
+    def test_SaveSnapshot(self, files, tbls_lazy, tmp_path):
+        """
+        Restore lazy Tables from snapshot with same df, idx, params and hash
+        10/17/26
+        """
+        path = str(tmp_path) + os.sep
+        tbls_lazy.Raw = Table('Raw', dParseParams={'is_unstructured':True, 'import_dtype':str})
+        tbls_lazy.Raw.df = pd.DataFrame([[np.nan, 'flag', 1], ['Stuff', 2.5, None]])
+        tbls_lazy.SaveSnapshot(path)
+        assert tbls_lazy.LoadedTblNames() == ['Example2', 'Example1', 'Raw']
+
+        tbls2 = ProjectTables(files, UseColInfo=True)
+        tbls2.RestoreSnapshot(path)
+        assert list(tbls2.GetTbls()) == ['Example2', 'Example1', 'Raw']
+        assert tbls2.LoadedTblNames() == []
+        for name, tbl in tbls_lazy.GetTbls().items():
+            tbl2 = getattr(tbls2, name)
+            assert tbl2.name == tbl.name
+            assert tbl2.idx == tbl.idx
+            assert tbl2.dParseParams == tbl.dParseParams
+            pd.testing.assert_frame_equal(tbl2.df, tbl.df)
+            assert HashDf(tbl2.df) == tbl2.snapshot_hash
+        assert tbls2.Example2.pf_snapshot.endswith('.arrow')
+        pd.testing.assert_frame_equal(tbls2.Example2.dfColInfo,
+            tbls2.col_info.GetTblColInfo('ExampleTbl2'))
+
+    def test_RestoreSnapshot_errors(self, files, tbls_lazy, tmp_path):
+        """
+        Missing or incomplete snapshot raises
+        10/17/26
+        """
+        path = str(tmp_path) + os.sep
+        with pytest.raises(FileNotFoundError):
+            tbls_lazy.RestoreSnapshot(path)
+
+        tbls_lazy.SaveSnapshot(path)
+        dSnapshot = pd.read_pickle(path + 'tbls_meta.pkl')
+        pd.to_pickle(dict(dSnapshot, snapshot_id='x'), path + 'tbls_meta.pkl')
+        with pytest.raises(ValueError, match='incomplete'):
+            ProjectTables(files).RestoreSnapshot(path)
+
+    def test_ReadSnapshotDf(self, files, tbls_lazy, tmp_path):
+        """
+        Snapshot file modified after save raises on first access
+        10/17/26
+        """
+        path = str(tmp_path) + os.sep
+        tbls_lazy.SaveSnapshot(path)
+        tbls2 = ProjectTables(files, UseColInfo=True)
+        tbls2.RestoreSnapshot(path)
+        df = tbls2.Example2.ReadSnapshotDf()
+        df.loc[0, 'col_2c'] = -1
+        df.to_feather(tbls2.Example2.pf_snapshot)
+        with pytest.raises(ValueError, match='saved hash'):
+            tbls2.Example2.df
+        assert not tbls2.Example2.IsLoaded
+
+"""
+================================================================================
+BuildTblsProcedure -- dependency-aware threaded Table builds
+10/17/26
+================================================================================
+"""
+def SleepBuild(name, seconds, lst_log):
+    """
+    Return build_fn that sleeps (releases GIL like I/O) and logs name
+    """
+    def build_fn(tbls):
+        time.sleep(seconds)
+        lst_log.append(name)
+    return build_fn
+
+class TestBuildTbls:
+    def test_SetTblBuildOrder(self, tbls):
+        """
+        Topological build order; undeclared upstream and cycles raise
+        10/17/26
+        """
+        tbls.AddTblBuild('Model', ['ModelRaw', 'Prices'])
+        tbls.AddTblBuild('ModelRaw')
+        tbls.AddTblBuild('Prices', ['ModelRaw'])
+        tbls.SetTblBuildOrder()
+        assert tbls.lst_build_order == ['ModelRaw', 'Prices', 'Model']
+
+        tbls.AddTblBuild('Report', ['Summary'])
+        with pytest.raises(ValueError, match='not declared'):
+            tbls.SetTblBuildOrder()
+        tbls.AddTblBuild('Summary', ['Report'])
+        with pytest.raises(ValueError, match='cycle'):
+            tbls.SetTblBuildOrder()
+
+    def test_BuildTblsProcedure(self, tbls):
+        """
+        Independent builds run concurrently; dependencies respected;
+        critical path is longest chain
+        10/17/26
+        """
+        lst_log = []
+        tbls.AddTblBuild('A', build_fn=SleepBuild('A', 0.3, lst_log))
+        tbls.AddTblBuild('B', build_fn=SleepBuild('B', 0.1, lst_log))
+        tbls.AddTblBuild('C', ['A', 'B'], build_fn=SleepBuild('C', 0.1, lst_log))
+        tbls.AddTblBuild('D', ['B'], build_fn=SleepBuild('D', 0.1, lst_log))
+        tbls.BuildTblsProcedure(n_workers=4)
+
+        assert lst_log[-1] == 'C'
+        df = tbls.dfBuildTimes
+        assert df.loc['C', 'start'] >= max(df.loc['A', 'end'], df.loc['B', 'end'])
+        assert df.loc['D', 'start'] >= df.loc['B', 'end']
+        assert df['end'].max() < df['duration'].sum()
+        assert tbls.lst_critical_path == ['A', 'C']
+        assert sorted(df.index[df['IsCritical']]) == ['A', 'C']
+
+    def test_BuildTblsProcedure_tables(self, tbls_lazy):
+        """
+        Default build is Table's LoadTblProcedure; build_fn derives a Table
+        10/17/26
+        """
+        def BuildModel(tbls):
+            tbls.Model = Table('Model')
+            tbls.Model.df = tbls.Example2.df.groupby('date2')['col_2c'].sum().reset_index()
+
+        tbls_lazy.AddTblBuild('Example1')
+        tbls_lazy.AddTblBuild('Example2')
+        tbls_lazy.AddTblBuild('Model', ['Example2'], BuildModel)
+        tbls_lazy.BuildTblsProcedure(n_workers=2)
+        assert tbls_lazy.LoadedTblNames() == ['Example2', 'Example1', 'Model']
+        assert tbls_lazy.Model.df['col_2c'].sum() == 135
+
+    def test_BuildTblsProcedure_shared_lazy(self, tbls_lazy):
+        """
+        Concurrent builds reading the same lazy Table (not in the build graph)
+        wait for its single load instead of reading its empty .df
+        10/17/26
+        """
+        tbl = tbls_lazy.Example2
+        ImportToTblDf = tbl.ImportToTblDf
+        def SlowImport(*args, **kwargs):
+            time.sleep(0.2)
+            return ImportToTblDf(*args, **kwargs)
+        tbl.ImportToTblDf = SlowImport
+
+        dRows = {}
+        def CountRows(name):
+            def build_fn(tbls): dRows[name] = len(tbls.Example2.df)
+            return build_fn
+        tbls_lazy.AddTblBuild('A', build_fn=CountRows('A'))
+        tbls_lazy.AddTblBuild('B', build_fn=CountRows('B'))
+        tbls_lazy.BuildTblsProcedure(n_workers=2)
+        assert dRows == {'A':6, 'B':6}
+
+    def test_RunTblBuilds_error(self, tbls):
+        """
+        Failed build raises RuntimeError; its downstream builds don't run
+        10/17/26
+        """
+        lst_log = []
+        def Fail(tbls): raise KeyError('bad')
+        tbls.AddTblBuild('A', build_fn=Fail)
+        tbls.AddTblBuild('B', ['A'], build_fn=SleepBuild('B', 0., lst_log))
+        tbls.AddTblBuild('C', build_fn=SleepBuild('C', 0., lst_log))
+        with pytest.raises(RuntimeError, match='1 of 3'):
+            tbls.BuildTblsProcedure(n_workers=1)
+        assert list(tbls.dBuildErrors) == ['A']
+        assert not 'B' in lst_log
+
 """
 ================================================================================
 ImportToTblDf Procedure
@@ -152,6 +558,41 @@ def test_ImportToTblDf5(tbls_ExcelFile):
     # Import should result in .df with 6 rows (no parsing needed)
     check_ExcelFile(tbls_ExcelFile)
 
+def test_ImportToTblDf6(tbls_ExcelFile):
+    """
+    .df from multiple Excel files read in parallel with n_workers processes
+    (order and filename/sheet columns match serial import)
+    10/17/26
+    """
+    f_lst = ['Example2a.xlsx', 'Example2b.xlsx']
+    tbls_ExcelFile.dImportParams.update({'lst_files':f_lst, 'sht_type':'all'})
+    tbls_ExcelFile.dParseParams.update({'add_filename_col':True})
+    tbls_ExcelFile.ImportToTblDf()
+    df_serial = tbls_ExcelFile.df
+
+    tbls_ExcelFile.dImportParams['n_workers'] = 2
+    tbls_ExcelFile.ImportToTblDf()
+    check_ExcelFile(tbls_ExcelFile)
+    pd.testing.assert_frame_equal(tbls_ExcelFile.df, df_serial)
+    assert tbls_ExcelFile.df['filename'].tolist() == 2 * ['Example2a.xlsx'] + \
+        4 * ['Example2b.xlsx']
+
+def test_ImportToTblDf7(tbls_ExcelFile, tmp_path, monkeypatch):
+    """
+    Import cached Excel sheets on re-import of unchanged file (no re-read)
+    10/17/26
+    """
+    tbls_ExcelFile.dImportParams.update({'lst_files':'Example2_multisheet.xlsx',
+        'sht_type':'all', 'path_cache':str(tmp_path) + os.sep})
+    tbls_ExcelFile.ImportToTblDf()
+    df_cold = tbls_ExcelFile.df
+    assert len(tbls_ExcelFile.cache.ListKeys()) == 1
+
+    # Warm re-import reads from cache without opening workbook
+    monkeypatch.setattr(Table, 'SetLstSheets', lambda self: pytest.fail('re-read'))
+    tbls_ExcelFile.ImportToTblDf()
+    pd.testing.assert_frame_equal(tbls_ExcelFile.df, df_cold)
+
 def check_ExcelFile(tbls_ExcelFile):
     """
     Helper function to check ExcelFile import
@@ -228,6 +669,166 @@ def test_ImportToTblDf_CSV4(tbls_CSVFile):
     assert tbls_CSVFile.lst_dfs[0].iloc[2, 1] == 'Stuff'
 
 
+"""
+importing feather and parquet files
+"""
+@pytest.mark.parametrize('ftype', ['feather', 'parquet'])
+def test_ImportToTblDf_Columnar1(files, ftype):
+    """
+    Import feather/parquet rows/cols table to .df with filename column
+    10/17/26
+    """
+    d = {'ftype':ftype, 'import_path':files.path_data, 'lst_files':f'Example2.{ftype}'}
+    tbl = Table('ColumnarFile', dImportParams=d, dParseParams={'add_filename_col':True})
+    tbl.ImportToTblDf()
+
+    # Same rows/cols as Excel import plus filename column
+    df_xl = pd.read_excel(files.path_data + 'Example2.xlsx', sheet_name='data')
+    pd.testing.assert_frame_equal(tbl.df.drop(columns='filename'), df_xl)
+    assert (tbl.df['filename'] == f'Example2.{ftype}').all()
+
+@pytest.mark.parametrize('ftype', ['feather', 'parquet'])
+def test_ImportToTblDf_Columnar2(files, ftype):
+    """
+    Import feather/parquet unstructured table to .lst_dfs
+    10/17/26
+    """
+    d = {'ftype':ftype, 'import_path':files.path_data, 'lst_files':f'tbl1_raw.{ftype}'}
+    tbl = Table('ColumnarFile', dImportParams=d, dParseParams={'is_unstructured':True})
+    tbl.ImportToTblDf()
+
+    # Import should leave unparsed df with positional col names in lst_dfs
+    assert tbl.df.empty
+    assert list(tbl.lst_dfs[0].columns) == list(range(5))
+    assert tbl.lst_dfs[0].iloc[2, 1] == 'Stuff'
+
+@pytest.mark.parametrize('ftype', ['feather', 'parquet'])
+def test_ImportToTblDf_ReadColumnarFile(files, ftype):
+    """
+    Import current feather or parquet file into a temporary df and append
+    to lst_dfs (with usecols projection and pyarrow dtype_backend)
+    10/17/26
+    """
+    cols = ['col_dummy', 'col_2c_import_name']
+    d = {'ftype':ftype, 'usecols':cols, 'dtype_backend':'pyarrow'}
+    tbl = Table('ColumnarFile', dImportParams=d)
+    tbl.SetFileIngestParams()
+    tbl.lst_dfs = []
+    tbl.pf = files.path_data + f'Example2.{ftype}'
+    tbl.ReadColumnarFile()
+
+    df = tbl.lst_dfs[0]
+    assert list(df.columns) == cols
+    assert isinstance(df['col_2c_import_name'].dtype, pd.ArrowDtype)
+    assert df['col_2c_import_name'].sum() == 135
+
+def test_ImportToTblDf_CSV5(files, tbls_CSVFile):
+    """
+    Import CSV structured table in chunks with ColumnInfo cleanup per chunk
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv'}
+
+    # Reference: full read followed by cleanup
+    tbl = Table('ExampleTbl2', dImportParams=d, col_info=cinfo)
+    tbl.ImportToTblDf()
+    cinfo.CleanupImportedDataProcedure(tbl)
+
+    # Streamed read is already cleaned up; repeat cleanup leaves it unchanged
+    tbl_chunks = Table('ExampleTbl2', dImportParams=dict(d, chunksize=4), col_info=cinfo)
+    tbl_chunks.ImportToTblDf()
+    assert tbl_chunks.df.columns.tolist() == ['date2', 'col_2a', 'col_2c']
+    pd.testing.assert_frame_equal(tbl_chunks.df, tbl.df)
+    cinfo.CleanupImportedDataProcedure(tbl_chunks)
+    pd.testing.assert_frame_equal(tbl_chunks.df, tbl.df)
+
+def test_ImportToTblDf_ReadCSVFileChunks(files, tbls_CSVFile):
+    """
+    Stream current structured CSV in dImportParams['chunksize'] row chunks
+    and set .df_temp (no col_info so chunks are not cleaned up)
+    10/17/26
+    """
+    tbls_CSVFile.dImportParams['chunksize'] = 4
+    tbls_CSVFile.dParseParams['add_filename_col'] = True
+    tbls_CSVFile.SetFileIngestParams()
+    tbls_CSVFile.pf = files.path_data + 'Example2.csv'
+    tbls_CSVFile.ReadCSVFileChunks()
+    assert tbls_CSVFile.df_temp.shape == (6, 5)
+    assert list(tbls_CSVFile.df_temp.index) == list(range(6))
+    assert (tbls_CSVFile.df_temp['filename'] == 'Example2.csv').all()
+
+def test_ImportToTblDf_CleanupChunk(files):
+    """
+    Return df_chunk after ColumnInfo cleanup (if Table has col_info)
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+    tbl = Table('ExampleTbl2', col_info=cinfo)
+    df_chunk = pd.read_csv(files.path_data + 'Example2.csv', nrows=2)
+    df = tbl.CleanupChunk(df_chunk)
+    assert df.columns.tolist() == ['date2', 'col_2a', 'col_2c']
+    assert df['col_2c'].dtype == 'int64'
+    assert tbl.df.empty
+
+    # Table without col_info returns chunk unchanged
+    assert Table('ExampleTbl2').CleanupChunk(df_chunk) is df_chunk
+
+def test_ImportToTblDf_ConcatDfs(files, tmp_path):
+    """
+    'category' data_type set per chunk stays category after chunk and file
+    concats, with categories unioned across chunks/files
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+    cinfo.df.loc[cinfo.df['cols'] == 'col_2a', 'data_type'] = 'category'
+    df = pd.read_csv(files.path_data + 'Example2.csv')
+    df = pd.concat([df] * 17, ignore_index=True).iloc[:100]
+    df['col_2a_import_name'] = [f'retailer_{i // 25}' for i in range(100)]
+    df.iloc[:50].to_csv(tmp_path / 'a.csv', index=False)
+    df.iloc[50:].to_csv(tmp_path / 'b.csv', index=False)
+    df.to_csv(tmp_path / 'ab.csv', index=False)
+
+    lst_cats = ['retailer_0', 'retailer_1', 'retailer_2', 'retailer_3']
+    d = {'ftype':'csv', 'import_path':str(tmp_path) + os.sep}
+
+    # Chunked read: each 30-row chunk typed separately
+    tbl = Table('ExampleTbl2', dImportParams=dict(d, lst_files='ab.csv', chunksize=30),
+        col_info=cinfo)
+    tbl.ImportToTblDf()
+    assert isinstance(tbl.df['col_2a'].dtype, pd.CategoricalDtype)
+    assert tbl.df['col_2a'].cat.categories.tolist() == lst_cats
+    assert tbl.df['col_2a'].astype(str).tolist() == df['col_2a_import_name'].tolist()
+
+    # Two files (each concatenated from chunks) concatenated
+    tbl = Table('ExampleTbl2', dImportParams=dict(d, lst_files=['a.csv', 'b.csv'],
+        chunksize=30), col_info=cinfo)
+    tbl.ImportToTblDf()
+    assert tbl.df['col_2a'].cat.categories.tolist() == lst_cats
+
+@pytest.mark.parametrize('ftype, f', [('csv', 'Example2.csv'), ('excel', 'Example2.xlsx')])
+def test_ImportToTblDf_Pushdown(files, ftype, f):
+    """
+    Import with usecols/dtype pushed down from col_info (same result after cleanup)
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+    d = {'ftype':ftype, 'sht':'data', 'import_path':files.path_data, 'lst_files':f}
+    tbl = Table('ExampleTbl2', dImportParams=d, col_info=cinfo)
+    tbl.ImportToTblDf()
+    cinfo.CleanupImportedDataProcedure(tbl)
+
+    tbl_push = Table('ExampleTbl2', dImportParams=dict(d, pushdown_col_info=True),
+        col_info=cinfo)
+    tbl_push.ImportToTblDf()
+
+    # Non-keep col_dummy is never read; int64 col_2c parsed at read
+    lst = ['date2_import_name', 'col_2a_import_name', 'col_2c_import_name']
+    assert tbl_push.df.columns.tolist() == lst
+    assert tbl_push.df['col_2c_import_name'].dtype == 'int64'
+    cinfo.CleanupImportedDataProcedure(tbl_push)
+    pd.testing.assert_frame_equal(tbl_push.df, tbl.df)
+
 def check_CSVFile(tbls_CSVFile):
     """
     Helper function to check CSVFile import
@@ -278,6 +879,159 @@ def test_ImportToTblDf_SetLstFiles():
     lst_files = tbl.SetLstFiles(None)
     assert lst_files == ['TestPath/Example5a.xlsx', 'TestPath/Example5b.xlsx']
 
+def test_ImportToTblDf_ReadFile(files):
+    """
+    Read current file, self.pf, and append its df(s) to lst_dfs
+    10/17/26
+    """
+    tbl = Table('CSVFile', dImportParams={'ftype':'csv'})
+    tbl.SetFileIngestParams()
+    tbl.lst_dfs = []
+    tbl.pf = files.path_data + 'Example2.csv'
+    tbl.ReadFile()
+    assert len(tbl.lst_dfs) == 1
+    assert len(tbl.lst_dfs[0]) == 6
+
+def test_ImportToTblDf_ReadFilesParallel(files):
+    """
+    Read files in a process pool with .n_workers processes
+    10/17/26
+    """
+    d = {'ftype':'csv', 'n_workers':2}
+    tbl = Table('CSVFile', dImportParams=d)
+    tbl.SetFileIngestParams()
+    tbl.lst_dfs = []
+    tbl.ReadFilesParallel([files.path_data + f for f in ['Example2a.csv', 'Example2b.csv']])
+    assert [len(df) for df in tbl.lst_dfs] == [2, 4]
+
+def test_ImportToTblDf_SetCacheKey(files, tmp_path):
+    """
+    Set import cache key for self.pf from its fingerprint and import/parse params
+    10/17/26
+    """
+    pf = str(tmp_path) + os.sep + 'Example2.csv'
+    with open(files.path_data + 'Example2.csv') as f: txt = f.read()
+    with open(pf, 'w') as f: f.write(txt)
+
+    d = {'ftype':'csv', 'path_cache':str(tmp_path) + os.sep, 'n_workers':2}
+    tbl = Table('CSVFile', dImportParams=d)
+    tbl.pf = pf
+    key = tbl.SetCacheKey()
+
+    # Key ignores n_workers but changes with parse params and file contents
+    tbl.dImportParams['n_workers'] = 1
+    assert tbl.SetCacheKey() == key
+    tbl.dParseParams['n_skip_rows'] = 2
+    key2 = tbl.SetCacheKey()
+    assert key2 != key
+    with open(pf, 'a') as f: f.write('\n')
+    assert tbl.SetCacheKey() != key2
+
+def test_ImportToTblDfIncremental(files, tmp_path):
+    """
+    Incremental sweep-folder import: only new/changed files are read; rows of
+    changed/deleted files are replaced/dropped; manifest persists between runs
+    10/17/26
+    """
+    path = str(tmp_path) + os.sep
+    for f in ['Example2a.csv', 'Example2b.csv']:
+        with open(files.path_data + f) as fin, open(path + f, 'w') as fout: fout.write(fin.read())
+    d = {'ftype':'csv', 'import_path':path, 'path_manifest':path + 'manifest' + os.sep}
+    d2 = {'add_filename_col':True}
+    lst_files = ['Example2a.csv', 'Example2b.csv']
+
+    tbl = Table('CSVFile', dImportParams=d, dParseParams=d2)
+    tbl.ImportToTblDfIncremental(lst_files)
+    assert len(tbl.df) == 6 and len(tbl.lst_files_read) == 2
+    assert sorted(tbl.dManifest) == lst_files
+
+    # New Table (next run) resumes from store: unchanged and touched files not read
+    os.utime(path + 'Example2a.csv', ns=(0, 0))
+    tbl = Table('CSVFile', dImportParams=d, dParseParams=d2)
+    tbl.ImportToTblDfIncremental(lst_files)
+    assert len(tbl.df) == 6 and tbl.lst_files_read == []
+
+    # Changed file's rows are replaced and deleted file's rows are dropped
+    with open(path + 'Example2b.csv', 'a') as f: f.write('3/1/2025,z,3,30\n')
+    tbl.ImportToTblDfIncremental(['Example2b.csv'])
+    assert tbl.lst_files_read == [path + 'Example2b.csv']
+    assert list(tbl.df['filename'].unique()) == ['Example2b.csv'] and len(tbl.df) == 5
+
+    # Unstructured or no filename provenance raises
+    with pytest.raises(ValueError, match='add_filename_col'):
+        Table('CSVFile', dImportParams=d).ImportToTblDfIncremental(lst_files)
+
+def test_ImportToTblDf_SetCacheKey2(files, tmp_path):
+    """
+    With chunksize and col_info, cached df's are cleaned up chunks so the key
+    changes with .dfColInfo (warm cache does not return stale data types)
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+    d = {'ftype':'csv', 'import_path':files.path_data, 'lst_files':'Example2.csv',
+        'chunksize':4, 'path_cache':str(tmp_path) + os.sep}
+    tbl = Table('ExampleTbl2', dImportParams=d, col_info=cinfo)
+    tbl.ImportToTblDf()
+    assert tbl.df['col_2c'].dtype == 'int64'
+
+    tbl.dfColInfo.loc[tbl.dfColInfo['cols'] == 'col_2c', 'data_type'] = 'float64'
+    tbl.col_plan = None
+    tbl.ImportToTblDf()
+    assert tbl.df['col_2c'].dtype == 'float64'
+
+def test_ImportToTblDf_SetReadColInfo(files):
+    """
+    If dImportParams['pushdown_col_info'], set .dReadKwargs usecols and
+    dtype args from .dfColInfo
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+
+    # Default is no pushdown
+    tbl = Table('ExampleTbl2', dImportParams={'ftype':'csv'}, col_info=cinfo)
+    tbl.SetReadColInfo()
+    assert tbl.dReadKwargs == {}
+
+    # usecols callable matches keep cols' import names; only numeric dtypes
+    tbl.dImportParams['pushdown_col_info'] = True
+    tbl.SetReadColInfo()
+    usecols = tbl.dReadKwargs['usecols']
+    assert usecols(' col_2a_import_name') and usecols('date2_import_name')
+    assert not usecols('col_dummy') and not usecols('col_2b')
+    assert tbl.dReadKwargs['dtype'] == {'col_2c_import_name':'int64'}
+
+def test_ImportToTblDf_FileReadKwargs(files, tmp_path):
+    """
+    Pushed-down dtype applies to header names with whitespace (keyed on the
+    file's header names)
+    10/17/26
+    """
+    cinfo = ColumnInfo(files, IsInit=True, IsPrint=False)
+    cinfo.df.loc[cinfo.df['cols'] == 'col_2c', 'data_type'] = 'float64'
+    df = pd.read_csv(files.path_data + 'Example2.csv')
+    df.columns = [' ' + col if col == 'col_2c_import_name' else col for col in df.columns]
+    df.to_csv(tmp_path / 'a.csv', index=False)
+    df.to_excel(tmp_path / 'a.xlsx', sheet_name='data', index=False)
+
+    d = {'import_path':str(tmp_path) + os.sep, 'sht':'data', 'pushdown_col_info':True}
+    for d_tbl in [dict(d, ftype='csv', lst_files='a.csv'),
+            dict(d, ftype='csv', lst_files='a.csv', chunksize=4),
+            dict(d, ftype='excel', lst_files='a.xlsx')]:
+        tbl = Table('ExampleTbl2', dImportParams=d_tbl, col_info=cinfo)
+        tbl.ImportToTblDf()
+        col = [col for col in tbl.df.columns if 'col_2c' in col][0]
+        assert tbl.df[col].dtype == 'float64'
+
+def test_IsNumericDataType():
+    """
+    Return True if col_info data_type string is a numpy int or float dtype
+    10/17/26
+    """
+    from projtables import IsNumericDataType
+    assert IsNumericDataType('float64') and IsNumericDataType('int64')
+    for data_type in ['str', 'dt.date', 'datetime', 'bool', np.nan]:
+        assert not IsNumericDataType(data_type)
+
 def test_ImportToTblDf_SetFileIngestParams():
     """
     Set temporary Table attributes for the current file
@@ -290,6 +1044,10 @@ def test_ImportToTblDf_SetFileIngestParams():
     assert tbl.n_skip_rows == 0
     assert tbl.parse_type == 'none'
     assert tbl.sht_type == 'single'
+    assert tbl.n_workers == 1
+    assert tbl.cache is None
+    assert tbl.excel_reader == 'pandas'
+    assert tbl.n_max_blank_rows is None
 
     # Specified with sht_type='all'
     d1 = {'ftype':'excel', 'sht_type':'all'}
@@ -406,6 +1164,84 @@ def test_ImportToTblDf_Excel_ReadExcelSht3(files):
     tbl.ReadExcelSht()
     assert tbl.df_temp.iloc[2, 1] == 'Stuff'
 
+@pytest.mark.parametrize('import_dtype', [str, None])
+def test_ImportToTblDf_Excel_ReadExcelShtOpenpyxl(files, import_dtype):
+    """
+    Read unstructured sheet by streaming rows from .xl's openpyxl workbook
+    (same df as pd.read_excel for test workbook)
+    10/17/26
+    """
+    dImportParams={'ftype':'excel', 'sht':'raw_table'}
+    dParseParams={'is_unstructured':True, 'import_dtype':import_dtype}
+    tbl = Table('ExcelFile', dImportParams=dImportParams, dParseParams=dParseParams)
+    tbl.pf = files.path_data + 'tbl1_raw.xlsx'
+    tbl.SetFileIngestParams()
+    tbl.sht = 'raw_table'
+    tbl.ReadExcelSht()
+    df_pandas = tbl.df_temp
+
+    tbl.dImportParams['excel_reader'] = 'openpyxl'
+    tbl.SetFileIngestParams()
+    tbl.ReadExcelSht()
+    pd.testing.assert_frame_equal(tbl.df_temp, df_pandas)
+
+    # Sheet by index
+    tbl.sht = 0
+    tbl.ReadExcelShtOpenpyxl()
+    pd.testing.assert_frame_equal(tbl.df_temp, df_pandas)
+    tbl.CloseExcelFile()
+
+def test_ReadWorksheetRaw(tmp_path):
+    """
+    Return raw (header=None) df of openpyxl worksheet streamed by rows
+    10/17/26
+    """
+    openpyxl = pytest.importorskip('openpyxl')
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws['B2'], ws['C2'], ws['B4'], ws['D4'], ws['B5'] = 'a', 1, 2.0, '', '007'
+    ws['B9'] = 2.5
+    ws['E20'].font = openpyxl.styles.Font(bold=True)
+    wb.save(tmp_path / 'raw.xlsx')
+
+    ws = openpyxl.load_workbook(tmp_path / 'raw.xlsx', read_only=True, data_only=True).active
+    df = ReadWorksheetRaw(ws, IsStr=True)
+
+    # Leading blank row/col kept; trailing blank (formatted) rows/cols dropped
+    assert df.shape == (9, 3)
+    assert df.iloc[1].tolist() == [None, 'a', '1']
+    assert df.iloc[3].tolist() == [None, '2', None]
+    assert df.iloc[4, 1] == '007'
+    assert df.iloc[8, 1] == '2.5'
+
+    # Stop after 2 consecutive blank rows (rows 6-8 blank)
+    df = ReadWorksheetRaw(ws, IsStr=True, n_max_blank_rows=2)
+    assert df.shape == (5, 3)
+
+    # Without str conversion, blanks are NaN and numeric cols are inferred
+    df = ReadWorksheetRaw(ws)
+    assert df[0].isna().all()
+    assert df.iloc[3, 1] == 2
+
+def test_ReadWorksheetRaw_LeadingBlankRows(tmp_path):
+    """
+    Blank rows before first data row don't count toward n_max_blank_rows;
+    formatted cell at last sheet col doesn't widen the result
+    10/17/26
+    """
+    openpyxl = pytest.importorskip('openpyxl')
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws['A6'], ws['B6'], ws['A7'], ws['A12'] = 'x', 1, 'y', 'z'
+    ws['XFD8'].font = openpyxl.styles.Font(bold=True)
+    wb.save(tmp_path / 'raw.xlsx')
+
+    ws = openpyxl.load_workbook(tmp_path / 'raw.xlsx', read_only=True, data_only=True).active
+    df = ReadWorksheetRaw(ws, IsStr=True, n_max_blank_rows=3)
+    assert df.shape == (7, 2)
+    assert df.iloc[5].tolist() == ['x', '1'] and df.iloc[6, 0] == 'y'
+    assert ReadWorksheetRaw(ws, IsStr=True, n_max_blank_rows=4).shape == (12, 2)
+
 def test_ImportToTblDf_Excel_ReadExcelFileSheets1(files):
     """
     Loop through sheets in lst_sheets and read their data
@@ -453,6 +1289,83 @@ def test_ImportToTblDf_Excel_ReadExcelFileSheets2(files):
     assert len(tbl.lst_dfs) == 1
     assert tbl.lst_dfs[0].shape == (6, 4)
 
+def test_ImportToTblDf_Excel_OpenExcelFile(files):
+    """
+    Open self.pf as pd.ExcelFile handle, .xl (if not already open)
+    10/17/26
+    """
+    tbl = Table('ExcelFile', dImportParams={'ftype':'excel', 'sht_type':'all'})
+    tbl.SetFileIngestParams()
+    tbl.pf = files.path_data + 'Example2_multisheet.xlsx'
+
+    # SetLstSheets opens the handle; reading sheets reuses the same handle
+    tbl.SetLstSheets()
+    xl = tbl.xl
+    assert isinstance(xl, pd.ExcelFile)
+    tbl.lst_dfs = []
+    tbl.ReadExcelFileSheets()
+    assert tbl.xl is xl
+    assert len(tbl.lst_dfs) == 2
+
+def test_ImportToTblDf_Excel_OpenExcelFile2(files):
+    """
+    Failed sheet read closes .xl; a handle on another file is not reused
+    10/17/26
+    """
+    d = {'ftype':'excel', 'import_path':files.path_data, 'sht':'missing'}
+    tbl = Table('ExcelFile', dImportParams=d)
+    with pytest.raises(ValueError):
+        tbl.ImportToTblDf('Example1.xlsx')
+    assert tbl.xl is None
+
+    tbl.dImportParams['sht'] = 0
+    tbl.ImportToTblDf('Example2.xlsx')
+    df_expected = pd.read_excel(files.path_data + 'Example2.xlsx')
+    pd.testing.assert_frame_equal(tbl.df, df_expected)
+
+    # Handle left open on another file is closed and reopened on self.pf
+    tbl.pf = files.path_data + 'Example1.xlsx'
+    tbl.OpenExcelFile()
+    tbl.pf = files.path_data + 'Example2.xlsx'
+    tbl.OpenExcelFile()
+    assert tbl.pf_xl == tbl.pf
+    pd.testing.assert_frame_equal(pd.read_excel(tbl.xl, sheet_name=0), df_expected)
+    tbl.CloseExcelFile()
+
+def test_ImportToTblDf_Excel_CloseExcelFile(files):
+    """
+    Close and reset .xl workbook handle after reading self.pf's sheets
+    10/17/26
+    """
+    tbl = Table('ExcelFile', dImportParams={'ftype':'excel'})
+    tbl.pf = files.path_data + 'Example2.xlsx'
+    tbl.OpenExcelFile()
+    assert tbl.xl is not None
+    tbl.CloseExcelFile()
+    assert tbl.xl is None
+
+def test_ConvertRawDfToStr():
+    """
+    Convert raw (header=None) df to object dtype strings with None for blanks
+    (identical to original cell-by-cell .map conversion)
+    10/17/26
+    """
+    df = pd.DataFrame({0:[1.0, np.nan, 2.5, 1e300, -0.0, np.inf],
+        1:['a', None, 'b', np.nan, 'c', 'd'],
+        2:['Q1', 3.0, 4, np.nan, True, dt.datetime(2025, 1, 1)],
+        3:[1, 2, 3, 4, 5, 6],
+        4:[True, False, True, True, False, True],
+        5:pd.to_datetime(5 * ['2025-04-01'] + [None]),
+        6:6 * [np.nan],
+        7:['5%', 5, np.nan, 5, '5%', 12]})
+    df_expected = df.astype(object).map(lambda x: None if pd.isna(x) \
+        else str(int(x)) if isinstance(x, float) and x.is_integer() else str(x))
+
+    df_str = ConvertRawDfToStr(df)
+    pd.testing.assert_frame_equal(df_str, df_expected)
+    assert df_str.iloc[0].tolist() == ['1', 'a', 'Q1', '1', 'True', '2025-04-01 00:00:00', None, '5%']
+    assert all(type(x) is str for x in df_str[0] if x is not None)
+
 """
 Tests of fixtures and utilities
 """